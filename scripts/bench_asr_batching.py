@@ -0,0 +1,122 @@
+"""
+Benchmark faster-whisper throughput with concurrent speakers, with and without batching.
+
+Each simulated speaker sends an utterance, waits for its transcription and
+sends the next one, all sharing one model as the clients of the server do.
+For each number of speakers, the utterances go through the ASR scheduler
+one at a time (batch size 1) and in batches, and the script reports the
+throughput, the latency, and how it splits between waiting in the queue
+and inference.
+
+Usage:
+    uv run python scripts/bench_asr_batching.py [--model tiny.en] [--speakers 1 2 4 8 16] [--audio speech.wav]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+import numpy as np
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.open_llm_vtuber.asr.asr_scheduler import ASRBatchScheduler  # noqa: E402
+from src.open_llm_vtuber.asr.faster_whisper_asr import VoiceRecognition  # noqa: E402
+from src.open_llm_vtuber.utils.resample import StreamingResampler  # noqa: E402
+from src.open_llm_vtuber.utils.wav_parser import parse_wav  # noqa: E402
+
+
+def load_utterance(path: str | None, seconds: float, sample_rate: int) -> np.ndarray:
+    if path is None:
+        rng = np.random.default_rng(0)
+        t = np.arange(int(seconds * sample_rate)) / sample_rate
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)  # ~4 syllables per second
+        audio = 0.3 * envelope * np.sin(2 * np.pi * 150 * t)
+        return (audio + rng.normal(0, 0.01, len(t))).astype(np.float32)
+    with open(path, "rb") as f:
+        wav = parse_wav(f.read())
+    audio = wav.to_float32().mean(axis=1)
+    resampler = StreamingResampler(wav.sample_rate, sample_rate)
+    if resampler.passthrough:
+        return audio
+    return np.concatenate(
+        [resampler.process(audio), resampler.process(np.zeros(1024, np.float32))]
+    )
+
+
+async def run(
+    engine: VoiceRecognition,
+    scheduler: ASRBatchScheduler,
+    audio: np.ndarray,
+    speakers: int,
+    rounds: int,
+) -> tuple[float, list[float]]:
+    """Return the wall time and the latency of each utterance."""
+    latencies = []
+
+    async def speaker():
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await scheduler.transcribe(audio)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(speaker() for _ in range(speakers)))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default="tiny.en")
+    parser.add_argument("--download-root", default="models/whisper")
+    parser.add_argument("--language", default="en")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--speakers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--audio", help="WAV file of one utterance")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--batch-window-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    engine = VoiceRecognition(
+        model_path=args.model,
+        download_root=args.download_root,
+        language=args.language,
+        device="cpu",
+        compute_type=args.compute_type,
+    )
+    audio = load_utterance(args.audio, args.seconds, engine.SAMPLE_RATE)
+    engine.transcribe_np(audio)  # warm up
+
+    print(
+        f"{'speakers':>8} {'mode':>8} {'utt/s':>7} {'p50 (ms)':>9} {'p95 (ms)':>9} "
+        f"{'wait (ms)':>10} {'infer (ms)':>11} {'batch':>6}"
+    )
+    for speakers in args.speakers:
+        for mode, batch_size in (("serial", 1), ("batched", speakers)):
+            scheduler = ASRBatchScheduler(
+                engine.transcribe_batch,
+                max_batch_size=batch_size,
+                batch_window_ms=args.batch_window_ms,
+                max_queue_depth=max(speakers, 1),
+            )
+            elapsed, latencies = asyncio.run(
+                run(engine, scheduler, audio, speakers, args.rounds)
+            )
+            stats = scheduler.stats()
+            print(
+                f"{speakers:>8} {mode:>8} {len(latencies) / elapsed:>7.2f} "
+                f"{np.percentile(latencies, 50) * 1000:>9.0f} "
+                f"{np.percentile(latencies, 95) * 1000:>9.0f} "
+                f"{stats['mean_wait'] * 1000:>10.0f} "
+                f"{stats['mean_inference_time'] * 1000:>11.0f} "
+                f"{stats['average_batch_size']:>6.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
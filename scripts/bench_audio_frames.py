@@ -0,0 +1,104 @@
+"""
+Benchmark the outbound audio formats: bytes on the wire and serialization time per sentence.
+
+Compares, for sentences of typical lengths:
+- JSON: the whole payload in a text frame, with the WAV file in base64 (the default)
+- binary: a JSON header frame, and the WAV file in a binary frame
+  (clients that negotiated the olv-pcm.v2 sub-protocol)
+
+Serialization covers what the server does for each sentence after encoding
+the audio: base64 and json.dumps for JSON, json.dumps of the header and
+framing for binary.
+
+Usage:
+    uv run python scripts/bench_audio_frames.py [--seconds 1 3 6 12] [--sample-rate 24000]
+"""
+
+import os
+import sys
+import time
+import json
+import argparse
+
+import numpy as np
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.open_llm_vtuber.agent.output_types import DisplayText  # noqa: E402
+from src.open_llm_vtuber.utils.binary_audio import encode_audio_frame  # noqa: E402
+from src.open_llm_vtuber.utils.payload_sender import dump_payload  # noqa: E402
+from src.open_llm_vtuber.utils.stream_audio import (  # noqa: E402
+    encode_audio,
+    prepare_audio_payload,
+)
+from src.open_llm_vtuber.utils.wav_parser import encode_wav, parse_wav  # noqa: E402
+
+
+def speech_like(seconds: float, sample_rate: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)  # ~4 syllables per second
+    return 0.3 * envelope * np.sin(2 * np.pi * 150 * t) + rng.normal(0, 0.01, len(t))
+
+
+def json_frames(payload: dict) -> list:
+    return [dump_payload(payload)]
+
+
+def binary_frames(payload: dict) -> list:
+    """What ClientSender.send_payload sends to a binary audio client."""
+    audio = payload["audio"]
+    sample_rate = parse_wav(audio.wav_bytes).sample_rate
+    header = json.dumps({**payload, "audio": None, "audio_frame": 0})
+    return [header, encode_audio_frame("audio", audio.wav_bytes, sample_rate, 0)]
+
+
+def wire_size(frames: list) -> int:
+    return sum(
+        len(frame.encode("utf-8")) if isinstance(frame, str) else len(frame)
+        for frame in frames
+    )
+
+
+def best_of(func, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1, 3, 6, 12])
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'seconds':>8} {'JSON (KiB)':>11} {'binary (KiB)':>13} "
+        f"{'JSON (ms)':>10} {'binary (ms)':>12} {'speedup':>8}"
+    )
+    for seconds in args.seconds:
+        wav_bytes = encode_wav(speech_like(seconds, args.sample_rate), args.sample_rate)
+        payload = prepare_audio_payload(
+            audio_path=None,
+            encoded_audio=encode_audio(audio_bytes=wav_bytes),
+            display_text=DisplayText(text="A sentence of the reply.", name="Mao"),
+        )
+
+        json_size = wire_size(json_frames(payload))
+        binary_size = wire_size(binary_frames(payload))
+        old = best_of(lambda: json_frames(payload), args.repeats)
+        new = best_of(lambda: binary_frames(payload), args.repeats)
+        print(
+            f"{seconds:>8g} {json_size / 1024:>11.1f} {binary_size / 1024:>13.1f} "
+            f"{old * 1000:>10.3f} {new * 1000:>12.3f} {old / new:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
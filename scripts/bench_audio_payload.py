@@ -0,0 +1,90 @@
+"""
+Benchmark prepare_audio_payload on TTS-like WAV files.
+
+Compares the pydub path (decode with AudioSegment, re-export to WAV,
+per-chunk RMS in Python) with the WAV fast path (header parsed directly,
+file sent as is, one NumPy RMS over all 20 ms chunks) for sentences of
+typical lengths.
+
+Usage:
+    uv run python scripts/bench_audio_payload.py [--seconds 1 3 6 12] [--sample-rate 24000]
+"""
+
+import os
+import sys
+import time
+import base64
+import argparse
+import tempfile
+
+import numpy as np
+from pydub import AudioSegment
+from pydub.utils import make_chunks
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.open_llm_vtuber.utils.stream_audio import prepare_audio_payload  # noqa: E402
+from src.open_llm_vtuber.utils.wav_parser import encode_wav  # noqa: E402
+
+
+def pydub_payload(audio_path: str, chunk_length_ms: int = 20) -> tuple[str, list]:
+    """What prepare_audio_payload did for every file before the fast path."""
+    audio = AudioSegment.from_file(audio_path)
+    audio_bytes = audio.export(format="wav").read()
+    volumes = [chunk.rms for chunk in make_chunks(audio, chunk_length_ms)]
+    max_volume = max(volumes)
+    return (
+        base64.b64encode(audio_bytes).decode("utf-8"),
+        [volume / max_volume for volume in volumes],
+    )
+
+
+def speech_like(seconds: float, sample_rate: int) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t)  # ~4 syllables per second
+    return 0.3 * envelope * np.sin(2 * np.pi * 150 * t) + rng.normal(0, 0.01, len(t))
+
+
+def best_of(func, repeats: int) -> float:
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1, 3, 6, 12])
+    parser.add_argument("--sample-rate", type=int, default=24000)
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'seconds':>8} {'pydub (ms)':>11} {'fast path (ms)':>15} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for seconds in args.seconds:
+            path = os.path.join(tmp_dir, f"sentence_{seconds}s.wav")
+            with open(path, "wb") as f:
+                f.write(
+                    encode_wav(speech_like(seconds, args.sample_rate), args.sample_rate)
+                )
+
+            # Both paths must give the client the same envelope
+            _, reference = pydub_payload(path)
+            volumes = prepare_audio_payload(path)["volumes"]
+            assert len(volumes) == len(reference)
+            assert np.allclose(volumes, reference, atol=1e-3)
+
+            old = best_of(lambda: pydub_payload(path), args.repeats)
+            new = best_of(lambda: prepare_audio_payload(path), args.repeats)
+            print(
+                f"{seconds:>8g} {old * 1000:>11.2f} {new * 1000:>15.2f} {old / new:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Benchmark TTS throughput (sentences/sec) against the number of worker processes.
+
+Uses the TTS engine configured in conf.yaml (or --engine), with the same
+engine settings. For each worker count, a batch of sentences is synthesized
+with as many sentences in flight as there are workers:
+- 0 workers: the engine runs in this process, one sentence at a time (the default)
+- N workers: the engine runs in a TTSWorkerPool of N processes
+
+The engines are warmed up with one sentence per worker before timing.
+
+Usage:
+    uv run python scripts/bench_tts_workers.py [--workers 0 1 2 4] [--sentences 32] [--engine piper_tts]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.open_llm_vtuber.config_manager import read_yaml, validate_config  # noqa: E402
+from src.open_llm_vtuber.tts.tts_factory import TTSFactory  # noqa: E402
+from src.open_llm_vtuber.tts.tts_worker_pool import TTSWorkerPool  # noqa: E402
+
+SENTENCES = [
+    "Hello there, it is nice to see you again.",
+    "I was just thinking about what we talked about yesterday.",
+    "The weather looks lovely today, perfect for a walk in the park.",
+    "Did you know that octopuses have three hearts?",
+    "Let me think about that for a second.",
+    "That sounds like a great idea, let's do it!",
+    "I'm not sure I understand, could you say that again?",
+    "Thanks for telling me, I really appreciate it.",
+]
+
+
+async def synthesize_all(engine, sentences: list[str], concurrency: int) -> int:
+    """Synthesize the sentences with at most `concurrency` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def synthesize(text: str) -> None:
+        nonlocal failures
+        async with semaphore:
+            if await engine.async_generate_audio_bytes(text) is None:
+                failures += 1
+
+    await asyncio.gather(*(synthesize(text) for text in sentences))
+    return failures
+
+
+def run(engine_type: str, engine_config: dict, workers: int, num_sentences: int):
+    start = time.perf_counter()
+    if workers:
+        engine = TTSWorkerPool(engine_type, engine_config, num_workers=workers)
+    else:
+        engine = TTSFactory.get_tts_engine(engine_type, **engine_config)
+    startup = time.perf_counter() - start
+
+    concurrency = max(workers, 1)
+    sentences = [SENTENCES[i % len(SENTENCES)] for i in range(num_sentences)]
+    try:
+        asyncio.run(synthesize_all(engine, SENTENCES[:concurrency], concurrency))
+        start = time.perf_counter()
+        failures = asyncio.run(synthesize_all(engine, sentences, concurrency))
+        elapsed = time.perf_counter() - start
+    finally:
+        if workers:
+            engine.close()
+    return startup, num_sentences / elapsed, failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 1, 2, 4])
+    parser.add_argument("--sentences", type=int, default=32)
+    parser.add_argument("--config", default=os.path.join(project_root, "conf.yaml"))
+    parser.add_argument("--engine", help="TTS engine to use instead of tts_model")
+    args = parser.parse_args()
+
+    config = validate_config(read_yaml(args.config))
+    tts_config = config.character_config.tts_config
+    engine_type = args.engine or tts_config.tts_model
+    engine_config = getattr(tts_config, engine_type).model_dump()
+
+    print(f"engine: {engine_type}, {args.sentences} sentences, {os.cpu_count()} CPUs")
+    print(f"{'workers':>8} {'startup (s)':>12} {'sentences/s':>12} {'speedup':>8}")
+    baseline = None
+    for workers in args.workers:
+        startup, throughput, failures = run(
+            engine_type, engine_config, workers, args.sentences
+        )
+        baseline = baseline or throughput
+        note = f"  ({failures} failed)" if failures else ""
+        print(
+            f"{workers:>8} {startup:>12.2f} {throughput:>12.2f} "
+            f"{throughput / baseline:>7.2f}x{note}"
+        )
+
+
+if __name__ == "__main__":
+    main()
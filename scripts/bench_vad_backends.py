@@ -0,0 +1,112 @@
+"""
+Compare the Silero VAD backends: TorchScript (silero_vad) vs ONNX (silero_vad_onnx).
+
+Each backend is measured in a fresh subprocess so that imports are not shared:
+- cold start: time to import the engine module and load the model
+- peak RSS of the process after the model is loaded and has run
+- per-window latency of a single 512-sample window (p50 / p95)
+
+Usage:
+    uv run python scripts/bench_vad_backends.py [--windows 2000] [--backends silero_vad silero_vad_onnx]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import resource
+import subprocess
+
+import numpy as np
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+BACKENDS = ["silero_vad", "silero_vad_onnx"]
+
+
+def peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes on Linux
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def run_backend(backend: str, num_windows: int) -> dict:
+    """Measure one backend in the current process."""
+    start = time.perf_counter()
+    from src.open_llm_vtuber.vad.vad_factory import VADFactory  # noqa: E402
+
+    engine = VADFactory.get_vad_engine(
+        backend,
+        orig_sr=16000,
+        target_sr=16000,
+        prob_threshold=0.4,
+        db_threshold=60,
+        required_hits=3,
+        required_misses=24,
+        smoothing_window=5,
+    )
+    cold_start = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    windows = rng.normal(0, 0.1, (num_windows, engine.window_size_samples))
+    windows = windows.astype(np.float32)
+
+    model_state = None
+    latencies = np.empty(num_windows)
+    for i, window in enumerate(windows):
+        window_start = time.perf_counter()
+        _, model_state = engine.speech_prob(window, model_state)
+        latencies[i] = time.perf_counter() - window_start
+
+    return {
+        "backend": backend,
+        "cold_start_s": cold_start,
+        "peak_rss_mb": peak_rss_mb(),
+        "p50_ms": float(np.percentile(latencies, 50) * 1000),
+        "p95_ms": float(np.percentile(latencies, 95) * 1000),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--windows", type=int, default=2000)
+    parser.add_argument("--backends", nargs="+", default=BACKENDS, choices=BACKENDS)
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_backend(args.child, args.windows)))
+        return
+
+    print(
+        f"{'backend':>16} {'cold start (s)':>15} {'peak RSS (MB)':>14} "
+        f"{'p50 (ms)':>9} {'p95 (ms)':>9}"
+    )
+    for backend in args.backends:
+        proc = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                backend,
+                "--windows",
+                str(args.windows),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{backend:>16} failed:\n{proc.stderr.strip()}")
+            continue
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        print(
+            f"{backend:>16} {result['cold_start_s']:>15.2f} {result['peak_rss_mb']:>14.0f} "
+            f"{result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark batched Silero VAD inference across simulated client streams.
+
+Every stream sends a chunk of audio at the same time, once per round, the
+way browsers streaming `raw-audio-data` do. The script reports the windows
+per second of the batched path (`async_detect_speech`, which goes through
+the VADBatchScheduler) and of the sequential path (`detect_speech`, one
+forward pass per window).
+
+Usage:
+    uv run python scripts/bench_vad_batching.py [--streams 1 8 64] [--rounds 20]
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+import numpy as np
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.open_llm_vtuber.vad.silero import VADEngine  # noqa: E402
+
+CHUNK_SAMPLES = 4096  # 8 windows of 512 samples at 16 kHz
+
+
+def make_chunks(num_streams: int, rounds: int) -> np.ndarray:
+    """Noise with bursts of a tone, shape (num_streams, rounds, CHUNK_SAMPLES)."""
+    rng = np.random.default_rng(0)
+    audio = rng.normal(0, 0.01, (num_streams, rounds, CHUNK_SAMPLES))
+    t = np.arange(CHUNK_SAMPLES) / 16000
+    tone = 0.3 * np.sin(2 * np.pi * 220 * t)
+    audio[:, ::3] += tone
+    return audio.astype(np.float32)
+
+
+def bench_sequential(engine: VADEngine, chunks: np.ndarray) -> float:
+    sessions = [engine.create_session() for _ in range(len(chunks))]
+    start = time.perf_counter()
+    for round_index in range(chunks.shape[1]):
+        for session, stream in zip(sessions, chunks):
+            for _ in session.detect_speech(stream[round_index]):
+                pass
+    return time.perf_counter() - start
+
+
+async def bench_batched(engine: VADEngine, chunks: np.ndarray) -> float:
+    sessions = [engine.create_session() for _ in range(len(chunks))]
+    start = time.perf_counter()
+    for round_index in range(chunks.shape[1]):
+        await asyncio.gather(
+            *(
+                session.async_detect_speech(stream[round_index])
+                for session, stream in zip(sessions, chunks)
+            )
+        )
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--streams", type=int, nargs="+", default=[1, 8, 64])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = VADEngine()
+    windows_per_chunk = CHUNK_SAMPLES // engine.window_size_samples
+
+    print(
+        f"{'streams':>8} {'sequential win/s':>18} {'batched win/s':>15} {'speedup':>8}"
+    )
+    for num_streams in args.streams:
+        chunks = make_chunks(num_streams, args.rounds)
+        total_windows = num_streams * args.rounds * windows_per_chunk
+
+        sequential = bench_sequential(engine, chunks)
+        batched = asyncio.run(bench_batched(engine, chunks))
+        # asyncio.run closes its loop, so start a new scheduler next time
+        engine.scheduler = None
+
+        print(
+            f"{num_streams:>8} {total_windows / sequential:>18.0f} "
+            f"{total_windows / batched:>15.0f} {sequential / batched:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
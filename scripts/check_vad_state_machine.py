@@ -0,0 +1,200 @@
+"""
+Check that the batched VAD state machine takes the same transitions as the
+per-window one.
+
+Speech probabilities and audio windows are fed to two state machines: one
+window at a time through `StateMachine.process`, and in chunks of random
+sizes through `StateMachine.process_batch`, the way the VAD session
+receives audio from clients. For every window, the smoothed probability
+and level and the state they are applied to must be identical, and so must
+the markers and speech segments produced and the state after every chunk.
+The same is done with random probabilities, which toggle the thresholds
+far more often than real speech does.
+
+By default, the audio is a synthetic signal (tone bursts, noise and digital
+silence) generated with a fixed seed, and the probabilities follow its
+level with seeded jitter, so the check needs neither the model nor
+recordings and runs in CI. With recordings (16 kHz WAV files) or
+`--backend`, the probabilities come from the Silero model.
+
+Exits with status 1 on the first mismatch.
+
+Usage:
+    uv run python scripts/check_vad_state_machine.py [recording.wav ...] [--backend silero_vad_onnx]
+"""
+
+import os
+import sys
+import wave
+import argparse
+
+import numpy as np
+
+# Add project root to path to enable imports
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, project_root)
+
+from src.open_llm_vtuber.vad.silero import StateMachine, SileroVADConfig  # noqa: E402
+from src.open_llm_vtuber.vad.vad_factory import VADFactory  # noqa: E402
+
+SAMPLE_RATE = 16000
+WINDOW_SIZE = 512
+SEED = 0
+
+
+def read_wav(path: str) -> np.ndarray:
+    """Read a 16-bit 16 kHz WAV file as mono float32."""
+    with wave.open(path, "rb") as wav_file:
+        if wav_file.getsampwidth() != 2 or wav_file.getframerate() != SAMPLE_RATE:
+            raise ValueError(f"{path}: expected 16-bit audio at {SAMPLE_RATE} Hz")
+        channels = wav_file.getnchannels()
+        frames = wav_file.readframes(wav_file.getnframes())
+    audio = np.frombuffer(frames, dtype=np.int16).reshape(-1, channels)
+    return (audio.mean(axis=1) / 32768).astype(np.float32)
+
+
+def synthetic_audio(seconds: int = 60) -> np.ndarray:
+    rng = np.random.default_rng(SEED)
+    t = np.arange(seconds * SAMPLE_RATE) / SAMPLE_RATE
+    audio = rng.normal(0, 0.005, len(t))
+    # 1.5 s bursts of a voiced-like harmonic tone every 4 s
+    bursts = (t % 4) < 1.5
+    audio[bursts] += 0.3 * np.sin(2 * np.pi * 180 * t[bursts]) + 0.1 * np.sin(
+        2 * np.pi * 540 * t[bursts]
+    )
+    # stretches of digital silence (dB of -inf)
+    audio[(t % 10) > 9] = 0
+    return audio.astype(np.float32)
+
+
+def synthetic_probs(windows: np.ndarray) -> np.ndarray:
+    """Model-like speech probabilities: high in the loud windows, with jitter."""
+    rng = np.random.default_rng(SEED)
+    rms = np.sqrt(np.mean(np.square(windows.astype(np.float64)), axis=1))
+    level = 20 * np.log10(rms + 1e-7)
+    probs = 1 / (1 + np.exp(-(level + 25) / 3)) + rng.normal(0, 0.15, len(level))
+    return np.clip(probs, 0, 1)
+
+
+def record_steps(machine: StateMachine) -> list:
+    """Record the state and smoothed values each window is processed with."""
+    steps = []
+    step = machine._step
+
+    def recording_step(chunk_bytes, smoothed_prob, smoothed_db):
+        steps.append((machine.state, float(smoothed_prob), float(smoothed_db)))
+        yield from step(chunk_bytes, smoothed_prob, smoothed_db)
+
+    machine._step = recording_step
+    return steps
+
+
+def machine_state(machine: StateMachine) -> tuple:
+    return (
+        machine.state,
+        machine.hit_count,
+        machine.miss_count,
+        bytes(machine.bytes),
+        list(machine.probs),
+        list(machine.dbs),
+        list(machine.pre_buffer),
+    )
+
+
+def compare(
+    config: SileroVADConfig, probs: np.ndarray, windows: np.ndarray, seed: int
+) -> int:
+    """Feed both state machines and return the number of segments produced."""
+    rng = np.random.default_rng(seed)
+    reference = StateMachine(config)
+    batched = StateMachine(config)
+    reference_steps = record_steps(reference)
+    batched_steps = record_steps(batched)
+    num_segments = 0
+
+    start = 0
+    while start < len(windows):
+        end = min(start + int(rng.integers(1, 40)), len(windows))
+        expected = [
+            (list(p), list(d), bytes(chunk))
+            for prob, window in zip(probs[start:end], windows[start:end])
+            for p, d, chunk in reference.process(float(prob), window)
+        ]
+        actual = [
+            (list(p), list(d), bytes(chunk))
+            for p, d, chunk in batched.process_batch(
+                probs[start:end], windows[start:end]
+            )
+        ]
+        for i, (want, got) in enumerate(zip(reference_steps, batched_steps)):
+            if want != got:
+                raise AssertionError(
+                    f"Window {start + i}: state and smoothed values {got}, "
+                    f"expected {want}"
+                )
+        if len(reference_steps) != len(batched_steps):
+            raise AssertionError(f"Windows {start}-{end}: some were not processed")
+        if expected != actual:
+            raise AssertionError(f"Windows {start}-{end}: different output")
+        if machine_state(reference) != machine_state(batched):
+            raise AssertionError(f"Windows {start}-{end}: different state after")
+        reference_steps.clear()
+        batched_steps.clear()
+        num_segments += sum(len(p) > 0 for p, _, _ in expected)
+        start = end
+    return num_segments
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("recordings", nargs="*", help="16 kHz WAV files")
+    parser.add_argument(
+        "--backend", help="VAD backend computing the probabilities (silero_vad_onnx)"
+    )
+    args = parser.parse_args()
+    if args.recordings and not args.backend:
+        args.backend = "silero_vad_onnx"
+
+    config = SileroVADConfig()
+    engine = None
+    if args.backend:
+        engine = VADFactory.get_vad_engine(args.backend, **config.model_dump())
+    recordings = {path: read_wav(path) for path in args.recordings} or {
+        "synthetic": synthetic_audio()
+    }
+
+    for name, audio in recordings.items():
+        if engine is not None:
+            session = engine.create_session()
+            windows = session._split_windows(audio)
+            probs = session._speech_probs(windows).astype(np.float64)
+            voiced = probs != 0  # the session skips these windows
+            probs, windows = probs[voiced], windows[voiced]
+        else:
+            num_windows = len(audio) // WINDOW_SIZE
+            windows = audio[: num_windows * WINDOW_SIZE].reshape(-1, WINDOW_SIZE)
+            probs = synthetic_probs(windows)
+
+        for smoothing_window in (1, 3, 5, 8, 12):
+            config.smoothing_window = smoothing_window
+            try:
+                segments = compare(config, probs, windows, seed=smoothing_window)
+                random_probs = np.random.default_rng(smoothing_window).random(
+                    len(probs)
+                )
+                random_segments = compare(
+                    config, random_probs, windows, seed=smoothing_window
+                )
+            except AssertionError as e:
+                print(f"{name}, smoothing {smoothing_window}: MISMATCH: {e}")
+                return 1
+            print(
+                f"{name}: {len(windows)} windows, smoothing {smoothing_window}: "
+                f"identical ({segments} speech segments, "
+                f"{random_segments} with random probabilities)"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
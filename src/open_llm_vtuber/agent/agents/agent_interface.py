@@ -9,6 +9,14 @@ from ..input_types import BaseInput
 class AgentInterface(ABC):
     """Base interface for all agent implementations"""
 
+    # Whether a reply can be started on a transcription that may still
+    # change. Agents that set it implement begin_speculation(), which returns
+    # a token for the reply, chat(input_data, speculation=token), which holds
+    # back the memory changes of the reply in the token, and
+    # commit_speculation(token) / abort_speculation(token), which apply or
+    # drop them.
+    supports_speculation = False
+
     @abstractmethod
     async def chat(self, input_data: BaseInput) -> AsyncIterator[BaseOutput]:
         """
@@ -30,6 +30,19 @@ from ...mcpp.types import ToolCallObject
 from ...mcpp.tool_executor import ToolExecutor
 
 
+class SpeculativeMemory:
+    """
+    Messages a speculative reply added to memory, held back until it is
+    taken. Once committed, the reply adds its next messages to memory
+    directly; once aborted, they are dropped.
+    """
+
+    def __init__(self):
+        self.messages: List[tuple] = []
+        self.committed = False
+        self.aborted = False
+
+
 class BasicMemoryAgent(AgentInterface):
     """Agent with basic chat memory and tool calling support."""
 
@@ -131,10 +144,15 @@ class BasicMemoryAgent(AgentInterface):
         role: str,
         display_text: DisplayText | None = None,
         skip_memory: bool = False,
+        speculation: Optional[SpeculativeMemory] = None,
     ):
-        """Add message to memory."""
+        """Add message to memory, or hold it back for a speculative reply."""
         if skip_memory:
             return
+        if speculation is not None and not speculation.committed:
+            if not speculation.aborted:
+                speculation.messages.append((message, role, display_text))
+            return
 
         text_content = ""
         if isinstance(message, list):
@@ -173,6 +191,31 @@ class BasicMemoryAgent(AgentInterface):
 
         self._memory.append(message_data)
 
+    @property
+    def supports_speculation(self) -> bool:
+        # Tools may have side effects, they must not run for a discarded reply
+        return not self._use_mcpp
+
+    def begin_speculation(self) -> SpeculativeMemory:
+        """
+        Start a speculative reply. The messages that chat called with it
+        adds to memory are held back in the returned token, apart from those
+        of other conversations on this agent.
+        """
+        return SpeculativeMemory()
+
+    def commit_speculation(self, speculation: SpeculativeMemory) -> None:
+        """Add the messages held back for the reply to memory."""
+        speculation.committed = True
+        messages, speculation.messages = speculation.messages, []
+        for message, role, display_text in messages:
+            self._add_message(message, role, display_text)
+
+    def abort_speculation(self, speculation: SpeculativeMemory) -> None:
+        """Drop the messages held back for the reply, and its next ones."""
+        speculation.aborted = True
+        speculation.messages = []
+
     def set_memory_from_history(self, conf_uid: str, history_uid: str) -> None:
         """Load memory from chat history."""
         messages = get_history(conf_uid, history_uid)
@@ -239,7 +282,11 @@ class BasicMemoryAgent(AgentInterface):
 
         return "\n".join(message_parts).strip()
 
-    def _to_messages(self, input_data: BatchInput) -> List[Dict[str, Any]]:
+    def _to_messages(
+        self,
+        input_data: BatchInput,
+        speculation: Optional[SpeculativeMemory] = None,
+    ) -> List[Dict[str, Any]]:
         """Prepare messages for LLM API call."""
         messages = self._memory.copy()
         user_content = []
@@ -280,7 +327,9 @@ class BasicMemoryAgent(AgentInterface):
 
             if not skip_memory:
                 self._add_message(
-                    text_prompt if text_prompt else "[User provided image(s)]", "user"
+                    text_prompt if text_prompt else "[User provided image(s)]",
+                    "user",
+                    speculation=speculation,
                 )
         else:
             logger.warning("No content generated for user message.")
@@ -593,12 +642,16 @@ class BasicMemoryAgent(AgentInterface):
         )
         async def chat_with_memory(
             input_data: BatchInput,
+            speculation: Optional[SpeculativeMemory] = None,
         ) -> AsyncIterator[Union[str, Dict[str, Any]]]:
-            """Process chat with memory and tools."""
+            """
+            Process chat with memory and tools. With a speculation token
+            from begin_speculation, the memory changes are held back in it.
+            """
             self.reset_interrupt()
             self.prompt_mode_flag = False
 
-            messages = self._to_messages(input_data)
+            messages = self._to_messages(input_data, speculation)
             tools = None
             tool_mode = None
             llm_supports_native_tools = False
@@ -657,17 +710,27 @@ class BasicMemoryAgent(AgentInterface):
                         yield text_chunk
                         complete_response += text_chunk
                 if complete_response:
-                    self._add_message(complete_response, "assistant")
+                    self._add_message(
+                        complete_response, "assistant", speculation=speculation
+                    )
 
         return chat_with_memory
 
     async def chat(
         self,
         input_data: BatchInput,
+        speculation: Optional[SpeculativeMemory] = None,
     ) -> AsyncIterator[Union[SentenceOutput, Dict[str, Any]]]:
-        """Run chat pipeline."""
+        """
+        Run chat pipeline.
+
+        Args:
+            input_data: The user input
+            speculation: Token from begin_speculation if the input may not
+                be final, to hold back the memory changes of the reply
+        """
         chat_func_decorated = self._chat_function_factory()
-        async for output in chat_func_decorated(input_data):
+        async for output in chat_func_decorated(input_data, speculation):
             yield output
 
     def reset_interrupt(self) -> None:
@@ -1,10 +1,28 @@
 from typing import Type
 from .asr_interface import ASRInterface
 
+# Option of the CPU engines that can run as replicas setting their threads
+REPLICA_THREADS_OPTION = {
+    "sherpa_onnx_asr": "num_threads",
+    "whisper_cpp": "n_threads",
+    "fun_asr": "ncpu",
+}
+
 
 class ASRFactory:
     @staticmethod
     def get_asr_system(system_name: str, **kwargs) -> Type[ASRInterface]:
+        replicas = kwargs.pop("replicas", 1)
+        if replicas > 1 and system_name in REPLICA_THREADS_OPTION:
+            from .asr_replica_pool import ASRReplicaPool
+
+            return ASRReplicaPool(
+                system_name,
+                lambda: ASRFactory.get_asr_system(system_name, **kwargs),
+                num_replicas=replicas,
+                threads_per_replica=kwargs.get(REPLICA_THREADS_OPTION[system_name]),
+            )
+
         if system_name == "faster_whisper":
             from .faster_whisper_asr import VoiceRecognition as FasterWhisperASR
 
@@ -15,6 +33,9 @@ class ASRFactory:
                 device=kwargs.get("device"),
                 compute_type=kwargs.get("compute_type"),
                 prompt=kwargs.get("prompt", None),
+                batch_size=kwargs.get("batch_size", 8),
+                batch_window_ms=kwargs.get("batch_window_ms", 20),
+                max_queue_depth=kwargs.get("max_queue_depth", 32),
             )
         elif system_name == "whisper_cpp":
             from .whisper_cpp_asr import VoiceRecognition as WhisperCPPASR
@@ -58,5 +79,9 @@ class ASRFactory:
             from .sherpa_onnx_asr import VoiceRecognition as SherpaOnnxASR
 
             return SherpaOnnxASR(**kwargs)
+        elif system_name == "sherpa_onnx_online_asr":
+            from .sherpa_onnx_online_asr import VoiceRecognition as SherpaOnnxOnlineASR
+
+            return SherpaOnnxOnlineASR(**kwargs)
         else:
             raise ValueError(f"Unknown ASR system: {system_name}")
@@ -2,12 +2,69 @@ import abc
 import numpy as np
 import asyncio
 
+from ..utils.audio_buffer import AudioBuffer
+
+
+class ASRStreamInterface(metaclass=abc.ABCMeta):
+    """Recognition of one utterance, fed with its audio while it is spoken."""
+
+    @abc.abstractmethod
+    async def accept(self, audio: np.ndarray) -> str | None:
+        """Feed the next chunk of the utterance.
+
+        Args:
+            audio: float32 mono samples at ASRInterface.SAMPLE_RATE.
+
+        Returns:
+            str | None: The partial transcription if it changed, else None.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def finalize(self) -> str:
+        """End the utterance and return its transcription."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release the resources held by this stream."""
+        pass
+
+
+class _BufferedASRStream(ASRStreamInterface):
+    """
+    Stream of engines that only transcribe whole utterances: the audio is
+    buffered and transcribed when the utterance ends, without partial text.
+    """
+
+    def __init__(self, engine: "ASRInterface"):
+        self.engine = engine
+        self.buffer = AudioBuffer()
+
+    async def accept(self, audio: np.ndarray) -> str | None:
+        self.buffer.append(audio)
+        return None
+
+    async def finalize(self) -> str:
+        return await self.engine.async_transcribe_np(self.buffer.take())
+
 
 class ASRInterface(metaclass=abc.ABCMeta):
     SAMPLE_RATE = 16000
     NUM_CHANNELS = 1
     SAMPLE_WIDTH = 2
 
+    # Whether create_stream recognizes speech while it is spoken. Streams of
+    # other engines only transcribe once the utterance ends.
+    supports_streaming = False
+
+    def create_stream(self) -> ASRStreamInterface:
+        """Start recognizing an utterance, fed chunk by chunk.
+
+        Streaming engines override this. By default, the audio is buffered
+        and transcribed with async_transcribe_np at the end.
+        """
+        return _BufferedASRStream(self)
+
     async def async_transcribe_np(self, audio: np.ndarray) -> str:
         """Asynchronously transcribe speech audio in numpy array format.
 
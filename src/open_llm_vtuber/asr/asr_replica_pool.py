@@ -0,0 +1,223 @@
+import os
+import time
+import asyncio
+import threading
+from collections import deque
+from typing import Callable
+
+import numpy as np
+from loguru import logger
+
+from .asr_interface import ASRInterface
+
+
+class _Replica:
+    """An instance of the engine and the time it spent transcribing."""
+
+    def __init__(self, index: int, engine: ASRInterface):
+        self.index = index
+        self.engine = engine
+        self.leased_at: float | None = None
+        self.busy_time = 0.0
+
+
+class ASRReplicaPool(ASRInterface):
+    """
+    Runs several instances of a local ASR engine.
+
+    CPU engines (sherpa-onnx, whisper.cpp, FunASR) hold one model that
+    transcribes one utterance at a time, however many threads it uses, so
+    the utterances of clients talking at once queue behind each other. The
+    pool loads `num_replicas` instances of the engine and leases an idle
+    one to each transcription. When all of them are busy, the transcription
+    waits for the first one to be released, on the event loop rather than in
+    a thread.
+
+    Each replica runs its own threads: `num_replicas` times the threads of
+    the engine should not exceed the cores of the machine.
+    """
+
+    def __init__(
+        self,
+        engine_type: str,
+        create_engine: Callable[[], ASRInterface],
+        num_replicas: int,
+        threads_per_replica: int | None = None,
+    ):
+        if num_replicas < 1:
+            raise ValueError("An ASR replica pool needs at least 1 replica")
+        self.engine_type = engine_type
+        self.threads_per_replica = threads_per_replica
+
+        cores = os.cpu_count() or 1
+        if threads_per_replica and num_replicas * threads_per_replica > cores:
+            logger.warning(
+                f"{num_replicas} ASR replicas of {threads_per_replica} threads "
+                f"each use more threads than the {cores} CPU cores, they will "
+                "slow each other down"
+            )
+
+        # One at a time: engines may download their model on first load
+        logger.info(f"Loading {num_replicas} replicas of {engine_type}")
+        self._replicas = [
+            _Replica(index, create_engine()) for index in range(num_replicas)
+        ]
+        self.SAMPLE_RATE = self._replicas[0].engine.SAMPLE_RATE
+
+        self._lock = threading.Lock()
+        self._idle: deque[_Replica] = deque(self._replicas)
+        self._waiters: deque[asyncio.Future] = deque()
+        self._released = threading.Condition(self._lock)
+        self._started_at = time.perf_counter()
+
+        # Metrics
+        self.leases = 0
+        self.waited_leases = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_waiting_seen = 0
+
+    @property
+    def num_replicas(self) -> int:
+        return len(self._replicas)
+
+    @property
+    def busy(self) -> int:
+        """Number of replicas transcribing."""
+        return self.num_replicas - len(self._idle)
+
+    @property
+    def waiting(self) -> int:
+        """Number of transcriptions waiting for a replica."""
+        return len(self._waiters)
+
+    def utilization(self) -> list[float]:
+        """Fraction of the time each replica spent transcribing so far."""
+        now = time.perf_counter()
+        elapsed = now - self._started_at
+        if elapsed <= 0:
+            return [0.0] * self.num_replicas
+        return [
+            (
+                replica.busy_time
+                + (now - replica.leased_at if replica.leased_at is not None else 0.0)
+            )
+            / elapsed
+            for replica in self._replicas
+        ]
+
+    def stats(self) -> dict:
+        utilization = self.utilization()
+        return {
+            "replicas": self.num_replicas,
+            "threads_per_replica": self.threads_per_replica,
+            "busy": self.busy,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting_seen,
+            "leases": self.leases,
+            "waited_leases": self.waited_leases,
+            "mean_wait": self.total_wait / self.leases if self.leases else 0.0,
+            "max_wait": self.max_wait,
+            "utilization": sum(utilization) / len(utilization),
+            "replica_utilization": utilization,
+        }
+
+    def log_stats(self, reason: str) -> None:
+        """Log how busy the replicas were and how long transcriptions waited."""
+        stats = self.stats()
+        per_replica = ", ".join(f"{u:.0%}" for u in stats["replica_utilization"])
+        logger.info(
+            f"ASR replicas ({reason}): {stats['busy']}/{stats['replicas']} busy, "
+            f"{stats['waiting']} waiting (max {stats['max_waiting']}), "
+            f"{stats['leases']} transcriptions, {stats['waited_leases']} of "
+            f"which waited for a replica, mean wait "
+            f"{stats['mean_wait'] * 1000:.0f} ms (max "
+            f"{stats['max_wait'] * 1000:.0f} ms), utilization "
+            f"{stats['utilization']:.0%} ({per_replica})"
+        )
+
+    async def async_transcribe_np(self, audio: np.ndarray) -> str:
+        if audio.dtype != np.float32:
+            audio = audio.astype(np.float32)
+        enqueued_at = time.perf_counter()
+        replica = await self._lease()
+        # The replica is released by the thread: if the transcription is
+        # cancelled, it stays leased until the engine is done with it
+        return await asyncio.to_thread(self._transcribe, replica, audio, enqueued_at)
+
+    def transcribe_np(self, audio: np.ndarray) -> str:
+        enqueued_at = time.perf_counter()
+        with self._released:
+            while not self._idle:
+                self._released.wait()
+            replica = self._idle.popleft()
+        return self._transcribe(replica, audio, enqueued_at)
+
+    def _transcribe(
+        self, replica: _Replica, audio: np.ndarray, enqueued_at: float
+    ) -> str:
+        start = time.perf_counter()
+        wait = start - enqueued_at
+        with self._lock:
+            replica.leased_at = start
+            self.leases += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            if wait > 0.001:
+                self.waited_leases += 1
+        try:
+            return replica.engine.transcribe_np(audio)
+        finally:
+            inference = time.perf_counter() - start
+            with self._lock:
+                replica.busy_time += inference
+                replica.leased_at = None
+            self._release(replica)
+            logger.debug(
+                f"ASR: {len(audio) / self.SAMPLE_RATE:.1f}s utterance waited "
+                f"{wait * 1000:.0f} ms for a replica, {inference * 1000:.0f} ms "
+                f"inference on replica {replica.index} "
+                f"({self.busy}/{self.num_replicas} busy)"
+            )
+
+    async def _lease(self) -> _Replica:
+        """Take an idle replica, or wait for one to be released."""
+        with self._lock:
+            if self._idle:
+                return self._idle.popleft()
+            future = asyncio.get_running_loop().create_future()
+            self._waiters.append(future)
+            self.max_waiting_seen = max(self.max_waiting_seen, len(self._waiters))
+        try:
+            return await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if future in self._waiters:
+                    self._waiters.remove(future)
+            # Handed a replica just as the transcription was cancelled
+            if future.done() and not future.cancelled():
+                self._release(future.result())
+            raise
+
+    def _release(self, replica: _Replica) -> None:
+        """Hand the replica to the oldest waiting transcription, or make it idle."""
+        with self._lock:
+            while self._waiters:
+                future = self._waiters.popleft()
+                if future.done():
+                    continue  # cancelled while waiting
+                try:
+                    future.get_loop().call_soon_threadsafe(
+                        self._hand_over, future, replica
+                    )
+                except RuntimeError:
+                    continue  # its event loop is closed
+                return
+            self._idle.append(replica)
+            self._released.notify()
+
+    def _hand_over(self, future: asyncio.Future, replica: _Replica) -> None:
+        if future.done():
+            self._release(replica)
+        else:
+            future.set_result(replica)
@@ -0,0 +1,176 @@
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+from loguru import logger
+
+from .asr_interface import ASRInterface
+
+
+class ASRBusyError(Exception):
+    """Too many utterances are already waiting for the ASR engine."""
+
+
+@dataclass
+class _Request:
+    audio: np.ndarray
+    future: asyncio.Future
+    enqueued_at: float
+
+
+class ASRBatchScheduler:
+    """
+    Queues the utterances of all sessions for an ASR engine and transcribes
+    them in batches.
+
+    Every client shares the engine's model, which transcribes one utterance
+    at a time. The scheduler runs one batch at a time instead: the first
+    utterance to arrive waits up to `batch_window_ms` for others, then up to
+    `max_batch_size` of them go through `transcribe_batch` together.
+    Utterances that arrive while a batch runs form the next one.
+
+    When `max_queue_depth` utterances are already waiting, `transcribe`
+    raises `ASRBusyError` instead of queueing another one.
+    """
+
+    def __init__(
+        self,
+        transcribe_batch: Callable[[list[np.ndarray]], list[str]],
+        max_batch_size: int = 8,
+        batch_window_ms: float = 20.0,
+        max_queue_depth: int = 32,
+    ):
+        if max_batch_size < 1 or max_queue_depth < 1:
+            raise ValueError("ASR batch size and queue depth must be at least 1")
+        self.transcribe_batch = transcribe_batch
+        self.max_batch_size = max_batch_size
+        self.batch_window_ms = batch_window_ms
+        self.max_queue_depth = max_queue_depth
+
+        self._pending: list[_Request] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Metrics
+        self.requests = 0
+        self.rejected = 0
+        self.batches = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.total_inference_time = 0.0
+        self.max_queue_depth_seen = 0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of utterances waiting for a batch."""
+        return len(self._pending)
+
+    @property
+    def average_batch_size(self) -> float:
+        if not self.batches:
+            return 0.0
+        return self.requests / self.batches
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth_seen,
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "average_batch_size": self.average_batch_size,
+            "mean_wait": self.total_wait / self.requests if self.requests else 0.0,
+            "max_wait": self.max_wait,
+            "mean_inference_time": (
+                self.total_inference_time / self.batches if self.batches else 0.0
+            ),
+        }
+
+    async def transcribe(self, audio: np.ndarray) -> str:
+        """
+        Transcribe an utterance in the next batch.
+
+        Raises:
+            ASRBusyError: If max_queue_depth utterances are already waiting.
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # The engine was used on another loop before, e.g. warmed up
+            # before the server started
+            self._loop = loop
+            self._pending = []
+            self._wakeup = asyncio.Event()
+            self._task = None
+
+        if len(self._pending) >= self.max_queue_depth:
+            self.rejected += 1
+            raise ASRBusyError(
+                f"Speech recognition is busy ({len(self._pending)} utterances "
+                "waiting), please try again in a moment"
+            )
+
+        future = loop.create_future()
+        self._pending.append(_Request(audio, future, time.perf_counter()))
+        self.max_queue_depth_seen = max(self.max_queue_depth_seen, len(self._pending))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        return await future
+
+    async def _run(self) -> None:
+        """Run one batch at a time while utterances are waiting."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self._pending and len(self._pending) < self.max_batch_size:
+                # Give the other sessions a moment to finish their utterances,
+                # counted from when the oldest one was queued
+                waited = time.perf_counter() - self._pending[0].enqueued_at
+                if waited < self.batch_window_ms / 1000:
+                    await asyncio.sleep(self.batch_window_ms / 1000 - waited)
+
+            requests = self._take_batch()
+            if not requests:
+                continue
+            start = time.perf_counter()
+            try:
+                texts = await asyncio.to_thread(
+                    self.transcribe_batch, [request.audio for request in requests]
+                )
+            except Exception as e:
+                logger.error(f"Error in batched ASR inference: {e}")
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+            self._record(requests, start, time.perf_counter() - start)
+
+            for request, text in zip(requests, texts):
+                if not request.future.done():
+                    request.future.set_result(text)
+
+    def _take_batch(self) -> list[_Request]:
+        """Take up to max_batch_size pending requests, oldest first."""
+        pending = [request for request in self._pending if not request.future.done()]
+        batch = pending[: self.max_batch_size]
+        self._pending = pending[self.max_batch_size :]
+        if self._pending:
+            self._wakeup.set()
+        return batch
+
+    def _record(self, requests: list[_Request], start: float, inference: float):
+        self.batches += 1
+        self.total_inference_time += inference
+        for request in requests:
+            wait = start - request.enqueued_at
+            self.requests += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+            logger.debug(
+                f"ASR: {len(request.audio) / ASRInterface.SAMPLE_RATE:.1f}s utterance waited "
+                f"{wait * 1000:.0f} ms in queue, {inference * 1000:.0f} ms "
+                f"inference in a batch of {len(requests)}"
+            )
@@ -1,6 +1,11 @@
+import math
 import numpy as np
-from faster_whisper import WhisperModel
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 from .asr_interface import ASRInterface
+from .asr_scheduler import ASRBatchScheduler
+
+# Longest utterance transcribed in a batch: one Whisper window
+MAX_BATCHED_SECONDS = 30
 
 
 class VoiceRecognition(ASRInterface):
@@ -15,6 +20,9 @@ class VoiceRecognition(ASRInterface):
         device: str = "auto",
         compute_type: str = "int8",
         prompt: str = None,
+        batch_size: int = 8,
+        batch_window_ms: int = 20,
+        max_queue_depth: int = 32,
     ) -> None:
         self.MODEL_PATH = model_path
         self.LANG = language
@@ -25,6 +33,17 @@ class VoiceRecognition(ASRInterface):
             device=device,
             compute_type=compute_type,
         )
+        self.batched_model = BatchedInferencePipeline(model=self.model)
+        # Utterances of all clients are queued and transcribed in batches
+        self.scheduler = ASRBatchScheduler(
+            self.transcribe_batch,
+            max_batch_size=batch_size,
+            batch_window_ms=batch_window_ms,
+            max_queue_depth=max_queue_depth,
+        )
+
+    async def async_transcribe_np(self, audio: np.ndarray) -> str:
+        return await self.scheduler.transcribe(audio)
 
     def transcribe_np(self, audio: np.ndarray) -> str:
         if self.prompt:
@@ -48,3 +67,60 @@ class VoiceRecognition(ASRInterface):
             return ""
         else:
             return "".join(text)
+
+    def transcribe_batch(self, audios: list[np.ndarray]) -> list[str]:
+        """
+        Transcribe several utterances, with one batched pass of the model for
+        those up to MAX_BATCHED_SECONDS long. A single utterance, or a longer
+        one, is transcribed on its own with transcribe_np.
+        """
+        batchable = [
+            i
+            for i, audio in enumerate(audios)
+            if 0 < len(audio) <= MAX_BATCHED_SECONDS * self.SAMPLE_RATE
+        ]
+        texts = {}
+        if len(batchable) > 1:
+            batched_texts = self._transcribe_batched([audios[i] for i in batchable])
+            texts = dict(zip(batchable, batched_texts))
+        return [
+            texts[i] if i in texts else self.transcribe_np(audio)
+            for i, audio in enumerate(audios)
+        ]
+
+    def _transcribe_batched(self, audios: list[np.ndarray]) -> list[str]:
+        """
+        Run utterances through faster-whisper's batched pipeline, as clips of
+        one audio. Each clip starts on a whole second, which identifies the
+        utterance a segment belongs to.
+        """
+        pieces = []
+        clip_timestamps = []
+        clip_index = {}
+        position = 0
+        for i, audio in enumerate(audios):
+            seconds = math.ceil(len(audio) / self.SAMPLE_RATE)
+            piece = np.zeros(seconds * self.SAMPLE_RATE, dtype=np.float32)
+            piece[: len(audio)] = audio
+            pieces.append(piece)
+            clip_timestamps.append(
+                {"start": position, "end": position + len(audio) / self.SAMPLE_RATE}
+            )
+            clip_index[position] = i
+            position += seconds
+
+        segments, info = self.batched_model.transcribe(
+            np.concatenate(pieces),
+            language=self.LANG if self.LANG else None,
+            # Detect the language of each utterance instead of the whole batch
+            multilingual=not self.LANG,
+            beam_size=5 if self.BEAM_SEARCH else 1,
+            initial_prompt=self.prompt if self.prompt else None,
+            clip_timestamps=clip_timestamps,
+            batch_size=len(audios),
+            without_timestamps=True,
+        )
+        texts = [[] for _ in audios]
+        for segment in segments:
+            texts[clip_index[round(segment.start)]].append(segment.text)
+        return ["".join(text) for text in texts]
@@ -0,0 +1,197 @@
+import os
+import asyncio
+import numpy as np
+import sherpa_onnx
+from loguru import logger
+from .asr_interface import ASRInterface, ASRStreamInterface
+from .utils import download_and_extract, check_and_extract_local_file
+import onnxruntime
+
+DEFAULT_MODEL_URL = "https://github.com/k2-fsa/sherpa-onnx/releases/download/asr-models/sherpa-onnx-streaming-zipformer-bilingual-zh-en-2023-02-20.tar.bz2"
+DEFAULT_MODEL_DIR = (
+    "./models/sherpa-onnx-streaming-zipformer-bilingual-zh-en-2023-02-20"
+)
+
+# Silence appended when an utterance ends, so the model emits the last words
+# still inside its right context
+TAIL_PADDING_SECONDS = 0.5
+
+
+class OnlineASRStream(ASRStreamInterface):
+    """One utterance decoded by a sherpa-onnx OnlineRecognizer."""
+
+    def __init__(self, engine: "VoiceRecognition"):
+        self.engine = engine
+        self.stream = engine.recognizer.create_stream()
+        self._text = ""
+
+    async def accept(self, audio: np.ndarray) -> str | None:
+        return await asyncio.to_thread(self._accept, audio)
+
+    async def finalize(self) -> str:
+        return await asyncio.to_thread(self._finalize)
+
+    def _accept(self, audio: np.ndarray) -> str | None:
+        self.stream.accept_waveform(
+            self.engine.SAMPLE_RATE, np.asarray(audio, dtype=np.float32)
+        )
+        text = self.engine.decode(self.stream)
+        if text == self._text:
+            return None
+        self._text = text
+        return text
+
+    def _finalize(self) -> str:
+        tail = np.zeros(
+            int(TAIL_PADDING_SECONDS * self.engine.SAMPLE_RATE), dtype=np.float32
+        )
+        self.stream.accept_waveform(self.engine.SAMPLE_RATE, tail)
+        self.stream.input_finished()
+        return self.engine.decode(self.stream)
+
+    def close(self) -> None:
+        self.stream = None
+
+
+class VoiceRecognition(ASRInterface):
+    """
+    Streaming speech recognition with sherpa-onnx (streaming zipformer
+    transducer, streaming paraformer or zipformer2 CTC models).
+
+    Unlike the offline recognizers of sherpa_onnx_asr, the model decodes the
+    audio as it arrives. The user's speech is recognized while they talk,
+    the client gets the partial text, and only the last few hundred
+    milliseconds are left to decode when they stop.
+    """
+
+    supports_streaming = True
+
+    def __init__(
+        self,
+        model_type: str = "transducer",  # or "paraformer", "zipformer2_ctc"
+        encoder: str = None,  # Path to the encoder model (transducer, paraformer)
+        decoder: str = None,  # Path to the decoder model (transducer, paraformer)
+        joiner: str = None,  # Path to the joiner model (transducer)
+        zipformer2_ctc: str = None,  # Path to the model.onnx (zipformer2_ctc)
+        tokens: str = None,  # Path to tokens.txt
+        hotwords_file: str = "",  # Path to hotwords file (transducer)
+        hotwords_score: float = 1.5,  # Hotwords score
+        modeling_unit: str = "cjkchar",  # Modeling unit for hotwords
+        bpe_vocab: str = "",  # Path to bpe vocabulary, used with hotwords
+        num_threads: int = 1,  # Number of threads for neural network computation
+        blank_penalty: float = 0.0,  # Penalty for blank symbol
+        decoding_method: str = "greedy_search",  # or "modified_beam_search"
+        debug: bool = False,  # Show debug messages
+        sample_rate: int = 16000,  # Sample rate
+        feature_dim: int = 80,  # Feature dimension
+        provider: str = "cpu",  # Provider for inference (cpu or cuda)
+    ) -> None:
+        self.model_type = model_type
+        self.encoder = encoder
+        self.decoder = decoder
+        self.joiner = joiner
+        self.zipformer2_ctc = zipformer2_ctc
+        self.tokens = tokens
+        self.hotwords_file = hotwords_file
+        self.hotwords_score = hotwords_score
+        self.modeling_unit = modeling_unit
+        self.bpe_vocab = bpe_vocab
+        self.num_threads = num_threads
+        self.blank_penalty = blank_penalty
+        self.decoding_method = decoding_method
+        self.debug = debug
+        self.SAMPLE_RATE = sample_rate
+        self.feature_dim = feature_dim
+
+        self.provider = provider
+        if self.provider == "cuda":
+            try:
+                if "CUDAExecutionProvider" not in onnxruntime.get_available_providers():
+                    logger.warning(
+                        "CUDA provider not available for ONNX. Falling back to CPU."
+                    )
+                    self.provider = "cpu"
+            except ImportError:
+                logger.warning("ONNX Runtime not installed. Falling back to CPU.")
+                self.provider = "cpu"
+        logger.info(f"Sherpa-Onnx-Online-ASR: Using {self.provider} for inference")
+
+        self._download_default_model()
+        self.recognizer = self._create_recognizer()
+
+    def _download_default_model(self) -> None:
+        """Download the default model if it is configured but missing."""
+        paths = [self.encoder, self.decoder, self.joiner, self.tokens]
+        if not any(
+            path and path.startswith(DEFAULT_MODEL_DIR) and not os.path.isfile(path)
+            for path in paths
+        ):
+            return
+        logger.warning("Streaming zipformer model not found. Downloading the model...")
+        output_dir = os.path.dirname(DEFAULT_MODEL_DIR)
+        if check_and_extract_local_file(DEFAULT_MODEL_URL, output_dir) is None:
+            logger.info("Local file not found. Downloading...")
+            download_and_extract(DEFAULT_MODEL_URL, output_dir)
+        else:
+            logger.info("Local file found. Using existing file.")
+
+    def _create_recognizer(self):
+        if self.model_type == "transducer":
+            recognizer = sherpa_onnx.OnlineRecognizer.from_transducer(
+                tokens=self.tokens,
+                encoder=self.encoder,
+                decoder=self.decoder,
+                joiner=self.joiner,
+                num_threads=self.num_threads,
+                sample_rate=self.SAMPLE_RATE,
+                feature_dim=self.feature_dim,
+                decoding_method=self.decoding_method,
+                hotwords_file=self.hotwords_file,
+                hotwords_score=self.hotwords_score,
+                modeling_unit=self.modeling_unit,
+                bpe_vocab=self.bpe_vocab,
+                blank_penalty=self.blank_penalty,
+                debug=self.debug,
+                provider=self.provider,
+            )
+        elif self.model_type == "paraformer":
+            recognizer = sherpa_onnx.OnlineRecognizer.from_paraformer(
+                tokens=self.tokens,
+                encoder=self.encoder,
+                decoder=self.decoder,
+                num_threads=self.num_threads,
+                sample_rate=self.SAMPLE_RATE,
+                feature_dim=self.feature_dim,
+                decoding_method=self.decoding_method,
+                debug=self.debug,
+                provider=self.provider,
+            )
+        elif self.model_type == "zipformer2_ctc":
+            recognizer = sherpa_onnx.OnlineRecognizer.from_zipformer2_ctc(
+                tokens=self.tokens,
+                model=self.zipformer2_ctc,
+                num_threads=self.num_threads,
+                sample_rate=self.SAMPLE_RATE,
+                feature_dim=self.feature_dim,
+                decoding_method=self.decoding_method,
+                debug=self.debug,
+                provider=self.provider,
+            )
+        else:
+            raise ValueError(f"Invalid model type: {self.model_type}")
+
+        return recognizer
+
+    def decode(self, stream) -> str:
+        """Decode the frames of a stream that are ready, return its text so far."""
+        while self.recognizer.is_ready(stream):
+            self.recognizer.decode_stream(stream)
+        return self.recognizer.get_result(stream)
+
+    def create_stream(self) -> OnlineASRStream:
+        return OnlineASRStream(self)
+
+    def transcribe_np(self, audio: np.ndarray) -> str:
+        stream = OnlineASRStream(self)
+        stream._accept(audio)
+        return stream._finalize()
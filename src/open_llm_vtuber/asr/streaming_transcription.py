@@ -0,0 +1,83 @@
+import asyncio
+import time
+from typing import Awaitable, Callable
+
+import numpy as np
+from loguru import logger
+
+from .asr_interface import ASRInterface, ASRStreamInterface
+
+
+class StreamingTranscription:
+    """
+    Transcription of one utterance of a client, recognized while it is spoken.
+
+    The WebSocket handler hands the speech audio to `feed()`, which never
+    blocks. A background task runs the chunks through the ASR stream in the
+    order they arrived and passes the partial text to `on_partial`. When
+    the utterance ends, only the audio not recognized yet is left to decode,
+    so with a streaming engine the transcription is ready shortly after the
+    user stops talking instead of after a pass over the whole utterance.
+    """
+
+    def __init__(
+        self,
+        stream: ASRStreamInterface,
+        on_partial: Callable[[str], Awaitable[None]] | None = None,
+    ):
+        self.stream = stream
+        self.on_partial = on_partial
+        self.partial_text = ""
+        self.fed_samples = 0
+        self._chunks: asyncio.Queue[np.ndarray | None] = asyncio.Queue()
+        self._finished = False
+        self._finished_at: float | None = None
+        self._task = asyncio.create_task(self._run())
+
+    def feed(self, audio: np.ndarray) -> None:
+        """Queue the next chunk of speech. Ignored once the utterance ended."""
+        if self._finished:
+            return
+        self.fed_samples += len(audio)
+        self._chunks.put_nowait(audio)
+
+    def finish(self) -> None:
+        """End the utterance: the transcription is finalized in the background."""
+        if not self._finished:
+            self._finished = True
+            self._finished_at = time.perf_counter()
+            self._chunks.put_nowait(None)
+
+    async def result(self) -> str:
+        """End the utterance if needed and wait for its transcription."""
+        self.finish()
+        return await self._task
+
+    def cancel(self) -> None:
+        """Drop the utterance, e.g. when the client disconnects."""
+        self._finished = True
+        self._task.cancel()
+
+    async def _run(self) -> str:
+        try:
+            while (chunk := await self._chunks.get()) is not None:
+                partial = await self.stream.accept(chunk)
+                if partial is not None and partial != self.partial_text:
+                    self.partial_text = partial
+                    await self._send_partial(partial)
+            text = await self.stream.finalize()
+            logger.debug(
+                f"Streaming ASR done {(time.perf_counter() - self._finished_at) * 1000:.0f} ms "
+                f"after the end of speech, for {self.fed_samples / ASRInterface.SAMPLE_RATE:.1f}s of audio"
+            )
+            return text
+        finally:
+            self.stream.close()
+
+    async def _send_partial(self, text: str) -> None:
+        if self.on_partial is None:
+            return
+        try:
+            await self.on_partial(text)
+        except Exception as e:
+            logger.warning(f"Failed to send partial transcription: {e}")
@@ -14,13 +14,18 @@ class VoiceRecognition(ASRInterface):
         print_realtime=False,
         print_progress=False,
         prompt: str = None,
+        n_threads: int = None,
     ) -> None:
+        params = {}
+        if n_threads:
+            params["n_threads"] = n_threads
         self.model = Model(
             model=model_name,
             models_dir=model_dir,
             language=language,
             print_realtime=print_realtime,
             print_progress=print_progress,
+            **params,
         )
         self.prompt = prompt
 
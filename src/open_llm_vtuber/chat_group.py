@@ -4,6 +4,8 @@ from fastapi import WebSocket
 import json
 from loguru import logger
 
+from .utils.payload_sender import dump_payload
+
 
 @dataclass
 class Group:
@@ -291,9 +293,11 @@ async def broadcast_to_group(
     exclude_uid: Optional[str] = None,
 ) -> None:
     """Broadcasts a message to all members in a group except the sender"""
+    # Serialized once for all members
+    text = dump_payload(message)
     for member_uid in group_members:
         if member_uid != exclude_uid and member_uid in client_connections:
             try:
-                await client_connections[member_uid].send_text(json.dumps(message))
+                await client_connections[member_uid].send_text(text)
             except Exception as e:
                 logger.error(f"Failed to broadcast to {member_uid}: {e}")
@@ -23,6 +23,7 @@ from .asr import (
     WhisperConfig,
     FunASRConfig,
     SherpaOnnxASRConfig,
+    SherpaOnnxOnlineASRConfig,
     GroqWhisperASRConfig,
 )
 from .tts import (
@@ -37,12 +38,19 @@ from .tts import (
     GPTSoVITSConfig,
     FishAPITTSConfig,
     SherpaOnnxTTSConfig,
+    TTSCacheConfig,
+    TTSSchedulerConfig,
+    TTSHttpConfig,
+    TTSBatchingConfig,
 )
 from .vad import (
     VADConfig,
     SileroVADConfig,
+    SileroVADOnnxConfig,
 )
 from .tts_preprocessor import TTSPreprocessorConfig, TranslatorConfig, DeepLXConfig
+from .warmup import WarmupConfig
+from .speculation import SpeculationConfig
 from .i18n import I18nMixin, Description, MultiLingualString
 from .agent import (
     AgentConfig,
@@ -92,6 +100,7 @@ __all__ = [
     "WhisperConfig",
     "FunASRConfig",
     "SherpaOnnxASRConfig",
+    "SherpaOnnxOnlineASRConfig",
     "GroqWhisperASRConfig",
     # TTS related classes
     "TTSConfig",
@@ -105,13 +114,20 @@ __all__ = [
     "GPTSoVITSConfig",
     "FishAPITTSConfig",
     "SherpaOnnxTTSConfig",
+    "TTSCacheConfig",
+    "TTSSchedulerConfig",
+    "TTSHttpConfig",
+    "TTSBatchingConfig",
     # VAD related classes
     "VADConfig",
     "SileroVADConfig",
+    "SileroVADOnnxConfig",
     # TTS preprocessor related classes
     "TTSPreprocessorConfig",
     "TranslatorConfig",
     "DeepLXConfig",
+    "WarmupConfig",
+    "SpeculationConfig",
     # i18n related classes
     "I18nMixin",
     "Description",
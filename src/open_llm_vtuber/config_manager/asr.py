@@ -36,6 +36,9 @@ class FasterWhisperConfig(I18nMixin):
         "int8", alias="compute_type"
     )
     prompt: str | None = Field(None, alias="prompt")
+    batch_size: int = Field(8, alias="batch_size", ge=1)
+    batch_window_ms: int = Field(20, alias="batch_window_ms", ge=0)
+    max_queue_depth: int = Field(32, alias="max_queue_depth", ge=1)
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "model_path": Description(
             en="Path to the Faster Whisper model", zh="Faster Whisper 模型路径"
@@ -59,6 +62,18 @@ class FasterWhisperConfig(I18nMixin):
             en="An initial prompt to provide context or guide the transcription. Language of the prompt should match the audio language.",
             zh="用于提供上下文或引导转录的初始提示词。提示词应与音频语言匹配。",
         ),
+        "batch_size": Description(
+            en="Maximum number of utterances from all clients transcribed in one batch (1 to disable batching)",
+            zh="所有客户端的语音在一个批次中转录的最大数量（设为 1 以禁用批处理）",
+        ),
+        "batch_window_ms": Description(
+            en="How long an utterance waits for others to batch with, in milliseconds",
+            zh="一段语音等待其他语音组成批次的时间（毫秒）",
+        ),
+        "max_queue_depth": Description(
+            en="Maximum number of utterances waiting for transcription before new ones are rejected as busy",
+            zh="等待转录的最大语音数量，超过后新的语音将因繁忙被拒绝",
+        ),
     }
 
 
@@ -71,6 +86,8 @@ class WhisperCPPConfig(I18nMixin):
     print_progress: bool = Field(False, alias="print_progress")
     language: str = Field("auto", alias="language")
     prompt: str | None = Field(None, alias="prompt")
+    n_threads: Optional[int] = Field(None, alias="n_threads")
+    replicas: int = Field(1, alias="replicas", ge=1)
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "model_name": Description(
             en="Name of the Whisper model", zh="Whisper 模型名称"
@@ -91,6 +108,14 @@ class WhisperCPPConfig(I18nMixin):
             en="An initial prompt to provide context or guide the transcription. Language of the prompt should match the audio language.",
             zh="用于提供上下文或引导转录的初始提示词。提示词应与音频语言匹配。",
         ),
+        "n_threads": Description(
+            en="Number of threads of each model instance (pywhispercpp's default if not set)",
+            zh="每个模型实例的线程数（未设置时使用 pywhispercpp 的默认值）",
+        ),
+        "replicas": Description(
+            en="Number of instances of the model, so that several users are transcribed at once. Each loads its own copy of the model; keep replicas × n_threads within the CPU cores",
+            zh="模型实例数，使多个用户的语音可以同时识别。每个实例加载一份模型；replicas × n_threads 不应超过 CPU 核心数",
+        ),
     }
 
 
@@ -125,6 +150,7 @@ class FunASRConfig(I18nMixin):
     device: Literal["cpu", "cuda"] = Field("cpu", alias="device")
     disable_update: bool = Field(True, alias="disable_update")
     ncpu: int = Field(4, alias="ncpu")
+    replicas: int = Field(1, alias="replicas", ge=1)
     hub: Literal["ms", "hf"] = Field("ms", alias="hub")
     use_itn: bool = Field(False, alias="use_itn")
     language: str = Field("auto", alias="language")
@@ -146,6 +172,10 @@ class FunASRConfig(I18nMixin):
             en="Number of CPU threads for internal operations",
             zh="内部操作的 CPU 线程数",
         ),
+        "replicas": Description(
+            en="Number of instances of the model, so that several users are transcribed at once. Each loads its own copy of the model; keep replicas × ncpu within the CPU cores",
+            zh="模型实例数，使多个用户的语音可以同时识别。每个实例加载一份模型；replicas × ncpu 不应超过 CPU 核心数",
+        ),
         "hub": Description(
             en="Model hub to use (ms for ModelScope, hf for Hugging Face)",
             zh="使用的模型仓库（ms 为 ModelScope，hf 为 Hugging Face）",
@@ -208,6 +238,7 @@ class SherpaOnnxASRConfig(I18nMixin):
     fire_red_asr_decoder: Optional[str] = Field(None, alias="fire_red_asr_decoder")
     tokens: str = Field(..., alias="tokens")
     num_threads: int = Field(4, alias="num_threads")
+    replicas: int = Field(1, alias="replicas", ge=1)
     use_itn: bool = Field(True, alias="use_itn")
     provider: Literal["cpu", "cuda", "rocm"] = Field("cpu", alias="provider")
 
@@ -250,6 +281,10 @@ class SherpaOnnxASRConfig(I18nMixin):
         ),
         "tokens": Description(en="Path to tokens file", zh="词元文件路径"),
         "num_threads": Description(en="Number of threads to use", zh="使用的线程数"),
+        "replicas": Description(
+            en="Number of instances of the model, so that several users are transcribed at once. Each loads its own copy of the model; keep replicas × num_threads within the CPU cores",
+            zh="模型实例数，使多个用户的语音可以同时识别。每个实例加载一份模型；replicas × num_threads 不应超过 CPU 核心数",
+        ),
         "use_itn": Description(
             en="Enable inverse text normalization", zh="启用反向文本归一化"
         ),
@@ -307,6 +342,86 @@ class SherpaOnnxASRConfig(I18nMixin):
         return values
 
 
+class SherpaOnnxOnlineASRConfig(I18nMixin):
+    """Configuration for Sherpa Onnx streaming ASR."""
+
+    model_type: Literal["transducer", "paraformer", "zipformer2_ctc"] = Field(
+        "transducer", alias="model_type"
+    )
+    encoder: Optional[str] = Field(None, alias="encoder")
+    decoder: Optional[str] = Field(None, alias="decoder")
+    joiner: Optional[str] = Field(None, alias="joiner")
+    zipformer2_ctc: Optional[str] = Field(None, alias="zipformer2_ctc")
+    tokens: str = Field(..., alias="tokens")
+    num_threads: int = Field(2, alias="num_threads")
+    decoding_method: Literal["greedy_search", "modified_beam_search"] = Field(
+        "greedy_search", alias="decoding_method"
+    )
+    hotwords_file: str = Field("", alias="hotwords_file")
+    hotwords_score: float = Field(1.5, alias="hotwords_score")
+    provider: Literal["cpu", "cuda", "rocm"] = Field("cpu", alias="provider")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "model_type": Description(
+            en="Type of streaming ASR model to use", zh="要使用的流式 ASR 模型类型"
+        ),
+        "encoder": Description(
+            en="Path to encoder model (for transducer and paraformer)",
+            zh="编码器模型路径（用于 transducer 和 paraformer）",
+        ),
+        "decoder": Description(
+            en="Path to decoder model (for transducer and paraformer)",
+            zh="解码器模型路径（用于 transducer 和 paraformer）",
+        ),
+        "joiner": Description(
+            en="Path to joiner model (for transducer)",
+            zh="连接器模型路径（用于 transducer）",
+        ),
+        "zipformer2_ctc": Description(
+            en="Path to zipformer2 CTC model", zh="Zipformer2 CTC 模型路径"
+        ),
+        "tokens": Description(en="Path to tokens file", zh="词元文件路径"),
+        "num_threads": Description(en="Number of threads to use", zh="使用的线程数"),
+        "decoding_method": Description(
+            en="Decoding method (greedy_search or modified_beam_search)",
+            zh="解码方法（greedy_search 或 modified_beam_search）",
+        ),
+        "hotwords_file": Description(
+            en="Path to hotwords file (transducer with modified_beam_search)",
+            zh="热词文件路径（用于 transducer 和 modified_beam_search）",
+        ),
+        "hotwords_score": Description(en="Score for hotwords", zh="热词分数"),
+        "provider": Description(
+            en="Provider for inference (cpu or cuda) (cuda option needs additional settings. Please check our docs)",
+            zh="推理平台（cpu 或 cuda）(cuda 需要额外配置，请参考文档)",
+        ),
+    }
+
+    @model_validator(mode="after")
+    def check_model_paths(
+        cls, values: "SherpaOnnxOnlineASRConfig", info: ValidationInfo
+    ):
+        model_type = values.model_type
+
+        if model_type == "transducer":
+            if not all([values.encoder, values.decoder, values.joiner]):
+                raise ValueError(
+                    "encoder, decoder and joiner must be provided for transducer model type"
+                )
+        elif model_type == "paraformer":
+            if not all([values.encoder, values.decoder]):
+                raise ValueError(
+                    "encoder and decoder must be provided for paraformer model type"
+                )
+        elif model_type == "zipformer2_ctc":
+            if not values.zipformer2_ctc:
+                raise ValueError(
+                    "zipformer2_ctc must be provided for zipformer2_ctc model type"
+                )
+
+        return values
+
+
 class ASRConfig(I18nMixin):
     """Configuration for Automatic Speech Recognition."""
 
@@ -318,6 +433,7 @@ class ASRConfig(I18nMixin):
         "fun_asr",
         "groq_whisper_asr",
         "sherpa_onnx_asr",
+        "sherpa_onnx_online_asr",
     ] = Field(..., alias="asr_model")
     azure_asr: Optional[AzureASRConfig] = Field(None, alias="azure_asr")
     faster_whisper: Optional[FasterWhisperConfig] = Field(None, alias="faster_whisper")
@@ -330,6 +446,9 @@ class ASRConfig(I18nMixin):
     sherpa_onnx_asr: Optional[SherpaOnnxASRConfig] = Field(
         None, alias="sherpa_onnx_asr"
     )
+    sherpa_onnx_online_asr: Optional[SherpaOnnxOnlineASRConfig] = Field(
+        None, alias="sherpa_onnx_online_asr"
+    )
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "asr_model": Description(
@@ -350,6 +469,10 @@ class ASRConfig(I18nMixin):
         "sherpa_onnx_asr": Description(
             en="Configuration for Sherpa Onnx ASR", zh="Sherpa Onnx ASR 配置"
         ),
+        "sherpa_onnx_online_asr": Description(
+            en="Configuration for Sherpa Onnx streaming ASR, which recognizes speech while the user talks",
+            zh="Sherpa Onnx 流式 ASR 配置，在用户说话时即进行识别",
+        ),
     }
 
     @model_validator(mode="after")
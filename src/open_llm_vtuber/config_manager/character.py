@@ -8,6 +8,8 @@ from .vad import VADConfig
 from .tts_preprocessor import TTSPreprocessorConfig
 
 from .agent import AgentConfig
+from .warmup import WarmupConfig
+from .speculation import SpeculationConfig
 
 
 class CharacterConfig(I18nMixin):
@@ -27,6 +29,10 @@ class CharacterConfig(I18nMixin):
     tts_preprocessor_config: TTSPreprocessorConfig = Field(
         ..., alias="tts_preprocessor_config"
     )
+    warmup: WarmupConfig = Field(default_factory=WarmupConfig, alias="warmup")
+    speculation: SpeculationConfig = Field(
+        default_factory=SpeculationConfig, alias="speculation"
+    )
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "conf_name": Description(
@@ -61,6 +67,14 @@ class CharacterConfig(I18nMixin):
             en="Configuration for Text-to-Speech Preprocessor",
             zh="语音合成预处理器配置",
         ),
+        "warmup": Description(
+            en="Warm-up of the engines when they are loaded",
+            zh="加载引擎时的预热",
+        ),
+        "speculation": Description(
+            en="Starting the reply before the transcription is final",
+            zh="在转录完成前提前生成回复",
+        ),
         "human_name": Description(
             en="Name of the human user in conversation", zh="对话中人类用户的名字"
         ),
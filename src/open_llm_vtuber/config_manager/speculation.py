@@ -0,0 +1,22 @@
+# config_manager/speculation.py
+from pydantic import Field
+from typing import Dict, ClassVar
+from .i18n import I18nMixin, Description
+
+
+class SpeculationConfig(I18nMixin):
+    """Configuration for starting the reply before the transcription is final."""
+
+    enabled: bool = Field(False, alias="enabled")
+    stable_ms: int = Field(300, alias="stable_ms", ge=0)
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "enabled": Description(
+            en="Start generating the reply on the partial transcription while the user is still talking (needs a streaming ASR such as sherpa_onnx_online_asr). The reply is kept if the final transcription matches, and regenerated otherwise",
+            zh="在用户说话时根据部分转录提前生成回复（需要流式 ASR，如 sherpa_onnx_online_asr）。最终转录一致时保留该回复，否则重新生成",
+        ),
+        "stable_ms": Description(
+            en="How long the partial transcription must stay unchanged before the reply is started, in milliseconds",
+            zh="部分转录保持不变多久后开始生成回复（毫秒）",
+        ),
+    }
@@ -596,6 +596,7 @@ class ElevenLabsTTSConfig(I18nMixin):
     similarity_boost: float = Field(0.5, alias="similarity_boost")
     style: float = Field(0.0, alias="style")
     use_speaker_boost: bool = Field(True, alias="use_speaker_boost")
+    websocket: bool = Field(False, alias="websocket")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "api_key": Description(
@@ -627,6 +628,10 @@ class ElevenLabsTTSConfig(I18nMixin):
             en="Enable speaker boost for better quality",
             zh="启用说话人增强以获得更好的质量",
         ),
+        "websocket": Description(
+            en="Stream sentences over persistent WebSocket connections (PCM output) instead of one HTTP request each",
+            zh="通过持久的 WebSocket 连接流式合成句子（PCM 输出），而不是每句一个 HTTP 请求",
+        ),
     }
 
 
@@ -644,6 +649,7 @@ class CartesiaTTSConfig(I18nMixin):
     emotion: CartesiaEmotions = Field("neutral", alias="emotion")
     volume: float = Field(1.0, alias="volume")
     speed: float = Field(1.0, alias="speed")
+    websocket: bool = Field(False, alias="websocket")
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "api_key": Description(
@@ -677,6 +683,114 @@ class CartesiaTTSConfig(I18nMixin):
             en="Speed of the generation, ranging from 0.6 to 1.5 (e.g., 1)",
             zh="生成的速度，范围从 0.6 到 1.5（如 1）",
         ),
+        "websocket": Description(
+            en="Stream sentences over persistent WebSocket connections (PCM output) instead of one HTTP request each",
+            zh="通过持久的 WebSocket 连接流式合成句子（PCM 输出），而不是每句一个 HTTP 请求",
+        ),
+    }
+
+
+class TTSCacheConfig(I18nMixin):
+    """Configuration for the cache of synthesized sentences."""
+
+    enabled: bool = Field(False, alias="enabled")
+    max_memory_mb: float = Field(64, alias="max_memory_mb")
+    disk_cache_dir: str = Field("", alias="disk_cache_dir")
+    max_disk_mb: float = Field(512, alias="max_disk_mb")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "enabled": Description(
+            en="Reuse the audio of sentences that were already synthesized",
+            zh="复用已合成过的句子的音频",
+        ),
+        "max_memory_mb": Description(
+            en="Maximum size of the in-memory cache in MB",
+            zh="内存缓存的最大大小（MB）",
+        ),
+        "disk_cache_dir": Description(
+            en="Directory to keep cached audio across restarts (empty to disable)",
+            zh="用于在重启后保留缓存音频的目录（留空则禁用）",
+        ),
+        "max_disk_mb": Description(
+            en="Maximum size of the disk cache in MB",
+            zh="磁盘缓存的最大大小（MB）",
+        ),
+    }
+
+
+class TTSSchedulerConfig(I18nMixin):
+    """Configuration for how many sentences are synthesized at once."""
+
+    max_concurrency: int = Field(4, alias="max_concurrency", ge=1)
+    max_concurrency_per_session: int = Field(
+        2, alias="max_concurrency_per_session", ge=1
+    )
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "max_concurrency": Description(
+            en="Maximum number of sentences synthesized at once, across all clients",
+            zh="所有客户端同时合成的最大句子数",
+        ),
+        "max_concurrency_per_session": Description(
+            en="Maximum number of sentences synthesized at once for one conversation",
+            zh="单个对话同时合成的最大句子数",
+        ),
+    }
+
+
+class TTSBatchingConfig(I18nMixin):
+    """Configuration for synthesizing several sentences in one call."""
+
+    enabled: bool = Field(False, alias="enabled")
+    max_sentences: int = Field(4, alias="max_sentences", ge=2)
+    window_ms: int = Field(80, alias="window_ms", ge=0)
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "enabled": Description(
+            en="Synthesize sentences queued close together in one call, for engines that batch them (sherpa_onnx_tts, gpt_sovits_tts)",
+            zh="对于支持批量合成的引擎（sherpa_onnx_tts、gpt_sovits_tts），将相近时间排队的句子合并为一次调用合成",
+        ),
+        "max_sentences": Description(
+            en="Maximum number of sentences in one call",
+            zh="一次调用中的最大句子数",
+        ),
+        "window_ms": Description(
+            en="How long the first sentence of a batch waits for more, in milliseconds",
+            zh="批次中的第一句等待更多句子的时间（毫秒）",
+        ),
+    }
+
+
+class TTSHttpConfig(I18nMixin):
+    """Configuration for the HTTP client of the engines that call a TTS server."""
+
+    max_connections: int = Field(32, alias="max_connections", ge=1)
+    max_connections_per_host: int = Field(8, alias="max_connections_per_host", ge=1)
+    timeout: float = Field(120, alias="timeout", gt=0)
+    connect_timeout: float = Field(10, alias="connect_timeout", gt=0)
+    retries: int = Field(2, alias="retries", ge=0)
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "max_connections": Description(
+            en="Maximum number of open connections to TTS servers",
+            zh="与 TTS 服务器的最大连接数",
+        ),
+        "max_connections_per_host": Description(
+            en="Maximum number of open connections to one TTS server",
+            zh="与单个 TTS 服务器的最大连接数",
+        ),
+        "timeout": Description(
+            en="Seconds to wait for the audio of a sentence",
+            zh="等待一句音频的秒数",
+        ),
+        "connect_timeout": Description(
+            en="Seconds to wait for a connection to the TTS server",
+            zh="等待连接 TTS 服务器的秒数",
+        ),
+        "retries": Description(
+            en="Retries of a request that failed to connect or got a 429/502/503/504",
+            zh="连接失败或返回 429/502/503/504 时的重试次数",
+        ),
     }
 
 
@@ -703,6 +817,8 @@ class TTSConfig(I18nMixin):
         "cartesia_tts",
         "piper_tts",
     ] = Field(..., alias="tts_model")
+    streaming: bool = Field(False, alias="streaming")
+    worker_processes: int = Field(0, alias="worker_processes", ge=0)
 
     azure_tts: Optional[AzureTTSConfig] = Field(None, alias="azure_tts")
     bark_tts: Optional[BarkTTSConfig] = Field(None, alias="bark_tts")
@@ -726,11 +842,29 @@ class TTSConfig(I18nMixin):
     elevenlabs_tts: ElevenLabsTTSConfig | None = Field(None, alias="elevenlabs_tts")
     cartesia_tts: CartesiaTTSConfig | None = Field(None, alias="cartesia_tts")
     piper_tts: Optional[PiperTTSConfig] = Field(None, alias="piper_tts")
+    tts_cache: TTSCacheConfig = Field(default_factory=TTSCacheConfig, alias="tts_cache")
+    tts_scheduler: TTSSchedulerConfig = Field(
+        default_factory=TTSSchedulerConfig, alias="tts_scheduler"
+    )
+    http_client: TTSHttpConfig = Field(
+        default_factory=TTSHttpConfig, alias="http_client"
+    )
+    batching: TTSBatchingConfig = Field(
+        default_factory=TTSBatchingConfig, alias="batching"
+    )
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "tts_model": Description(
             en="Text-to-speech model to use", zh="要使用的文本转语音模型"
         ),
+        "streaming": Description(
+            en="Send audio in chunks while a sentence is synthesized, for engines that can stream (requires a frontend that handles audio-chunk messages)",
+            zh="在句子合成过程中分块发送音频，适用于支持流式输出的引擎（需要前端支持 audio-chunk 消息）",
+        ),
+        "worker_processes": Description(
+            en="Number of worker processes that each load the TTS engine (0 to run it in the server process)",
+            zh="各自加载 TTS 引擎的工作进程数（0 表示在服务器进程中运行）",
+        ),
         "azure_tts": Description(en="Configuration for Azure TTS", zh="Azure TTS 配置"),
         "bark_tts": Description(en="Configuration for Bark TTS", zh="Bark TTS 配置"),
         "edge_tts": Description(en="Configuration for Edge TTS", zh="Edge TTS 配置"),
@@ -769,6 +903,20 @@ class TTSConfig(I18nMixin):
             en="Configuration for Cartesia TTS", zh="Cartesia TTS 配置"
         ),
         "piper_tts": Description(en="Configuration for Piper TTS", zh="Piper TTS 配置"),
+        "tts_cache": Description(
+            en="Cache of synthesized sentences", zh="已合成句子的缓存"
+        ),
+        "tts_scheduler": Description(
+            en="Limits on concurrent speech synthesis", zh="语音合成的并发限制"
+        ),
+        "http_client": Description(
+            en="HTTP client of the engines that call a TTS server",
+            zh="调用 TTS 服务器的引擎所用的 HTTP 客户端",
+        ),
+        "batching": Description(
+            en="Synthesis of several sentences in one call",
+            zh="一次调用合成多个句子",
+        ),
     }
 
     @model_validator(mode="after")
@@ -38,11 +38,35 @@ class SileroVADConfig(I18nMixin):
     }
 
 
+class SileroVADOnnxConfig(SileroVADConfig):
+    """Configuration for Silero VAD running on onnxruntime (no PyTorch)."""
+
+    model_path: str = Field("./models/silero_vad.onnx", alias="model_path")
+    num_threads: int = Field(1, alias="num_threads")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        **SileroVADConfig.DESCRIPTIONS,
+        "model_path": Description(
+            en="Path to the Silero VAD ONNX model (downloaded if missing)",
+            zh="Silero VAD ONNX 模型路径（不存在时自动下载）",
+        ),
+        "num_threads": Description(
+            en="Number of CPU threads used by onnxruntime",
+            zh="onnxruntime 使用的 CPU 线程数",
+        ),
+    }
+
+
 class VADConfig(I18nMixin):
     """Configuration for Automatic Speech Recognition."""
 
-    vad_model: Optional[Literal["silero_vad"]] = Field(None, alias="vad_model")
+    vad_model: Optional[Literal["silero_vad", "silero_vad_onnx"]] = Field(
+        None, alias="vad_model"
+    )
     silero_vad: Optional[SileroVADConfig] = Field(None, alias="silero_vad")
+    silero_vad_onnx: Optional[SileroVADOnnxConfig] = Field(
+        None, alias="silero_vad_onnx"
+    )
 
     DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
         "vad_model": Description(
@@ -51,14 +75,20 @@ class VADConfig(I18nMixin):
         "silero_vad": Description(
             en="Configuration for Silero VAD", zh="Silero VAD 配置"
         ),
+        "silero_vad_onnx": Description(
+            en="Configuration for Silero VAD (ONNX runtime)",
+            zh="Silero VAD（ONNX 运行时）配置",
+        ),
     }
 
     @model_validator(mode="after")
     def check_asr_config(cls, values: "VADConfig", info: ValidationInfo):
-        vad_model = values.silero_vad
+        vad_model = values.vad_model
 
         # Only validate the selected ASR model
         if vad_model == "silero_vad" and values.silero_vad is not None:
             values.silero_vad.model_validate(values.silero_vad.model_dump())
+        elif vad_model == "silero_vad_onnx" and values.silero_vad_onnx is not None:
+            values.silero_vad_onnx.model_validate(values.silero_vad_onnx.model_dump())
 
         return values
@@ -0,0 +1,32 @@
+# config_manager/warmup.py
+from pydantic import Field
+from typing import Dict, ClassVar, List
+from .i18n import I18nMixin, Description
+
+
+class WarmupConfig(I18nMixin):
+    """Configuration for warming up the engines when they are loaded."""
+
+    enabled: bool = Field(True, alias="enabled")
+    remote_engines: bool = Field(False, alias="remote_engines")
+    tts_text: str = Field("", alias="tts_text")
+    phrases: List[str] = Field(default_factory=list, alias="phrases")
+
+    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
+        "enabled": Description(
+            en="Run one dummy inference through the ASR, VAD and TTS engines when they are loaded, so the first visitor does not wait for their cold start",
+            zh="加载 ASR、VAD 和 TTS 引擎时先进行一次空推理，使第一位访客无需等待冷启动",
+        ),
+        "remote_engines": Description(
+            en="Also warm up engines that call a remote API (Azure, Groq, OpenAI, ElevenLabs...). Each warm-up is a request, billed by most providers, on every start and character switch",
+            zh="同时预热调用远程 API 的引擎（Azure、Groq、OpenAI、ElevenLabs 等）。每次启动和切换角色时都会发送一次请求，大多数服务商会对此计费",
+        ),
+        "tts_text": Description(
+            en="Text synthesized to warm up the TTS engine, in a language it speaks. Empty to skip the TTS warm-up",
+            zh="用于预热 TTS 引擎的文本，需为该引擎支持的语言。留空则不预热 TTS",
+        ),
+        "phrases": Description(
+            en="Phrases synthesized into the TTS cache in advance, e.g. greetings the character often says",
+            zh="预先合成到 TTS 缓存中的短语，例如角色常说的问候语",
+        ),
+    }
@@ -6,11 +6,15 @@ import numpy as np
 from fastapi import WebSocket
 from loguru import logger
 
+from ..asr.streaming_transcription import StreamingTranscription
 from ..chat_group import ChatGroupManager
 from ..chat_history_manager import store_message
 from ..service_context import ServiceContext
+from ..utils.audio_buffer import AudioBuffer
+from ..utils.payload_sender import ClientSender
 from .group_conversation import process_group_conversation
 from .single_conversation import process_single_conversation
+from .speculation import LLMSpeculation
 from .conversation_utils import EMOJI_LIST
 from .types import GroupConversationState
 from prompts import prompt_loader
@@ -25,12 +29,15 @@ async def handle_conversation_trigger(
     client_contexts: Dict[str, ServiceContext],
     client_connections: Dict[str, WebSocket],
     chat_group_manager: ChatGroupManager,
-    received_data_buffers: Dict[str, np.ndarray],
+    received_data_buffers: Dict[str, AudioBuffer],
     current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
     broadcast_to_group: Callable,
+    transcriptions: Optional[Dict[str, StreamingTranscription]] = None,
+    speculations: Optional[Dict[str, LLMSpeculation]] = None,
 ) -> None:
     """Handle triggers that start a conversation"""
     metadata = None
+    speculation = None
 
     if msg_type == "ai-speak-signal":
         try:
@@ -65,14 +72,20 @@ async def handle_conversation_trigger(
     elif msg_type == "text-input":
         user_input = data.get("text", "")
     else:  # mic-audio-end
-        user_input = received_data_buffers[client_uid]
-        received_data_buffers[client_uid] = np.array([])
+        user_input = received_data_buffers[client_uid].take()
+        transcription = (transcriptions or {}).pop(client_uid, None)
+        if transcription is not None:
+            # Recognized while the user spoke, the audio is not needed
+            user_input = transcription
+            speculation = (speculations or {}).pop(client_uid, None)
 
     images = data.get("images")
     session_emoji = np.random.choice(EMOJI_LIST)
 
     group = chat_group_manager.get_client_group(client_uid)
     if group and len(group.members) > 1:
+        if speculation:
+            speculation.cancel()
         # Use group_id as task key for group conversations
         task_key = group.group_id
         if (
@@ -99,12 +112,13 @@ async def handle_conversation_trigger(
         current_conversation_tasks[client_uid] = asyncio.create_task(
             process_single_conversation(
                 context=context,
-                websocket_send=websocket.send_text,
+                websocket_send=ClientSender.for_websocket(websocket),
                 client_uid=client_uid,
                 user_input=user_input,
                 images=images,
                 session_emoji=session_emoji,
                 metadata=metadata,
+                speculation=speculation,
             )
         )
 
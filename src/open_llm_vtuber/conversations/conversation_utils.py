@@ -11,9 +11,11 @@ from .tts_manager import TTSTaskManager
 from ..agent.output_types import SentenceOutput, AudioOutput
 from ..agent.input_types import BatchInput, TextData, ImageData, TextSource, ImageSource
 from ..asr.asr_interface import ASRInterface
+from ..asr.streaming_transcription import StreamingTranscription
 from ..live2d_model import Live2dModel
 from ..tts.tts_interface import TTSInterface
 from ..utils.stream_audio import prepare_audio_payload
+from ..utils.payload_sender import send_payload
 
 
 # Convert class methods to standalone functions
@@ -126,7 +128,7 @@ async def handle_audio_output(
             display_text=display_text,
             actions=actions.to_dict() if actions else None,
         )
-        await websocket_send(json.dumps(audio_payload))
+        await send_payload(websocket_send, audio_payload)
     return full_response
 
 
@@ -144,14 +146,17 @@ async def send_conversation_start_signals(websocket_send: WebSocketSend) -> None
 
 
 async def process_user_input(
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, np.ndarray, StreamingTranscription],
     asr_engine: ASRInterface,
     websocket_send: WebSocketSend,
 ) -> str:
     """Process user input, converting audio to text if needed"""
-    if isinstance(user_input, np.ndarray):
+    if isinstance(user_input, (np.ndarray, StreamingTranscription)):
         logger.info("Transcribing audio input...")
-        input_text = await asr_engine.async_transcribe_np(user_input)
+        if isinstance(user_input, StreamingTranscription):
+            input_text = await user_input.result()
+        else:
+            input_text = await asr_engine.async_transcribe_np(user_input)
         await websocket_send(
             json.dumps({"type": "user-input-transcription", "text": input_text})
         )
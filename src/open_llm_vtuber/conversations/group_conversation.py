@@ -21,8 +21,10 @@ from .types import (
     BroadcastContext,
     WebSocketSend,
 )
+from ..asr.streaming_transcription import StreamingTranscription
 from ..service_context import ServiceContext
 from ..chat_history_manager import store_message
+from ..utils.payload_sender import ClientSender
 from .tts_manager import TTSTaskManager
 
 
@@ -32,7 +34,7 @@ async def process_group_conversation(
     broadcast_func: BroadcastFunc,
     group_members: List[str],
     initiator_client_uid: str,
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, np.ndarray, StreamingTranscription],
     images: Optional[List[Dict[str, Any]]] = None,
     session_emoji: str = np.random.choice(EMOJI_LIST),
     metadata: Optional[Dict[str, Any]] = None,
@@ -51,7 +53,15 @@ async def process_group_conversation(
         metadata: Optional metadata for special processing flags
     """
     # Create TTSTaskManager for each member
-    tts_managers = {uid: TTSTaskManager() for uid in group_members}
+    tts_managers = {
+        uid: TTSTaskManager(
+            tts_cache=client_contexts[uid].tts_cache,
+            tts_scheduler=client_contexts[uid].tts_scheduler,
+            streaming=client_contexts[uid].character_config.tts_config.streaming,
+            batching=client_contexts[uid].character_config.tts_config.batching,
+        )
+        for uid in group_members
+    }
 
     try:
         logger.info(f"Group Conversation Chain {session_emoji} started!")
@@ -189,7 +199,7 @@ def init_group_conversation_contexts(
 
 
 async def process_group_input(
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, np.ndarray, StreamingTranscription],
     initiator_context: ServiceContext,
     initiator_ws_send: WebSocketSend,
     broadcast_func: BroadcastFunc,
@@ -241,7 +251,7 @@ async def handle_group_member_turn(
     await broadcast_thinking_state(broadcast_func, group_members)
 
     context = client_contexts[current_member_uid]
-    current_ws_send = client_connections[current_member_uid].send_text
+    current_ws_send = ClientSender.for_websocket(client_connections[current_member_uid])
 
     new_messages = state.conversation_history[state.memory_index[current_member_uid] :]
     new_context = "\n".join(new_messages) if new_messages else ""
@@ -15,7 +15,9 @@ from .conversation_utils import (
 )
 from .types import WebSocketSend
 from .tts_manager import TTSTaskManager
+from .speculation import LLMSpeculation
 from ..chat_history_manager import store_message
+from ..asr.streaming_transcription import StreamingTranscription
 from ..service_context import ServiceContext
 
 # Import necessary types from agent outputs
@@ -26,10 +28,11 @@ async def process_single_conversation(
     context: ServiceContext,
     websocket_send: WebSocketSend,
     client_uid: str,
-    user_input: Union[str, np.ndarray],
+    user_input: Union[str, np.ndarray, StreamingTranscription],
     images: Optional[List[Dict[str, Any]]] = None,
     session_emoji: str = np.random.choice(EMOJI_LIST),
     metadata: Optional[Dict[str, Any]] = None,
+    speculation: Optional[LLMSpeculation] = None,
 ) -> str:
     """Process a single-user conversation turn
 
@@ -41,12 +44,18 @@ async def process_single_conversation(
         images: Optional list of image data
         session_emoji: Emoji identifier for the conversation
         metadata: Optional metadata for special processing flags
+        speculation: Reply started on the partial transcription, if any
 
     Returns:
         str: Complete response text
     """
     # Create TTSTaskManager for this conversation
-    tts_manager = TTSTaskManager()
+    tts_manager = TTSTaskManager(
+        tts_cache=context.tts_cache,
+        tts_scheduler=context.tts_scheduler,
+        streaming=context.character_config.tts_config.streaming,
+        batching=context.character_config.tts_config.batching,
+    )
     full_response = ""  # Initialize full_response here
 
     try:
@@ -87,7 +96,13 @@ async def process_single_conversation(
 
         try:
             # agent.chat yields Union[SentenceOutput, Dict[str, Any]]
-            agent_output_stream = context.agent_engine.chat(batch_input)
+            agent_output_stream = None
+            if speculation:
+                agent_output_stream = await speculation.take(
+                    input_text, context.agent_engine, images
+                )
+            if agent_output_stream is None:
+                agent_output_stream = context.agent_engine.chat(batch_input)
 
             async for output_item in agent_output_stream:
                 if (
@@ -171,4 +186,6 @@ async def process_single_conversation(
         )
         raise
     finally:
+        if speculation:
+            speculation.cancel()
         cleanup_conversation(tts_manager, session_emoji)
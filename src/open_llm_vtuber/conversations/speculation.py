@@ -0,0 +1,193 @@
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from loguru import logger
+
+from ..agent.agents.agent_interface import AgentInterface
+from .conversation_utils import create_batch_input
+
+_END = object()
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+@dataclass
+class SpeculationStats:
+    """Outcome of the speculative replies of all clients."""
+
+    hits: int = 0
+    misses: int = 0
+    restarts: int = 0
+    total_saved: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        turns = self.hits + self.misses
+        return self.hits / turns if turns else 0.0
+
+
+class LLMSpeculation:
+    """
+    Starts the reply to an utterance before its transcription is final.
+
+    `update()` gets the partial transcriptions of the utterance. Once one
+    has stayed unchanged for `stable_ms` (and `can_start()` allows it, i.e.
+    no reply is playing), the agent's chat is started on it and its output
+    is buffered. When the final transcription arrives, `take()` hands the
+    buffered stream to the conversation if the text matches, so the LLM's
+    time to first token is already behind it. Otherwise the speculative
+    reply is cancelled and the conversation starts over.
+
+    Until the reply is taken, the agent holds back the changes it makes to
+    its memory in the token of the reply (see
+    `AgentInterface.supports_speculation`), so a discarded reply leaves no
+    trace, even with other clients talking to the same agent.
+    """
+
+    def __init__(
+        self,
+        agent_engine: AgentInterface,
+        from_name: str,
+        stable_ms: float,
+        stats: SpeculationStats,
+        can_start: Callable[[], bool] = lambda: True,
+    ):
+        self.agent_engine = agent_engine
+        self.from_name = from_name
+        self.stable_ms = stable_ms
+        self.stats = stats
+        self.can_start = can_start
+
+        self._latest = ""
+        self._text: str | None = None  # text the running reply was started on
+        self._outputs: asyncio.Queue = asyncio.Queue()
+        self._timer: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+        self._token = None  # agent's token of the running reply
+        self._started_at = 0.0
+        self._first_output_at: float | None = None
+        self._taken = False
+
+    async def update(self, text: str) -> None:
+        """Take the latest partial transcription of the utterance."""
+        if self._taken or _normalize(text) == _normalize(self._latest):
+            return
+        self._latest = text
+        if self._timer:
+            self._timer.cancel()
+        if self._text is not None:
+            # The user said more, the running reply is for an outdated text
+            self.stats.restarts += 1
+            await self._discard()
+        if text.strip():
+            self._timer = asyncio.create_task(self._start_when_stable(text))
+
+    async def take(
+        self,
+        text: str,
+        agent_engine: AgentInterface,
+        images: Optional[List[Dict[str, Any]]] = None,
+    ) -> Optional[AsyncIterator[Any]]:
+        """
+        Hand over the reply if it was started on the final transcription.
+
+        Returns:
+            The agent's output stream, with the outputs buffered so far, or
+            None if there is no matching reply (it is then discarded).
+        """
+        if self._timer:
+            self._timer.cancel()
+        if self._text is None:
+            return None
+        if (
+            images
+            or agent_engine is not self.agent_engine
+            or _normalize(text) != _normalize(self._text)
+        ):
+            self.stats.misses += 1
+            logger.info(
+                f"Speculative reply discarded, started on '{self._text}' "
+                f"(hit rate {self.stats.hits}/{self.stats.hits + self.stats.misses})"
+            )
+            await self._discard()
+            return None
+
+        self._taken = True
+        self.agent_engine.commit_speculation(self._token)
+        # The LLM had a head start of the time since the reply was started,
+        # at most the time its first output took
+        now = time.perf_counter()
+        saved = (self._first_output_at or now) - self._started_at
+        self.stats.hits += 1
+        self.stats.total_saved += saved
+        logger.info(
+            f"Speculative reply used, {saved * 1000:.0f} ms saved "
+            f"(hit rate {self.stats.hits}/{self.stats.hits + self.stats.misses}, "
+            f"{self.stats.total_saved / self.stats.hits * 1000:.0f} ms saved on average)"
+        )
+        return self._replay()
+
+    def cancel(self) -> None:
+        """Drop the speculative reply, unless it was taken by the conversation."""
+        if self._timer:
+            self._timer.cancel()
+        if self._taken or self._text is None:
+            return
+        self._task.cancel()
+        self.agent_engine.abort_speculation(self._token)
+        self._text = None
+
+    async def _start_when_stable(self, text: str) -> None:
+        await asyncio.sleep(self.stable_ms / 1000)
+        if not self.can_start():
+            return
+        logger.debug(f"Starting speculative reply on '{text}'")
+        self._token = self.agent_engine.begin_speculation()
+        self._text = text
+        self._started_at = time.perf_counter()
+        self._first_output_at = None
+        self._outputs = asyncio.Queue()
+        batch_input = create_batch_input(
+            input_text=text, images=None, from_name=self.from_name
+        )
+        self._task = asyncio.create_task(
+            self._run(batch_input, self._token, self._outputs)
+        )
+
+    async def _run(self, batch_input, token, outputs: asyncio.Queue) -> None:
+        """Buffer the outputs of the agent's chat."""
+        try:
+            async for output in self.agent_engine.chat(batch_input, speculation=token):
+                if self._first_output_at is None:
+                    self._first_output_at = time.perf_counter()
+                outputs.put_nowait(output)
+        except Exception as e:
+            outputs.put_nowait(e)  # raised to the conversation
+        outputs.put_nowait(_END)
+
+    async def _replay(self) -> AsyncIterator[Any]:
+        try:
+            while (output := await self._outputs.get()) is not _END:
+                if isinstance(output, Exception):
+                    raise output
+                yield output
+        finally:
+            # The conversation was interrupted: stop generating the reply
+            if not self._task.done():
+                self._task.cancel()
+
+    async def _discard(self) -> None:
+        """Cancel the running reply and drop its memory changes."""
+        task, self._task = self._task, None
+        self._text = None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self.agent_engine.abort_speculation(self._token)
@@ -1,23 +1,67 @@
 import asyncio
-import json
+import contextlib
 import re
-import uuid
-from datetime import datetime
+import time
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict
 from loguru import logger
 
 from ..agent.output_types import DisplayText, Actions
+from ..config_manager import TTSBatchingConfig
 from ..live2d_model import Live2dModel
-from ..tts.tts_interface import TTSInterface
-from ..utils.stream_audio import prepare_audio_payload
+from ..tts.tts_interface import TTSInterface, SynthesizedAudio
+from ..tts.tts_cache import TTSCache
+from ..tts.tts_scheduler import TTSScheduler
+from ..utils.stream_audio import (
+    AudioChunkEncoder,
+    EncodedAudio,
+    encode_audio,
+    prepare_audio_payload,
+    prepare_audio_chunk_payload,
+)
+from ..utils.payload_sender import send_payload
 from .types import WebSocketSend
 
 
+@dataclass
+class _BatchItem:
+    tts_text: str
+    display_text: DisplayText
+    actions: Optional[Actions]
+    sequence_number: int
+
+
+@dataclass
+class _PendingBatch:
+    """Sentences waiting to be synthesized together"""
+
+    items: List[_BatchItem] = field(default_factory=list)
+    # Set when the batch has max_sentences, to stop waiting for more
+    full: asyncio.Event = field(default_factory=asyncio.Event)
+
+
 class TTSTaskManager:
     """Manages TTS tasks and ensures ordered delivery to frontend while allowing parallel TTS generation"""
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        tts_cache: Optional[TTSCache] = None,
+        streaming: bool = False,
+        tts_scheduler: Optional[TTSScheduler] = None,
+        batching: Optional[TTSBatchingConfig] = None,
+    ) -> None:
+        self.tts_cache = tts_cache
+        # Shared with other sessions. Without it, all sentences are
+        # synthesized at once.
+        self.tts_scheduler = tts_scheduler
+        # Send audio in chunks as it is synthesized, if the engine can stream
+        self.streaming = streaming
+        # Synthesize sentences queued close together in one call, if the
+        # engine supports it
+        self.batching = batching
+        self._open_batch: Optional[_PendingBatch] = None
         self.task_list: List[asyncio.Task] = []
+        self._stats_task: Optional[asyncio.Task] = None
         self._lock = asyncio.Lock()
         # Queue to store ordered payloads
         self._payload_queue: asyncio.Queue[Dict] = asyncio.Queue()
@@ -76,9 +120,22 @@ class TTSTaskManager:
                 self._process_payload_queue(websocket_send)
             )
 
+        if self._should_batch(tts_engine):
+            self._add_to_batch(
+                _BatchItem(tts_text, display_text, actions, current_sequence),
+                live2d_model,
+                tts_engine,
+            )
+            return
+
         # Create and queue the TTS task
+        process = (
+            self._process_tts_stream
+            if self.streaming and tts_engine.supports_streaming
+            else self._process_tts
+        )
         task = asyncio.create_task(
-            self._process_tts(
+            process(
                 tts_text=tts_text,
                 display_text=display_text,
                 actions=actions,
@@ -93,19 +150,30 @@ class TTSTaskManager:
         """
         Process and send payloads in correct order.
         Runs continuously until all payloads are processed.
+
+        A sentence is sent as one payload, or as several audio chunks when
+        streaming. Payloads of the current sentence are sent as they arrive;
+        those of later sentences wait until its last payload is sent.
         """
-        buffered_payloads: Dict[int, Dict] = {}
+        buffered_payloads: Dict[int, List[Dict]] = {}
+        finished_sequences = set()
 
         while True:
             try:
                 # Get payload from queue
-                payload, sequence_number = await self._payload_queue.get()
-                buffered_payloads[sequence_number] = payload
+                payload, sequence_number, is_last = await self._payload_queue.get()
+                buffered_payloads.setdefault(sequence_number, []).append(payload)
+                if is_last:
+                    finished_sequences.add(sequence_number)
 
                 # Send payloads in order
                 while self._next_sequence_to_send in buffered_payloads:
-                    next_payload = buffered_payloads.pop(self._next_sequence_to_send)
-                    await websocket_send(json.dumps(next_payload))
+                    sequence = self._next_sequence_to_send
+                    for next_payload in buffered_payloads.pop(sequence):
+                        await send_payload(websocket_send, next_payload)
+                    if sequence not in finished_sequences:
+                        break  # more chunks of this sentence to come
+                    finished_sequences.discard(sequence)
                     self._next_sequence_to_send += 1
 
                 self._payload_queue.task_done()
@@ -125,7 +193,7 @@ class TTSTaskManager:
             display_text=display_text,
             actions=actions,
         )
-        await self._payload_queue.put((audio_payload, sequence_number))
+        await self._payload_queue.put((audio_payload, sequence_number, True))
 
     async def _process_tts(
         self,
@@ -137,16 +205,18 @@ class TTSTaskManager:
         sequence_number: int,
     ) -> None:
         """Process TTS generation and queue the result for ordered delivery"""
-        audio_file_path = None
         try:
-            audio_file_path = await self._generate_audio(tts_engine, tts_text)
+            encoded_audio = await self._get_encoded_audio(
+                tts_engine, tts_text, sequence_number
+            )
             payload = prepare_audio_payload(
-                audio_path=audio_file_path,
+                audio_path=None,
+                encoded_audio=encoded_audio,
                 display_text=display_text,
                 actions=actions,
             )
             # Queue the payload with its sequence number
-            await self._payload_queue.put((payload, sequence_number))
+            await self._payload_queue.put((payload, sequence_number, True))
 
         except Exception as e:
             logger.error(f"Error preparing audio payload: {e}")
@@ -156,24 +226,264 @@ class TTSTaskManager:
                 display_text=display_text,
                 actions=actions,
             )
-            await self._payload_queue.put((payload, sequence_number))
+            await self._payload_queue.put((payload, sequence_number, True))
 
-        finally:
-            if audio_file_path:
-                tts_engine.remove_file(audio_file_path)
-                logger.debug("Audio cache file cleaned.")
+    async def _process_tts_stream(
+        self,
+        tts_text: str,
+        display_text: DisplayText,
+        actions: Optional[Actions],
+        live2d_model: Live2dModel,
+        tts_engine: TTSInterface,
+        sequence_number: int,
+    ) -> None:
+        """
+        Stream the audio of a sentence chunk by chunk as it is synthesized.
 
-    async def _generate_audio(self, tts_engine: TTSInterface, text: str) -> str:
-        """Generate audio file from text"""
-        logger.debug(f"🏃Generating audio for '''{text}'''...")
-        return await tts_engine.async_generate_audio(
-            text=text,
-            file_name_no_ext=f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}",
+        Cached sentences are sent as a single payload. If the engine fails
+        before producing any audio, falls back to _process_tts.
+        """
+        chunks: List[SynthesizedAudio] = []
+        completed = False
+        try:
+            if self.tts_cache:
+                cached = await self.tts_cache.get(tts_text)
+                if cached is not None:
+                    payload = prepare_audio_payload(
+                        audio_path=None,
+                        encoded_audio=cached,
+                        display_text=display_text,
+                        actions=actions,
+                    )
+                    await self._payload_queue.put((payload, sequence_number, True))
+                    return
+
+            async with self._synthesis_slot(sequence_number):
+                logger.debug(f"🏃Streaming audio for '''{tts_text}'''...")
+                start = time.perf_counter()
+                encoder = AudioChunkEncoder()
+                async for chunk in tts_engine.async_stream_audio(tts_text):
+                    first = not chunks
+                    payload = prepare_audio_chunk_payload(
+                        encoder.encode(chunk.to_bytes()),
+                        sequence=sequence_number,
+                        chunk_index=len(chunks),
+                        display_text=display_text if first else None,
+                        actions=actions if first else None,
+                    )
+                    chunks.append(chunk)
+                    await self._payload_queue.put((payload, sequence_number, False))
+                completed = True
+
+        except Exception as e:
+            logger.error(f"Error streaming audio: {e}")
+
+        if not chunks:
+            logger.warning("No audio was streamed, synthesizing the whole sentence")
+            await self._process_tts(
+                tts_text=tts_text,
+                display_text=display_text,
+                actions=actions,
+                live2d_model=live2d_model,
+                tts_engine=tts_engine,
+                sequence_number=sequence_number,
+            )
+            return
+
+        # End of the sentence, the sender can move on to the next one
+        payload = prepare_audio_chunk_payload(
+            None, sequence=sequence_number, chunk_index=len(chunks), final=True
         )
+        await self._payload_queue.put((payload, sequence_number, True))
+
+        if self.tts_cache and completed:
+            try:
+                audio = SynthesizedAudio.join(chunks)
+            except ValueError as e:
+                logger.debug(f"Not caching streamed audio: {e}")
+                return
+            encoded_audio = encode_audio(audio_bytes=audio.to_bytes())
+            await self.tts_cache.put(
+                tts_text, encoded_audio, time.perf_counter() - start
+            )
+
+    def _should_batch(self, tts_engine: TTSInterface) -> bool:
+        if not (self.batching and self.batching.enabled):
+            return False
+        if self.streaming and tts_engine.supports_streaming:
+            return False  # streaming gets the first sentence out sooner
+        return tts_engine.supports_batching
+
+    def _add_to_batch(
+        self, item: _BatchItem, live2d_model: Live2dModel, tts_engine: TTSInterface
+    ) -> None:
+        """Add a sentence to the open batch, or open one with it"""
+        batch = self._open_batch
+        if batch is None:
+            batch = self._open_batch = _PendingBatch()
+            # In task_list from the start, so the conversation waits for it
+            task = asyncio.create_task(
+                self._process_tts_batch(batch, live2d_model, tts_engine)
+            )
+            self.task_list.append(task)
+        batch.items.append(item)
+        if len(batch.items) >= self.batching.max_sentences:
+            self._open_batch = None
+            batch.full.set()
+
+    async def _process_tts_batch(
+        self,
+        batch: _PendingBatch,
+        live2d_model: Live2dModel,
+        tts_engine: TTSInterface,
+    ) -> None:
+        """
+        Wait for the batch to fill up or its window to pass, then synthesize
+        its sentences in one call and queue one payload per sentence.
+
+        Cached sentences are sent as they are. If there is a single sentence
+        left or the batch fails, sentences are synthesized one by one.
+        """
+        try:
+            await asyncio.wait_for(batch.full.wait(), self.batching.window_ms / 1000)
+        except asyncio.TimeoutError:
+            pass
+        if self._open_batch is batch:
+            self._open_batch = None
+
+        items = batch.items
+        if len(items) > 1 and self.tts_cache:
+            items = []
+            for item in batch.items:
+                cached = await self.tts_cache.get(item.tts_text)
+                if cached is None:
+                    items.append(item)
+                    continue
+                payload = prepare_audio_payload(
+                    audio_path=None,
+                    encoded_audio=cached,
+                    display_text=item.display_text,
+                    actions=item.actions,
+                )
+                await self._payload_queue.put((payload, item.sequence_number, True))
+
+        audios = None
+        if len(items) > 1:
+            try:
+                async with self._synthesis_slot(items[0].sequence_number):
+                    logger.debug(
+                        f"🏃Generating audio for {len(items)} sentences in one call..."
+                    )
+                    start = time.perf_counter()
+                    audios = await tts_engine.async_generate_audio_batch(
+                        [item.tts_text for item in items]
+                    )
+                    cost = time.perf_counter() - start
+            except Exception as e:
+                logger.error(f"Error generating batched audio: {e}")
+            if audios is not None and len(audios) != len(items):
+                # A missing sentence would never reach the ordered sender
+                logger.error(
+                    f"Batched synthesis returned {len(audios)} audios for "
+                    f"{len(items)} sentences, synthesizing them one by one"
+                )
+                audios = None
+
+        if audios is None:
+            await asyncio.gather(
+                *(
+                    self._process_tts(
+                        tts_text=item.tts_text,
+                        display_text=item.display_text,
+                        actions=item.actions,
+                        live2d_model=live2d_model,
+                        tts_engine=tts_engine,
+                        sequence_number=item.sequence_number,
+                    )
+                    for item in items
+                )
+            )
+            return
+
+        total_length = sum(len(item.tts_text) for item in items)
+        for item, audio in zip(items, audios):
+            try:
+                # Each sentence gets its own volume envelope
+                encoded_audio = encode_audio(audio_bytes=audio.to_bytes())
+            except ValueError as e:
+                logger.error(f"Error preparing audio payload: {e}")
+                encoded_audio = None  # sent as a silent payload
+            payload = prepare_audio_payload(
+                audio_path=None,
+                encoded_audio=encoded_audio,
+                display_text=item.display_text,
+                actions=item.actions,
+            )
+            await self._payload_queue.put((payload, item.sequence_number, True))
+            if self.tts_cache and encoded_audio:
+                await self.tts_cache.put(
+                    item.tts_text,
+                    encoded_audio,
+                    cost * len(item.tts_text) / total_length,
+                )
+
+    def _synthesis_slot(self, sequence_number: int):
+        """Wait for the scheduler to let this sentence be synthesized"""
+        if not self.tts_scheduler:
+            return contextlib.nullcontext()
+        return self.tts_scheduler.slot(self, priority=sequence_number)
+
+    async def _get_encoded_audio(
+        self, tts_engine: TTSInterface, text: str, sequence_number: int
+    ) -> EncodedAudio:
+        """Get the audio of a sentence from the cache, or synthesize and cache it"""
+        if self.tts_cache:
+            cached = await self.tts_cache.get(text)
+            if cached is not None:
+                return cached
+
+        async with self._synthesis_slot(sequence_number):
+            start = time.perf_counter()
+            audio = await self._generate_audio(tts_engine, text)
+            if audio is None:
+                raise ValueError("TTS engine returned no audio")
+            encoded_audio = encode_audio(audio_bytes=audio.to_bytes())
+
+        if self.tts_cache:
+            await self.tts_cache.put(text, encoded_audio, time.perf_counter() - start)
+        return encoded_audio
+
+    async def _generate_audio(
+        self, tts_engine: TTSInterface, text: str
+    ) -> SynthesizedAudio | None:
+        """Generate audio from text, in memory"""
+        logger.debug(f"🏃Generating audio for '''{text}'''...")
+        return await tts_engine.async_generate_audio_bytes(text=text)
+
+    async def _log_scheduler_stats(self, cancelled: List[asyncio.Task]) -> None:
+        """Log the scheduler's stats once the cancelled tasks have stopped"""
+        # The synthesis time saved is only counted when a cancelled task
+        # leaves the scheduler's queue
+        await asyncio.wait(cancelled)
+        self.tts_scheduler.log_stats("interrupted")
 
     def clear(self) -> None:
-        """Clear all pending tasks and reset state"""
+        """Cancel all pending tasks and reset state"""
+        # TTS tasks are not awaited until the agent finishes its reply, so on
+        # an interrupt they would otherwise keep synthesizing audio nobody
+        # will hear. Cancelling stops sentences waiting for the scheduler,
+        # jobs queued in the thread pool, async HTTP requests and streams.
+        pending = [task for task in self.task_list if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.info(f"🛑 Cancelled {len(pending)} pending TTS tasks")
+            if self.tts_scheduler:
+                self._stats_task = asyncio.create_task(
+                    self._log_scheduler_stats(pending)
+                )
         self.task_list.clear()
+        self._open_batch = None
         if self._sender_task:
             self._sender_task.cancel()
         self._sequence_counter = 0
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from pydantic import BaseModel
 
 from ..agent.output_types import Actions, DisplayText
+from ..utils.stream_audio import EncodedAudio
 
 # Type definitions
 WebSocketSend = Callable[[str], Awaitable[None]]
@@ -13,7 +14,8 @@ class AudioPayload(TypedDict):
     """Type definition for audio payload"""
 
     type: str
-    audio: Optional[str]
+    # Sent as base64, or in a binary frame to clients that negotiated it
+    audio: Optional[EncodedAudio]
     volumes: Optional[List[float]]
     slice_length: Optional[int]
     display_text: Optional[DisplayText]
@@ -21,6 +23,14 @@ class AudioPayload(TypedDict):
     forwarded: Optional[bool]
 
 
+class AudioChunkPayload(AudioPayload):
+    """Type definition for one chunk of a streamed sentence"""
+
+    sequence: int
+    chunk_index: int
+    final: bool
+
+
 @dataclass
 class BroadcastContext:
     """Context for broadcasting messages in group chat"""
@@ -1,7 +1,8 @@
 import os
-import json
+import time
+import asyncio
+from typing import List, Optional
 from uuid import uuid4
-import numpy as np
 from datetime import datetime
 from fastapi import APIRouter, WebSocket, UploadFile, File, Response
 from starlette.responses import JSONResponse
@@ -10,6 +11,16 @@ from loguru import logger
 from .service_context import ServiceContext
 from .websocket_handler import WebSocketHandler
 from .proxy_handler import ProxyHandler
+from .utils.binary_audio import BINARY_AUDIO_SUBPROTOCOL, BINARY_AUDIO_SUBPROTOCOL_V2
+from .utils.audio_ingest import ingest_wav_file
+from .utils.pause_split import split_long_audio
+from .asr.asr_interface import ASRInterface
+from .asr.asr_scheduler import ASRBusyError
+
+# Files of one /asr request transcribed at once
+MAX_CONCURRENT_ASR_FILES = 4
+# Longest piece of an uploaded file sent to the ASR engine: one Whisper window
+MAX_ASR_WINDOW_SECONDS = 30
 
 
 def init_client_ws_route(default_context_cache: ServiceContext) -> APIRouter:
@@ -29,7 +40,20 @@ def init_client_ws_route(default_context_cache: ServiceContext) -> APIRouter:
     @router.websocket("/client-ws")
     async def websocket_endpoint(websocket: WebSocket):
         """WebSocket endpoint for client connections"""
-        await websocket.accept()
+        # Clients that offer the binary audio sub-protocol may send mic audio
+        # as binary PCM frames instead of JSON float lists. With v2, they also
+        # receive the audio of the responses in binary frames.
+        offered = websocket.scope.get("subprotocols", [])
+        subprotocol = next(
+            (
+                protocol
+                for protocol in (BINARY_AUDIO_SUBPROTOCOL_V2, BINARY_AUDIO_SUBPROTOCOL)
+                if protocol in offered
+            ),
+            None,
+        )
+        websocket.state.binary_audio = subprotocol == BINARY_AUDIO_SUBPROTOCOL_V2
+        await websocket.accept(subprotocol=subprotocol)
         client_uid = str(uuid4())
 
         try:
@@ -70,6 +94,61 @@ def init_proxy_route(server_url: str) -> APIRouter:
     return router
 
 
+async def _transcribe_upload(
+    asr_engine: ASRInterface, upload: UploadFile, limit: asyncio.Semaphore
+) -> tuple[dict, int]:
+    """Transcribe an uploaded WAV file, return the result and its HTTP status."""
+    async with limit:
+        try:
+            start = time.perf_counter()
+            # Reads the spooled upload without loading it whole
+            audio = await asyncio.to_thread(ingest_wav_file, upload.file)
+            decoded = time.perf_counter()
+            if not len(audio):
+                raise ValueError("Empty audio data")
+
+            # A long recording (e.g. a stream VOD) in one call would hold the
+            # engine, and the utterances of live clients queued behind it,
+            # for the whole transcription. Its windows are transcribed one at
+            # a time instead, each queued with the live utterances.
+            windows = await asyncio.to_thread(
+                split_long_audio,
+                audio,
+                ASRInterface.SAMPLE_RATE,
+                MAX_ASR_WINDOW_SECONDS,
+            )
+            texts = []
+            for window in windows:
+                texts.append(await asr_engine.async_transcribe_np(window))
+            text = " ".join(t.strip() for t in texts if t.strip())
+            transcribed = time.perf_counter()
+        except ValueError as e:
+            logger.error(f"Audio format error in {upload.filename}: {e}")
+            return {"filename": upload.filename, "error": str(e)}, 400
+        except ASRBusyError as e:
+            logger.warning(f"ASR busy, {upload.filename} rejected: {e}")
+            return {"filename": upload.filename, "error": str(e)}, 503
+        except Exception as e:
+            logger.error(f"Error during transcription of {upload.filename}: {e}")
+            return {
+                "filename": upload.filename,
+                "error": "Internal server error during transcription",
+            }, 500
+
+    duration = len(audio) / ASRInterface.SAMPLE_RATE
+    logger.info(
+        f"Transcribed {upload.filename} ({duration:.1f}s of audio) in "
+        f"{transcribed - start:.2f}s: {text}"
+    )
+    return {
+        "filename": upload.filename,
+        "text": text,
+        "duration": duration,
+        "decode_time": decoded - start,
+        "transcribe_time": transcribed - decoded,
+    }, 200
+
+
 def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
     """
     Create and return API routes for handling web tool interactions.
@@ -139,64 +218,46 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
         )
 
     @router.post("/asr")
-    async def transcribe_audio(file: UploadFile = File(...)):
+    async def transcribe_audio(
+        file: Optional[UploadFile] = File(None),
+        files: Optional[List[UploadFile]] = File(None),
+    ):
         """
-        Endpoint for transcribing audio using the ASR engine
-        """
-        logger.info(f"Received audio file for transcription: {file.filename}")
+        Endpoint for transcribing WAV files using the ASR engine.
 
-        try:
-            contents = await file.read()
-
-            # Validate minimum file size
-            if len(contents) < 44:  # Minimum WAV header size
-                raise ValueError("Invalid WAV file: File too small")
-
-            # Decode the WAV header and get actual audio data
-            wav_header_size = 44  # Standard WAV header size
-            audio_data = contents[wav_header_size:]
-
-            # Validate audio data size
-            if len(audio_data) % 2 != 0:
-                raise ValueError("Invalid audio data: Buffer size must be even")
-
-            # Convert to 16-bit PCM samples to float32
-            try:
-                audio_array = (
-                    np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-                    / 32768.0
-                )
-            except ValueError as e:
-                raise ValueError(
-                    f"Audio format error: {str(e)}. Please ensure the file is 16-bit PCM WAV format."
-                )
-
-            # Validate audio data
-            if len(audio_array) == 0:
-                raise ValueError("Empty audio data")
+        Upload one file as `file`, or several as `files`. Files of any length,
+        sample format, channel count and sample rate are accepted. The upload
+        is spooled to a temporary file, and each file is converted block by
+        block to the ASR's 16 kHz mono. Up to MAX_CONCURRENT_ASR_FILES files
+        are transcribed at once, through the engine's scheduler if it has one.
 
-            text = await default_context_cache.asr_engine.async_transcribe_np(
-                audio_array
-            )
-            logger.info(f"Transcription result: {text}")
-            return {"text": text}
+        Returns the transcription of `file` with its timing, or `results`
+        with one such entry per file of `files`.
+        """
+        uploads = ([file] if file else []) + (files or [])
+        if not uploads:
+            return JSONResponse({"error": "No audio file uploaded"}, status_code=400)
+        logger.info(
+            f"Received {len(uploads)} audio file(s) for transcription: "
+            f"{', '.join(str(upload.filename) for upload in uploads)}"
+        )
 
-        except ValueError as e:
-            logger.error(f"Audio format error: {e}")
-            return Response(
-                content=json.dumps({"error": str(e)}),
-                status_code=400,
-                media_type="application/json",
-            )
-        except Exception as e:
-            logger.error(f"Error during transcription: {e}")
-            return Response(
-                content=json.dumps(
-                    {"error": "Internal server error during transcription"}
-                ),
-                status_code=500,
-                media_type="application/json",
+        start = time.perf_counter()
+        limit = asyncio.Semaphore(MAX_CONCURRENT_ASR_FILES)
+        results = await asyncio.gather(
+            *(
+                _transcribe_upload(default_context_cache.asr_engine, upload, limit)
+                for upload in uploads
             )
+        )
+
+        if file and not files:
+            result, status_code = results[0]
+            return JSONResponse(result, status_code=status_code)
+        return {
+            "results": [result for result, _status_code in results],
+            "total_time": time.perf_counter() - start,
+        }
 
     @router.websocket("/tts-ws")
     async def tts_endpoint(websocket: WebSocket):
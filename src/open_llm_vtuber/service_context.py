@@ -8,9 +8,14 @@ from prompts import prompt_loader
 from .live2d_model import Live2dModel
 from .asr.asr_interface import ASRInterface
 from .tts.tts_interface import TTSInterface
-from .vad.vad_interface import VADInterface
+from .tts.tts_cache import TTSCache
+from .tts.tts_scheduler import TTSScheduler
+from .tts.tts_worker_pool import TTSWorkerPool
+from .tts.http_transport import get_http_transport
+from .vad.vad_interface import VADInterface, VADSessionInterface
 from .agent.agents.agent_interface import AgentInterface
 from .translate.translate_interface import TranslateInterface
+from .warmup import warm_up
 
 from .mcpp.server_registry import ServerRegistry
 from .mcpp.tool_manager import ToolManager
@@ -19,6 +24,7 @@ from .mcpp.tool_executor import ToolExecutor
 from .mcpp.tool_adapter import ToolAdapter
 
 from .asr.asr_factory import ASRFactory
+from .asr.asr_replica_pool import ASRReplicaPool
 from .tts.tts_factory import TTSFactory
 from .vad.vad_factory import VADFactory
 from .agent.agent_factory import AgentFactory
@@ -50,9 +56,19 @@ class ServiceContext:
         self.live2d_model: Live2dModel = None
         self.asr_engine: ASRInterface = None
         self.tts_engine: TTSInterface = None
+        # tts_cache is None if caching is disabled. Shared like the tts_engine.
+        self.tts_cache: TTSCache | None = None
+        # limits concurrent synthesis on the tts_engine, across all sessions
+        self.tts_scheduler: TTSScheduler = None
+        # tts_engine created by this context, closed when replaced. Sessions
+        # loaded from the cache share the engine of the default context and
+        # never own it.
+        self._own_tts_engine: TTSInterface | None = None
         self.agent_engine: AgentInterface = None
         # translate_engine can be none if translation is disabled
         self.vad_engine: VADInterface | None = None
+        # per-client VAD state. The vad_engine itself is shared between sessions.
+        self.vad_session: VADSessionInterface | None = None
         self.translate_engine: TranslateInterface | None = None
 
         self.mcp_server_registery: ServerRegistry | None = None
@@ -190,12 +206,22 @@ class ServiceContext:
     async def close(self):
         """Clean up resources, especially the MCPClient."""
         logger.info("Closing ServiceContext resources...")
+        if self.vad_session:
+            self.vad_session.close()
+            self.vad_session = None
         if self.mcp_client:
             logger.info(f"Closing MCPClient for context instance {id(self)}...")
             await self.mcp_client.aclose()
             self.mcp_client = None
         if self.agent_engine and hasattr(self.agent_engine, "close"):
             await self.agent_engine.close()  # Ensure agent resources are also closed
+        if self._own_tts_engine:
+            await self._own_tts_engine.aclose()
+            self._own_tts_engine = None
+        if self.tts_scheduler:
+            self.tts_scheduler.log_stats("context closed")
+        if isinstance(self.asr_engine, ASRReplicaPool):
+            self.asr_engine.log_stats("context closed")
         logger.info("ServiceContext closed.")
 
     async def load_cache(
@@ -213,6 +239,8 @@ class ServiceContext:
         tool_adapter: ToolAdapter | None = None,
         send_text: Callable = None,
         client_uid: str = None,
+        tts_cache: TTSCache | None = None,
+        tts_scheduler: TTSScheduler | None = None,
     ) -> None:
         """
         Load the ServiceContext with the reference of the provided instances.
@@ -229,7 +257,10 @@ class ServiceContext:
         self.live2d_model = live2d_model
         self.asr_engine = asr_engine
         self.tts_engine = tts_engine
+        self.tts_cache = tts_cache
+        self.tts_scheduler = tts_scheduler
         self.vad_engine = vad_engine
+        self.vad_session = vad_engine.create_session() if vad_engine else None
         self.agent_engine = agent_engine
         self.translate_engine = translate_engine
         # Load potentially shared components by reference
@@ -272,7 +303,7 @@ class ServiceContext:
         self.init_asr(config.character_config.asr_config)
 
         # init tts from character config
-        self.init_tts(config.character_config.tts_config)
+        await self.init_tts(config.character_config.tts_config)
 
         # init vad from character config
         self.init_vad(config.character_config.vad_config)
@@ -306,6 +337,17 @@ class ServiceContext:
             config.character_config.tts_preprocessor_config.translator_config
         )
 
+        # run the engines once, so the first user does not wait for them
+        await warm_up(
+            config.character_config.warmup,
+            self.asr_engine,
+            self.vad_engine,
+            self.tts_engine,
+            self.tts_cache,
+            asr_model=config.character_config.asr_config.asr_model,
+            tts_model=config.character_config.tts_config.tts_model,
+        )
+
         # store typed config references
         self.config = config
         self.system_config = config.system_config or self.system_config
@@ -332,22 +374,60 @@ class ServiceContext:
         else:
             logger.info("ASR already initialized with the same config.")
 
-    def init_tts(self, tts_config: TTSConfig) -> None:
+    async def init_tts(self, tts_config: TTSConfig) -> None:
         if not self.tts_engine or (self.character_config.tts_config != tts_config):
             logger.info(f"Initializing TTS: {tts_config.tts_model}")
-            self.tts_engine = TTSFactory.get_tts_engine(
-                tts_config.tts_model,
-                **getattr(tts_config, tts_config.tts_model.lower()).model_dump(),
+            # Shared by the engines of all clients, like their connections
+            get_http_transport().configure(**tts_config.http_client.model_dump())
+            engine_config = getattr(
+                tts_config, tts_config.tts_model.lower()
+            ).model_dump()
+            if tts_config.worker_processes > 0:
+                tts_engine = TTSWorkerPool(
+                    tts_config.tts_model,
+                    engine_config,
+                    num_workers=tts_config.worker_processes,
+                )
+            else:
+                tts_engine = TTSFactory.get_tts_engine(
+                    tts_config.tts_model, **engine_config
+                )
+            # e.g. the WebSocket connections or worker processes of the engine
+            # this replaces
+            if self._own_tts_engine:
+                await self._own_tts_engine.aclose()
+            self._own_tts_engine = tts_engine
+            self.tts_engine = tts_engine
+            self.tts_cache = self._create_tts_cache(tts_config, engine_config)
+            self.tts_scheduler = TTSScheduler(
+                max_concurrency=tts_config.tts_scheduler.max_concurrency,
+                max_concurrency_per_session=tts_config.tts_scheduler.max_concurrency_per_session,
             )
             # saving config should be done after successful initialization
             self.character_config.tts_config = tts_config
         else:
             logger.info("TTS already initialized with the same config.")
 
+    def _create_tts_cache(
+        self, tts_config: TTSConfig, engine_config: dict
+    ) -> TTSCache | None:
+        cache_config = tts_config.tts_cache
+        if not cache_config.enabled:
+            logger.info("TTS cache is disabled.")
+            return None
+        return TTSCache(
+            engine_type=tts_config.tts_model,
+            engine_config=engine_config,
+            max_memory_bytes=int(cache_config.max_memory_mb * 1024 * 1024),
+            disk_dir=cache_config.disk_cache_dir or None,
+            max_disk_bytes=int(cache_config.max_disk_mb * 1024 * 1024),
+        )
+
     def init_vad(self, vad_config: VADConfig) -> None:
         if vad_config.vad_model is None:
             logger.info("VAD is disabled.")
             self.vad_engine = None
+            self.vad_session = None
             return
 
         if not self.vad_engine or (self.character_config.vad_config != vad_config):
@@ -356,6 +436,7 @@ class ServiceContext:
                 vad_config.vad_model,
                 **getattr(vad_config, vad_config.vad_model.lower()).model_dump(),
             )
+            self.vad_session = self.vad_engine.create_session()
             # saving config should be done after successful initialization
             self.character_config.vad_config = vad_config
         else:
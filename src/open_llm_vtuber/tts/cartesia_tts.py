@@ -2,12 +2,20 @@ from __future__ import annotations
 
 # src/open_llm_vtuber/tts/cartesia_tts.py
 from pathlib import Path
-from typing import Literal
+from typing import AsyncIterator, Literal
 import os
+import uuid
+import base64
 
 from loguru import logger
 from open_llm_vtuber.config_manager.tts import CartesiaEmotions, CartesiaLanguages
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio
+from .websocket_transport import (
+    StreamEvent,
+    TTSWebSocketError,
+    TTSWebSocketPool,
+    pcm_chunks,
+)
 
 try:
     from cartesia import (
@@ -37,6 +45,15 @@ mp3_output_format: OutputFormat_Mp3Params = {
     "sample_rate": 44100,
     "bit_rate": 128000,
 }
+# Streamed over the WebSocket as raw samples, encoded to WAV for the client
+websocket_output_format = {
+    "container": "raw",
+    "sample_rate": 44100,
+    "encoding": "pcm_f32le",
+}
+
+WEBSOCKET_URL = "wss://api.cartesia.ai/tts/websocket"
+CARTESIA_VERSION = "2025-04-16"
 
 
 class TTSEngine(TTSInterface):
@@ -55,6 +72,7 @@ class TTSEngine(TTSInterface):
         emotion: CartesiaEmotions = "neutral",
         volume: float = 1.0,
         speed: float = 1.0,
+        websocket: bool = False,
     ):
         """
         Initializes the Cartesia TTS engine.
@@ -68,6 +86,8 @@ class TTSEngine(TTSInterface):
             speed (int): The speed of the generation, ranging from 0.6 to 1.5 (e.g., 1).
             emotion (CartesiaEmotions): The emotional guidance for a generation (e.g., neutral).
             output_format (str): Output audio format (e.g., mp3).
+            websocket (bool): Stream sentences over persistent WebSocket
+                connections instead of one HTTP request each.
         """
         if not CARTESIA_AVAILABLE:
             raise ImportError(
@@ -82,6 +102,16 @@ class TTSEngine(TTSInterface):
         self.emotion = emotion
         self.volume = volume
         self.speed = speed
+        self.websocket = websocket
+        self._ws_pool = (
+            TTSWebSocketPool(
+                WEBSOCKET_URL,
+                headers={"X-API-Key": api_key, "Cartesia-Version": CARTESIA_VERSION},
+                parse_message=self._parse_ws_message,
+            )
+            if websocket
+            else None
+        )
 
         try:
             self.client = Cartesia(api_key=self.api_key)
@@ -152,6 +182,71 @@ class TTSEngine(TTSInterface):
 
         return str(speech_file_path)
 
+    @property
+    def supports_streaming(self) -> bool:
+        return self.websocket
+
+    async def aclose(self) -> None:
+        if self._ws_pool:
+            await self._ws_pool.close()
+
+    async def async_stream_audio(self, text: str) -> AsyncIterator[SynthesizedAudio]:
+        if not self.websocket:
+            async for chunk in super().async_stream_audio(text):
+                yield chunk
+            return
+
+        context_id = str(uuid.uuid4())
+        request = {
+            "context_id": context_id,
+            "model_id": self.model_id,
+            "transcript": text,
+            "voice": {"mode": "id", "id": self.voice_id},
+            "language": self.language,
+            "output_format": websocket_output_format,
+            "generation_config": {
+                "volume": self.volume,
+                "speed": self.speed,
+                "emotion": self.emotion,
+            },
+            "continue": False,
+        }
+        data_chunks = self._ws_pool.stream(
+            context_id,
+            [request],
+            cancel_message={"context_id": context_id, "cancel": True},
+        )
+        async for chunk in pcm_chunks(
+            data_chunks, "<f4", websocket_output_format["sample_rate"]
+        ):
+            yield chunk
+
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        if not self.websocket:
+            return await super().async_generate_audio_bytes(text)
+        try:
+            return SynthesizedAudio.join(
+                [chunk async for chunk in self.async_stream_audio(text)]
+            )
+        except (TTSWebSocketError, ValueError) as e:
+            logger.critical(f"Error: Cartesia TTS unable to generate audio: {e}")
+            return None
+
+    @staticmethod
+    def _parse_ws_message(message: dict) -> StreamEvent:
+        context_id = message.get("context_id")
+        if message["type"] == "chunk":
+            return StreamEvent(
+                context_id,
+                audio=base64.b64decode(message["data"]),
+                done=message.get("done", False),
+            )
+        if message["type"] == "done":
+            return StreamEvent(context_id, done=True)
+        if message["type"] == "error":
+            return StreamEvent(context_id, error=str(message.get("error", message)))
+        return StreamEvent(context_id)  # e.g. timestamps
+
 
 # Code Used to Test Cartesia TTS Engine
 # if __name__ == "__main__":
@@ -1,9 +1,11 @@
 import os
+import asyncio
 from typing import Optional
+import numpy as np
 from TTS.api import TTS
 from loguru import logger
 import torch
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio
 
 
 class TTSEngine(TTSInterface):
@@ -93,6 +95,40 @@ class TTSEngine(TTSInterface):
         except Exception as e:
             raise RuntimeError(f"Failed to generate audio: {str(e)}")
 
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio:
+        return await asyncio.to_thread(self.generate_audio_bytes, text)
+
+    def generate_audio_bytes(self, text: str) -> SynthesizedAudio:
+        """
+        Generate speech with CoquiTTS, keeping the samples in memory.
+
+        Args:
+            text: Text to synthesize
+
+        Returns:
+            The generated audio
+        """
+        try:
+            if self.is_multi_speaker and self.speaker_wav:
+                wav = self.tts.tts(
+                    text=text,
+                    speaker_wav=self.speaker_wav,
+                    language=self.language,
+                )
+            else:
+                wav = self.tts.tts(text=text)
+
+            # Peak-normalize like tts_to_file (Synthesizer.save_wav) does
+            wav = np.asarray(wav, dtype=np.float32)
+            wav = wav * (1 / max(0.01, float(np.max(np.abs(wav)))))
+            return SynthesizedAudio(
+                samples=wav,
+                sample_rate=self.tts.synthesizer.output_sample_rate,
+            )
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate audio: {str(e)}")
+
     @staticmethod
     def list_available_models() -> list:
         """
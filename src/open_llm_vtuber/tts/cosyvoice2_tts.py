@@ -1,6 +1,8 @@
+from typing import AsyncIterator
+
 from gradio_client import Client, handle_file
 from loguru import logger
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio, stream_in_thread
 
 
 class TTSEngine(TTSInterface):
@@ -52,3 +54,33 @@ class TTSEngine(TTSInterface):
         )
 
         return result_wav_path
+
+    @property
+    def supports_streaming(self) -> bool:
+        return self.stream
+
+    async def async_stream_audio(self, text: str) -> AsyncIterator[SynthesizedAudio]:
+        """Stream the audio segments of the CosyVoice web UI as they are generated."""
+
+        def produce(emit) -> None:
+            job = self.client.submit(
+                tts_text=text,
+                mode_checkbox_group=self.mode_checkbox_group,
+                sft_dropdown=self.sft_dropdown,
+                prompt_text=self.prompt_text,
+                prompt_wav_upload=self.prompt_wav_upload,
+                prompt_wav_record=self.prompt_wav_record,
+                instruct_text=self.instruct_text,
+                stream=True,
+                seed=self.seed,
+                speed=self.speed,
+                api_name=self.api_name,
+            )
+            for result_wav_path in job:
+                chunk = SynthesizedAudio(audio_bytes=self._read_file(result_wav_path))
+                if not emit(chunk):
+                    job.cancel()
+                    break
+
+        async for chunk in stream_in_thread(produce):
+            yield chunk
@@ -1,11 +1,25 @@
 # src/open_llm_vtuber/tts/elevenlabs_tts.py
 import os
+import uuid
+import base64
 from pathlib import Path
+from typing import AsyncIterator
+from urllib.parse import urlencode
 
 from loguru import logger
 from elevenlabs.client import ElevenLabs
 
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio
+from .websocket_transport import (
+    StreamEvent,
+    TTSWebSocketError,
+    TTSWebSocketPool,
+    pcm_chunks,
+)
+
+WEBSOCKET_URL = (
+    "wss://api.elevenlabs.io/v1/text-to-speech/{voice_id}/multi-stream-input"
+)
 
 
 class TTSEngine(TTSInterface):
@@ -24,6 +38,7 @@ class TTSEngine(TTSInterface):
         similarity_boost: float = 0.5,
         style: float = 0.0,
         use_speaker_boost: bool = True,
+        websocket: bool = False,
     ):
         """
         Initializes the ElevenLabs TTS engine.
@@ -37,6 +52,8 @@ class TTSEngine(TTSInterface):
             similarity_boost (float): Voice similarity boost (0.0 to 1.0).
             style (float): Voice style exaggeration (0.0 to 1.0).
             use_speaker_boost (bool): Enable speaker boost for better quality.
+            websocket (bool): Stream sentences over persistent WebSocket
+                connections instead of one HTTP request each.
         """
         self.api_key = api_key
         self.voice_id = voice_id
@@ -58,6 +75,27 @@ class TTSEngine(TTSInterface):
             )
             self.file_extension = "mp3"  # Default to mp3
 
+        self.websocket = websocket
+        self._ws_pool = None
+        if websocket:
+            # Streamed as raw samples, encoded to WAV for the client
+            self.ws_output_format = (
+                output_format if output_format.startswith("pcm_") else "pcm_24000"
+            )
+            query = urlencode(
+                {
+                    "model_id": model_id,
+                    "output_format": self.ws_output_format,
+                    # Seconds before an idle connection is closed (max 180)
+                    "inactivity_timeout": 180,
+                }
+            )
+            self._ws_pool = TTSWebSocketPool(
+                f"{WEBSOCKET_URL.format(voice_id=voice_id)}?{query}",
+                headers={"xi-api-key": api_key},
+                parse_message=self._parse_ws_message,
+            )
+
         try:
             # Initialize ElevenLabs client
             self.client = ElevenLabs(api_key=api_key)
@@ -130,6 +168,70 @@ class TTSEngine(TTSInterface):
 
         return str(speech_file_path)
 
+    @property
+    def supports_streaming(self) -> bool:
+        return self.websocket
+
+    async def aclose(self) -> None:
+        if self._ws_pool:
+            await self._ws_pool.close()
+
+    async def async_stream_audio(self, text: str) -> AsyncIterator[SynthesizedAudio]:
+        if not self.websocket:
+            async for chunk in super().async_stream_audio(text):
+                yield chunk
+            return
+
+        context_id = str(uuid.uuid4())
+        messages = [
+            {
+                "context_id": context_id,
+                "text": " ",
+                "voice_settings": {
+                    "stability": self.stability,
+                    "similarity_boost": self.similarity_boost,
+                    "style": self.style,
+                    "use_speaker_boost": self.use_speaker_boost,
+                },
+            },
+            {"context_id": context_id, "text": f"{text} ", "flush": True},
+            # Closing the context makes the API send isFinal after its audio
+            {"context_id": context_id, "close_context": True},
+        ]
+        data_chunks = self._ws_pool.stream(
+            context_id,
+            messages,
+            cancel_message={"context_id": context_id, "close_context": True},
+        )
+        sample_rate = int(self.ws_output_format.split("_")[1])
+        async for chunk in pcm_chunks(data_chunks, "<i2", sample_rate):
+            yield chunk
+
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        if not self.websocket:
+            return await super().async_generate_audio_bytes(text)
+        try:
+            return SynthesizedAudio.join(
+                [chunk async for chunk in self.async_stream_audio(text)]
+            )
+        except (TTSWebSocketError, ValueError) as e:
+            logger.critical(f"Error: ElevenLabs TTS unable to generate audio: {e}")
+            return None
+
+    @staticmethod
+    def _parse_ws_message(message: dict) -> StreamEvent:
+        context_id = message.get("contextId", message.get("context_id"))
+        if message.get("error"):
+            return StreamEvent(
+                context_id, error=f"{message['error']}: {message.get('message', '')}"
+            )
+        audio = message.get("audio")
+        return StreamEvent(
+            context_id,
+            audio=base64.b64decode(audio) if audio else None,
+            done=bool(message.get("isFinal") or message.get("is_final")),
+        )
+
 
 # Example usage (optional, for testing)
 # if __name__ == '__main__':
@@ -1,10 +1,9 @@
 from typing import Literal
-from fish_audio_sdk import Session, TTSRequest
 from loguru import logger
-from .tts_interface import TTSInterface
+from .http_transport import HttpTTSInterface, HttpRequest
 
 
-class TTSEngine(TTSInterface):
+class TTSEngine(HttpTTSInterface):
     """
     Fish TTS that calls the FishTTS API service.
     """
@@ -37,24 +36,20 @@ class TTSEngine(TTSInterface):
             f"\nFish TTS API initialized with api key: {api_key} baseurl: {base_url} reference_id: {reference_id}, latency: {latency}"
         )
 
+        self.api_key = api_key
         self.reference_id = reference_id
         self.latency = latency
-        self.session = Session(apikey=api_key, base_url=base_url)
-
-    def generate_audio(self, text, file_name_no_ext=None):
-        file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
-
-        try:
-            with open(file_name, "wb") as f:
-                for chunk in self.session.tts(
-                    TTSRequest(
-                        text=text, reference_id=self.reference_id, latency=self.latency
-                    )
-                ):
-                    f.write(chunk)
-
-        except Exception as e:
-            logger.critical(f"\nError: Fish TTS API fail to generate audio: {e}")
-            return None
-
-        return file_name
+        self.base_url = base_url.rstrip("/")
+
+    def build_request(self, text: str) -> HttpRequest:
+        return HttpRequest(
+            "POST",
+            f"{self.base_url}/v1/tts",
+            json={
+                "text": text,
+                "reference_id": self.reference_id,
+                "latency": self.latency,
+                "format": self.file_extension,
+            },
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
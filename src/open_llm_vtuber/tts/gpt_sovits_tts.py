@@ -3,12 +3,10 @@
 ####
 
 import re
-import requests
-from loguru import logger
-from .tts_interface import TTSInterface
+from .http_transport import HttpTTSInterface, HttpRequest
 
 
-class TTSEngine(TTSInterface):
+class TTSEngine(HttpTTSInterface):
     def __init__(
         self,
         api_url: str = "http://127.0.0.1:9880/tts",
@@ -30,35 +28,31 @@ class TTSEngine(TTSInterface):
         self.batch_size = batch_size
         self.media_type = media_type
         self.streaming_mode = streaming_mode
+        self.file_extension = media_type
 
-    def generate_audio(self, text, file_name_no_ext=None):
-        file_name = self.generate_cache_file_name(file_name_no_ext, self.media_type)
-        cleaned_text = re.sub(r"\[.*?\]", "", text)
-        # Prepare the data for the POST request
-        data = {
-            "text": cleaned_text,
-            "text_lang": self.text_lang,
-            "ref_audio_path": self.ref_audio_path,
-            "prompt_lang": self.prompt_lang,
-            "prompt_text": self.prompt_text,
-            "text_split_method": self.text_split_method,
-            "batch_size": self.batch_size,
-            "media_type": self.media_type,
-            "streaming_mode": self.streaming_mode,
-        }
-
-        # Send POST request to the TTS API
-        response = requests.get(self.api_url, params=data, timeout=120)
+    @property
+    def supports_batching(self) -> bool:
+        # The server splits the text with text_split_method and infers the
+        # fragments batch_size at a time. The audio is then cut at its pauses,
+        # which needs a whole WAV file: not ogg/aac/raw, nor a stream.
+        streaming = str(self.streaming_mode).lower() not in ("false", "0")
+        return self.media_type == "wav" and not streaming
 
-        # Check if the request was successful
-        if response.status_code == 200:
-            # Save the audio content to a file
-            with open(file_name, "wb") as audio_file:
-                audio_file.write(response.content)
-            return file_name
-        else:
-            # Handle errors or unsuccessful requests
-            logger.critical(
-                f"Error: Failed to generate audio. Status code: {response.status_code}"
-            )
-            return None
+    def build_request(self, text: str) -> HttpRequest:
+        cleaned_text = re.sub(r"\[.*?\]", "", text)
+        # GET request to the TTS API
+        return HttpRequest(
+            "GET",
+            self.api_url,
+            params={
+                "text": cleaned_text,
+                "text_lang": self.text_lang,
+                "ref_audio_path": self.ref_audio_path,
+                "prompt_lang": self.prompt_lang,
+                "prompt_text": self.prompt_text,
+                "text_split_method": self.text_split_method,
+                "batch_size": self.batch_size,
+                "media_type": self.media_type,
+                "streaming_mode": self.streaming_mode,
+            },
+        )
@@ -0,0 +1,267 @@
+import abc
+import asyncio
+import threading
+from dataclasses import dataclass, field
+
+import aiohttp
+import requests
+from loguru import logger
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .tts_interface import TTSInterface, SynthesizedAudio
+
+# Statuses worth another attempt: rate limits and overloaded or restarting servers
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+class TTSHttpError(Exception):
+    """A TTS request failed: no response, or a non-2xx status after retries."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+@dataclass
+class HttpRequest:
+    """A request to a TTS server, sent by HttpTransport."""
+
+    method: str
+    url: str
+    params: dict | None = None
+    json: dict | None = None
+    headers: dict = field(default_factory=dict)
+
+
+class HttpTransport:
+    """
+    HTTP client shared by the TTS engines that call a TTS server.
+
+    Engines used to call `requests` in a worker thread: each sentence opened
+    a new TCP connection (and did a TLS handshake for remote APIs) and held
+    a thread until the audio arrived. The transport keeps connections alive
+    in a pool, with a limit per host so a long reply cannot flood a local
+    TTS server, and retries requests that failed to connect or were turned
+    away with a 429/502/503/504.
+
+    Async requests use one aiohttp session per event loop, so cancelling a
+    synthesis closes its request. The blocking variant (for `generate_audio`
+    and TTS worker processes) uses a pooled `requests` session.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 32,
+        max_connections_per_host: int = 8,
+        timeout: float = 120,
+        connect_timeout: float = 10,
+        retries: int = 2,
+        retry_backoff: float = 0.5,
+    ):
+        self._lock = threading.Lock()
+        self._session: aiohttp.ClientSession | None = None
+        self._session_loop: asyncio.AbstractEventLoop | None = None
+        self._sync_session: requests.Session | None = None
+        self._settings = {}
+        self.configure(
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            retries=retries,
+            retry_backoff=retry_backoff,
+        )
+
+    def configure(self, **settings) -> None:
+        """
+        Change the connection limits, timeouts or retries. Requests in flight
+        finish on their current connections.
+        """
+        settings = {**self._settings, **settings}
+        if settings == self._settings:
+            return
+        self._settings = settings
+        self.max_connections = settings["max_connections"]
+        self.max_connections_per_host = settings["max_connections_per_host"]
+        self.timeout = settings["timeout"]
+        self.connect_timeout = settings["connect_timeout"]
+        self.retries = settings["retries"]
+        self.retry_backoff = settings["retry_backoff"]
+
+        with self._lock:
+            session, self._session = self._session, None
+            loop, self._session_loop = self._session_loop, None
+            sync_session, self._sync_session = self._sync_session, None
+        if session is not None and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        if sync_session is not None:
+            sync_session.close()
+
+    async def request(self, request: HttpRequest) -> bytes:
+        """
+        Send a request and return the response body.
+
+        Raises:
+            TTSHttpError: If there was no response or its status is not 2xx.
+        """
+        session = self.session()
+        for attempt in range(self.retries + 1):
+            retry = attempt < self.retries
+            try:
+                async with session.request(
+                    request.method,
+                    request.url,
+                    params=request.params,
+                    json=request.json,
+                    headers=request.headers,
+                ) as response:
+                    if response.status in RETRY_STATUSES and retry:
+                        reason = f"status {response.status}"
+                    elif response.status >= 400:
+                        body = await response.text(errors="replace")
+                        raise TTSHttpError(
+                            f"{request.url} returned status {response.status}: "
+                            f"{body[:200]}",
+                            response.status,
+                        )
+                    else:
+                        return await response.read()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # Includes keep-alive connections the server closed meanwhile
+                if not retry:
+                    raise TTSHttpError(f"{request.url}: {type(e).__name__}: {e}")
+                reason = f"{type(e).__name__}: {e}"
+            except aiohttp.ClientError as e:
+                raise TTSHttpError(f"{request.url}: {type(e).__name__}: {e}")
+
+            delay = self.retry_backoff * 2**attempt
+            logger.warning(
+                f"TTS request to {request.url} failed ({reason}), "
+                f"retrying in {delay:.1f}s"
+            )
+            await asyncio.sleep(delay)
+
+    def request_sync(self, request: HttpRequest) -> bytes:
+        """Blocking version of `request`."""
+        try:
+            response = self._get_sync_session().request(
+                request.method,
+                request.url,
+                params=request.params,
+                json=request.json,
+                headers=request.headers,
+                timeout=(self.connect_timeout, self.timeout),
+            )
+        except requests.RequestException as e:
+            raise TTSHttpError(f"{request.url}: {type(e).__name__}: {e}")
+        if response.status_code >= 400:
+            raise TTSHttpError(
+                f"{request.url} returned status {response.status_code}: "
+                f"{response.text[:200]}",
+                response.status_code,
+            )
+        return response.content
+
+    def session(self) -> aiohttp.ClientSession:
+        """The aiohttp session of the running event loop, also used for WebSockets."""
+        # aiohttp sessions belong to the event loop they were created in
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if (
+                self._session is None
+                or self._session.closed
+                or self._session_loop is not loop
+            ):
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        limit=self.max_connections,
+                        limit_per_host=self.max_connections_per_host,
+                    ),
+                    timeout=aiohttp.ClientTimeout(
+                        total=self.timeout, sock_connect=self.connect_timeout
+                    ),
+                )
+                self._session_loop = loop
+            return self._session
+
+    def _get_sync_session(self) -> requests.Session:
+        with self._lock:
+            if self._sync_session is None:
+                adapter = HTTPAdapter(
+                    pool_connections=self.max_connections,
+                    pool_maxsize=self.max_connections_per_host,
+                    max_retries=Retry(
+                        total=self.retries,
+                        backoff_factor=self.retry_backoff,
+                        status_forcelist=RETRY_STATUSES,
+                        allowed_methods=None,  # TTS requests are safe to repeat
+                        raise_on_status=False,
+                    ),
+                )
+                self._sync_session = requests.Session()
+                self._sync_session.mount("http://", adapter)
+                self._sync_session.mount("https://", adapter)
+            return self._sync_session
+
+
+_transport = HttpTransport()
+
+
+def get_http_transport() -> HttpTransport:
+    """The HTTP transport shared by all TTS engines of this process."""
+    return _transport
+
+
+class HttpTTSInterface(TTSInterface):
+    """
+    Base class of the engines that synthesize with one HTTP request to a TTS
+    server, through the shared HttpTransport. The async methods await the
+    request directly, without a worker thread.
+
+    Subclasses build the request, and can override `parse_response` when the
+    body is not the audio file itself.
+    """
+
+    file_extension: str = "wav"
+
+    @abc.abstractmethod
+    def build_request(self, text: str) -> HttpRequest:
+        """The request that synthesizes `text`."""
+        raise NotImplementedError
+
+    def parse_response(self, body: bytes) -> bytes:
+        """The audio file in the response body."""
+        return body
+
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        try:
+            body = await get_http_transport().request(self.build_request(text))
+            return SynthesizedAudio(audio_bytes=self.parse_response(body))
+        except TTSHttpError as e:
+            logger.critical(f"Error: Failed to generate audio: {e}")
+            return None
+
+    def generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        try:
+            body = get_http_transport().request_sync(self.build_request(text))
+            return SynthesizedAudio(audio_bytes=self.parse_response(body))
+        except TTSHttpError as e:
+            logger.critical(f"Error: Failed to generate audio: {e}")
+            return None
+
+    async def async_generate_audio(self, text: str, file_name_no_ext=None) -> str:
+        audio = await self.async_generate_audio_bytes(text)
+        return self._write_audio(audio, file_name_no_ext)
+
+    def generate_audio(self, text: str, file_name_no_ext=None) -> str:
+        audio = self.generate_audio_bytes(text)
+        return self._write_audio(audio, file_name_no_ext)
+
+    def _write_audio(self, audio: SynthesizedAudio | None, file_name_no_ext) -> str:
+        if audio is None:
+            return None
+        file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
+        with open(file_name, "wb") as audio_file:
+            audio_file.write(audio.audio_bytes)
+        return file_name
@@ -1,9 +1,11 @@
 import os
 import sys
+import asyncio
 
+import numpy as np
 from melo.api import TTS
 
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
@@ -59,15 +61,40 @@ class TTSEngine(TTSInterface):
 
             return file_name
         except LookupError:
-            import nltk
-            import ssl
+            self._download_nltk_tagger()
+            return self.generate_audio(text, file_name_no_ext)
 
-            try:
-                _create_unverified_https_context = ssl._create_unverified_context
-            except AttributeError:
-                pass
-            else:
-                ssl._create_default_https_context = _create_unverified_https_context
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio:
+        return await asyncio.to_thread(self.generate_audio_bytes, text)
 
-            nltk.download("averaged_perceptron_tagger_eng")
-            return self.generate_audio(text, file_name_no_ext)
+    def generate_audio_bytes(self, text: str) -> SynthesizedAudio:
+        """
+        Generate speech in memory: without an output path, tts_to_file
+        returns the samples instead of writing them.
+        """
+        try:
+            samples = self.model.tts_to_file(
+                text, self.speaker_id, None, speed=self.speed
+            )
+        except LookupError:
+            self._download_nltk_tagger()
+            return self.generate_audio_bytes(text)
+
+        return SynthesizedAudio(
+            samples=np.asarray(samples, dtype=np.float32),
+            sample_rate=self.model.hps.data.sampling_rate,
+        )
+
+    @staticmethod
+    def _download_nltk_tagger():
+        import nltk
+        import ssl
+
+        try:
+            _create_unverified_https_context = ssl._create_unverified_context
+        except AttributeError:
+            pass
+        else:
+            ssl._create_default_https_context = _create_unverified_https_context
+
+        nltk.download("averaged_perceptron_tagger_eng")
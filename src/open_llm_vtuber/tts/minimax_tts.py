@@ -1,10 +1,10 @@
 import os
-import requests
+import json
 from loguru import logger
-from .tts_interface import TTSInterface
+from .http_transport import HttpTTSInterface, HttpRequest, TTSHttpError
 
 
-class TTSEngine(TTSInterface):
+class TTSEngine(HttpTTSInterface):
     def __init__(
         self,
         group_id: str,
@@ -23,10 +23,7 @@ class TTSEngine(TTSInterface):
         if not os.path.exists(self.cache_dir):
             os.makedirs(self.cache_dir)
 
-    def generate_audio(self, text: str, file_name_no_ext=None) -> str:
-        import json
-
-        file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
+    def build_request(self, text: str) -> HttpRequest:
         url = "https://api.minimax.chat/v1/t2a_v2?GroupId=" + self.group_id
         headers = {
             "accept": "application/json, text/plain, */*",
@@ -63,27 +60,23 @@ class TTSEngine(TTSInterface):
                 "channel": 1,
             },
         }
+        return HttpRequest("POST", url, json=body, headers=headers)
 
-        try:
-            response = requests.request(
-                "POST", url, stream=True, headers=headers, data=json.dumps(body)
-            )
-            audio = b""
-            for chunk in response.raw:
-                if chunk:
-                    if chunk[:5] == b"data:":
-                        try:
-                            data = json.loads(chunk[5:])
-                            if "data" in data and "extra_info" not in data:
-                                if "audio" in data["data"]:
-                                    hex_audio = data["data"]["audio"]
-                                    decoded = bytes.fromhex(hex_audio)
-                                    audio += decoded
-                        except Exception as e:
-                            logger.error(f"Failed to parse audio chunk: {e}")
-            with open(file_name, "wb") as f:
-                f.write(audio)
-            return file_name
-        except Exception as e:
-            logger.error(f"Exception in minimax_tts generate_audio: {e}")
-            return None
+    def parse_response(self, body: bytes) -> bytes:
+        # The response is a stream of server-sent events, each with a piece of
+        # the audio in hex. The last one repeats the whole audio with its
+        # extra_info, and is skipped.
+        audio = b""
+        for line in body.splitlines():
+            if line[:5] == b"data:":
+                try:
+                    data = json.loads(line[5:])
+                    if "data" in data and "extra_info" not in data:
+                        if "audio" in data["data"]:
+                            audio += bytes.fromhex(data["data"]["audio"])
+                except Exception as e:
+                    logger.error(f"Failed to parse audio chunk: {e}")
+        if not audio:
+            # e.g. an invalid API key, reported in a JSON body with status 200
+            raise TTSHttpError(f"No audio in Minimax response: {body[:200]!r}")
+        return audio
@@ -2,11 +2,13 @@
 import os
 import sys
 from pathlib import Path
+from typing import AsyncIterator
 
+import numpy as np
 from loguru import logger
 from openai import OpenAI  # Use the official OpenAI library
 
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio, stream_in_thread
 
 # Add the current directory to sys.path for relative imports if needed
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -117,6 +119,46 @@ class TTSEngine(TTSInterface):
 
         return str(speech_file_path)
 
+    # The "pcm" response format is raw 16-bit mono samples at 24 kHz
+    STREAM_SAMPLE_RATE = 24000
+    # Bytes per streamed chunk: 200 ms of audio
+    STREAM_CHUNK_BYTES = STREAM_SAMPLE_RATE * 2 // 5
+
+    supports_streaming = True
+
+    async def async_stream_audio(
+        self, text: str, speed=1.0
+    ) -> AsyncIterator[SynthesizedAudio]:
+        """
+        Stream speech from the endpoint as raw PCM, chunk by chunk, instead
+        of waiting for the whole file.
+
+        Args:
+            text (str): The text to synthesize.
+            speed (float): The speed of the speech (0.25 to 4.0). Defaults to 1.0.
+        """
+        if not self.client:
+            raise ValueError("OpenAI client not initialized. Cannot generate audio.")
+
+        def produce(emit) -> None:
+            with self.client.audio.speech.with_streaming_response.create(
+                model=self.model,
+                voice=self.voice,
+                input=text,
+                response_format="pcm",
+                speed=speed,
+            ) as response:
+                for data in response.iter_bytes(self.STREAM_CHUNK_BYTES):
+                    chunk = SynthesizedAudio(
+                        samples=np.frombuffer(data[: len(data) // 2 * 2], "<i2"),
+                        sample_rate=self.STREAM_SAMPLE_RATE,
+                    )
+                    if not emit(chunk):
+                        break
+
+        async for chunk in stream_in_thread(produce):
+            yield chunk
+
 
 # Example usage (optional, for testing with the compatible endpoint)
 # if __name__ == '__main__':
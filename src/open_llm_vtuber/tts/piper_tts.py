@@ -1,8 +1,11 @@
 import os
 import wave
+import asyncio
+from typing import AsyncIterator
 
+import numpy as np
 from loguru import logger
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio, stream_in_thread
 
 try:
     from piper import PiperVoice
@@ -115,3 +118,47 @@ class TTSEngine(TTSInterface):
         except Exception as e:
             logger.critical(f"Error: Piper TTS unable to generate audio: {e}")
             return None
+
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        return await asyncio.to_thread(self.generate_audio_bytes, text)
+
+    supports_streaming = True
+
+    async def async_stream_audio(self, text: str) -> AsyncIterator[SynthesizedAudio]:
+        """Streams the audio sentence by sentence, as Piper synthesizes it."""
+
+        def produce(emit) -> None:
+            for chunk in self.voice.synthesize(text, syn_config=self.syn_config):
+                audio = SynthesizedAudio(
+                    samples=np.frombuffer(chunk.audio_int16_bytes, dtype=np.int16),
+                    sample_rate=chunk.sample_rate,
+                )
+                if not emit(audio):
+                    break
+
+        async for chunk in stream_in_thread(produce):
+            yield chunk
+
+    def generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        """Generates speech in memory, with the same audio as synthesize_wav.
+
+        Args:
+            text: The text to convert to speech.
+
+        Returns:
+            The generated audio, or None on failure.
+        """
+        try:
+            chunks = list(self.voice.synthesize(text, syn_config=self.syn_config))
+            if not chunks:
+                logger.error("Piper TTS generated no audio")
+                return None
+
+            samples = np.frombuffer(
+                b"".join(chunk.audio_int16_bytes for chunk in chunks), dtype=np.int16
+            )
+            return SynthesizedAudio(samples=samples, sample_rate=chunks[0].sample_rate)
+
+        except Exception as e:
+            logger.critical(f"Error: Piper TTS unable to generate audio: {e}")
+            return None
@@ -1,10 +1,13 @@
 import sys
 import os
+import asyncio
+from typing import AsyncIterator
 
+import numpy as np
 import sherpa_onnx
 import soundfile as sf
 from loguru import logger
-from .tts_interface import TTSInterface
+from .tts_interface import TTSInterface, SynthesizedAudio, stream_in_thread
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
@@ -89,6 +92,64 @@ class TTSEngine(TTSInterface):
         """
         file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
 
+        audio = self.generate_audio_bytes(text)
+        if audio is None:
+            return None
+
+        try:
+            sf.write(
+                file_name,
+                audio.samples,
+                samplerate=audio.sample_rate,
+                subtype="PCM_16",
+            )
+            return file_name
+
+        except Exception as e:
+            logger.critical(f"\nError: sherpa-onnx unable to write audio: {e}")
+            return None
+
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        return await asyncio.to_thread(self.generate_audio_bytes, text)
+
+    supports_streaming = True
+    # Sentences of a batch go through the model max_num_sentences at a time
+    supports_batching = True
+
+    async def async_stream_audio(self, text: str) -> AsyncIterator[SynthesizedAudio]:
+        """
+        Stream the audio with the sherpa-onnx generation callback, which is
+        called as each part of the text (e.g. each sentence) is synthesized.
+        """
+
+        def produce(emit) -> None:
+            def callback(samples, progress) -> int:
+                # The samples buffer is reused by sherpa-onnx, copy it
+                chunk = SynthesizedAudio(
+                    samples=np.array(samples, dtype=np.float32),
+                    sample_rate=self.tts.sample_rate,
+                )
+                return 1 if emit(chunk) else 0  # 0 stops the generation
+
+            audio = self.tts.generate(
+                text, sid=self.sid, speed=self.speed, callback=callback
+            )
+            if len(audio.samples) == 0:
+                raise ValueError("sherpa-onnx generated no audio")
+
+        async for chunk in stream_in_thread(produce):
+            yield chunk
+
+    def generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        """
+        Generate speech with sherpa-onnx TTS, keeping the samples in memory.
+
+        Parameters:
+            text (str): The text to speak.
+
+        Returns:
+            SynthesizedAudio | None: The generated audio, or None on failure.
+        """
         try:
             audio = self.tts.generate(text, sid=self.sid, speed=self.speed)
 
@@ -98,15 +159,11 @@ class TTSEngine(TTSInterface):
                 )
                 return None
 
-            sf.write(
-                file_name,
-                audio.samples,
-                samplerate=audio.sample_rate,
-                subtype="PCM_16",
+            return SynthesizedAudio(
+                samples=np.asarray(audio.samples, dtype=np.float32),
+                sample_rate=audio.sample_rate,
             )
 
-            return file_name
-
         except Exception as e:
             logger.critical(f"\nError: sherpa-onnx unable to generate audio: {e}")
             return None
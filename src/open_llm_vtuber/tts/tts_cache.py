@@ -0,0 +1,237 @@
+import os
+import re
+import json
+import base64
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from loguru import logger
+
+from ..utils.stream_audio import EncodedAudio
+
+
+@dataclass
+class _Entry:
+    audio: EncodedAudio
+    # How long synthesizing and encoding the audio took, i.e. what a hit saves
+    cost: float
+
+    @property
+    def size(self) -> int:
+        return len(self.audio.wav_bytes) + 8 * len(self.audio.volumes)
+
+
+class TTSCache:
+    """
+    Content-addressed cache of synthesized sentences, ready to send.
+
+    Characters repeat many short phrases (greetings, fillers, proactive
+    replies, error messages). Entries are keyed by a hash of the normalized
+    text, the TTS engine and its configuration, so a voice, speed or speaker
+    change never returns stale audio. The value is what the client receives:
+    the base64 audio and its volume envelope.
+
+    There are two tiers: an LRU in memory bounded by `max_memory_bytes`, and
+    optionally a directory on disk bounded by `max_disk_bytes`, evicting the
+    least recently used files. Disk hits are promoted to memory.
+    """
+
+    def __init__(
+        self,
+        engine_type: str,
+        engine_config: dict,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        disk_dir: str | None = None,
+        max_disk_bytes: int = 512 * 1024 * 1024,
+    ):
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = disk_dir or None
+        self.max_disk_bytes = max_disk_bytes
+        self._key_prefix = json.dumps(
+            {"engine": engine_type, "config": engine_config},
+            sort_keys=True,
+            default=str,
+        )
+
+        self._memory: OrderedDict[str, _Entry] = OrderedDict()
+        self._memory_bytes = 0
+        # file name -> size, in least to most recently used order
+        self._disk_index: OrderedDict[str, int] = OrderedDict()
+        self._disk_bytes = 0
+        # Disk reads and writes run in worker threads
+        self._disk_lock = threading.Lock()
+        if self.disk_dir:
+            self._load_disk_index()
+
+        # Counters
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict:
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "time_saved_seconds": self.time_saved,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_entries": len(self._disk_index),
+            "disk_bytes": self._disk_bytes,
+        }
+
+    def key(self, text: str) -> str:
+        """Hash of the normalized text, the engine and its configuration."""
+        normalized = re.sub(r"\s+", " ", text).strip()
+        return hashlib.sha256(
+            f"{self._key_prefix}\n{normalized}".encode("utf-8")
+        ).hexdigest()
+
+    def contains(self, text: str) -> bool:
+        """Whether the audio of a sentence is cached, without counting a lookup."""
+        key = self.key(text)
+        return key in self._memory or f"{key}.json" in self._disk_index
+
+    async def get(self, text: str) -> EncodedAudio | None:
+        """Look up the audio of a sentence, counting the hit or miss."""
+        key = self.key(text)
+
+        entry = self._memory.get(key)
+        if entry is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return self._hit(entry, "memory")
+
+        if self.disk_dir and f"{key}.json" in self._disk_index:
+            entry = await asyncio.to_thread(self._read_disk, key)
+            if entry is not None:
+                self._put_memory(key, entry)
+                self.disk_hits += 1
+                return self._hit(entry, "disk")
+
+        self.misses += 1
+        return None
+
+    async def put(self, text: str, audio: EncodedAudio, cost: float) -> None:
+        """
+        Store the audio of a sentence.
+
+        Args:
+            text: The text that was synthesized.
+            audio: The encoded audio and its volume envelope.
+            cost: Seconds it took to produce, credited to `time_saved` on hits.
+        """
+        key = self.key(text)
+        entry = _Entry(audio, cost)
+        self._put_memory(key, entry)
+        if self.disk_dir:
+            await asyncio.to_thread(self._write_disk, key, entry)
+
+    def _hit(self, entry: _Entry, tier: str) -> EncodedAudio:
+        self.time_saved += entry.cost
+        logger.debug(
+            f"TTS cache {tier} hit, saved {entry.cost:.2f}s "
+            f"({self.hits} hits / {self.misses} misses, "
+            f"{self.time_saved:.1f}s saved in total)"
+        )
+        return entry.audio
+
+    def _put_memory(self, key: str, entry: _Entry) -> None:
+        if entry.size > self.max_memory_bytes:
+            return
+        old = self._memory.pop(key, None)
+        if old is not None:
+            self._memory_bytes -= old.size
+        self._memory[key] = entry
+        self._memory_bytes += entry.size
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.size
+
+    def _load_disk_index(self) -> None:
+        """Index the files already on disk, oldest access first."""
+        os.makedirs(self.disk_dir, exist_ok=True)
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if entry.is_file() and entry.name.endswith(".json"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        for _, name, size in sorted(files):
+            self._disk_index[name] = size
+            self._disk_bytes += size
+        self._evict_disk()
+        logger.info(
+            f"TTS disk cache: {len(self._disk_index)} entries, "
+            f"{self._disk_bytes / 1024 / 1024:.1f} MiB in {self.disk_dir}"
+        )
+
+    def _read_disk(self, key: str) -> _Entry | None:
+        name = f"{key}.json"
+        path = os.path.join(self.disk_dir, name)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            audio = EncodedAudio(base64.b64decode(data["audio"]), data["volumes"])
+            entry = _Entry(audio, data["cost"])
+            os.utime(path)  # most recently used
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Dropping unreadable TTS cache file {path}: {e}")
+            with self._disk_lock:
+                self._remove_disk(name)
+            return None
+        with self._disk_lock:
+            if name in self._disk_index:
+                self._disk_index.move_to_end(name)
+        return entry
+
+    def _write_disk(self, key: str, entry: _Entry) -> None:
+        name = f"{key}.json"
+        path = os.path.join(self.disk_dir, name)
+        data = json.dumps(
+            {
+                "audio": entry.audio.audio_base64,
+                "volumes": entry.audio.volumes,
+                "cost": entry.cost,
+            }
+        )
+        # Write to a temporary file first so readers never see partial entries
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Failed to write TTS cache file {path}: {e}")
+            return
+
+        with self._disk_lock:
+            self._disk_bytes += len(data) - self._disk_index.pop(name, 0)
+            self._disk_index[name] = len(data)
+            self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        """Remove least recently used files until under max_disk_bytes."""
+        while self._disk_bytes > self.max_disk_bytes and self._disk_index:
+            name = next(iter(self._disk_index))
+            self._remove_disk(name)
+
+    def _remove_disk(self, name: str) -> None:
+        self._disk_bytes -= self._disk_index.pop(name, 0)
+        try:
+            os.remove(os.path.join(self.disk_dir, name))
+        except OSError:
+            pass
@@ -184,6 +184,7 @@ class TTSFactory:
                 similarity_boost=kwargs.get("similarity_boost", 0.5),
                 style=kwargs.get("style", 0.0),
                 use_speaker_boost=kwargs.get("use_speaker_boost", True),
+                websocket=kwargs.get("websocket", False),
             )
         elif engine_type == "cartesia_tts":
             from .cartesia_tts import TTSEngine as CartesiaTTSEngine
@@ -197,6 +198,7 @@ class TTSFactory:
                 emotion=kwargs.get("emotion", "neutral"),
                 volume=kwargs.get("volume", 1.0),
                 speed=kwargs.get("speed", 1.0),
+                websocket=kwargs.get("websocket", False),
             )
         elif engine_type == "piper_tts":
             from .piper_tts import TTSEngine as PiperTTSEngine
@@ -1,9 +1,123 @@
 import abc
 import os
+import uuid
 import asyncio
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import AsyncIterator, Callable, TypeVar
 
+import numpy as np
 from loguru import logger
 
+from ..utils.wav_parser import encode_wav, parse_wav
+from ..utils.pause_split import split_at_pauses
+
+T = TypeVar("T")
+
+
+@dataclass
+class SynthesizedAudio:
+    """
+    Speech synthesized in memory: either PCM samples with their sample rate,
+    or an encoded audio file (WAV, MP3, ...) as bytes.
+    """
+
+    samples: np.ndarray | None = None  # int16, or float in [-1, 1]
+    sample_rate: int | None = None
+    audio_bytes: bytes | None = None
+
+    def to_bytes(self) -> bytes:
+        """The audio as a file: `audio_bytes`, or the samples encoded as WAV."""
+        if self.audio_bytes is not None:
+            return self.audio_bytes
+        return encode_wav(self.samples, self.sample_rate)
+
+    def to_float32(self) -> tuple[np.ndarray, int]:
+        """
+        The samples as float32 in [-1, 1], shape (frames, channels), and the
+        sample rate.
+
+        Raises:
+            ValueError: If the audio is a file this cannot decode (not WAV).
+        """
+        if self.samples is None:
+            wav = parse_wav(self.audio_bytes)
+            return wav.to_float32(), wav.sample_rate
+        samples = self.samples
+        if samples.dtype == np.int16:
+            samples = samples.astype(np.float32) / 32768
+        samples = samples.astype(np.float32, copy=False)
+        return samples.reshape(len(samples), -1), self.sample_rate
+
+    @classmethod
+    def join(cls, chunks: list["SynthesizedAudio"]) -> "SynthesizedAudio":
+        """
+        Concatenate the chunks of a streamed sentence.
+
+        Raises:
+            ValueError: If a chunk cannot be decoded, or the chunks do not
+                share a sample rate and channel count.
+        """
+        decoded = [chunk.to_float32() for chunk in chunks]
+        if not decoded or len({(sr, s.shape[1]) for s, sr in decoded}) != 1:
+            raise ValueError("Cannot join audio chunks with different formats")
+        return cls(
+            samples=np.concatenate([samples for samples, _ in decoded]),
+            sample_rate=decoded[0][1],
+        )
+
+
+async def stream_in_thread(
+    producer: Callable[[Callable[[T], bool]], None],
+) -> AsyncIterator[T]:
+    """
+    Run a blocking producer in a worker thread and iterate over what it
+    produces, as it produces it.
+
+    `producer(emit)` calls `emit(item)` for each item. `emit` returns False
+    once the consumer has stopped iterating, so the producer can stop early
+    (e.g. return 0 from a synthesis callback). Exceptions raised by the
+    producer are raised by the iteration.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stopped = threading.Event()
+    done = object()
+
+    def put(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:  # the event loop is closed
+            stopped.set()
+
+    def emit(item: T) -> bool:
+        if stopped.is_set():
+            return False
+        put((item, None))
+        return True
+
+    def run() -> None:
+        try:
+            producer(emit)
+        except Exception as e:
+            put((done, e))
+        else:
+            put((done, None))
+
+    loop.run_in_executor(None, run)
+    try:
+        while True:
+            item, error = await queue.get()
+            if item is done:
+                if error is not None:
+                    raise error
+                break
+            yield item
+    finally:
+        # The producer finishes in the background after its next emit
+        stopped.set()
+
 
 class TTSInterface(metaclass=abc.ABCMeta):
     async def async_generate_audio(self, text: str, file_name_no_ext=None) -> str:
@@ -24,6 +138,147 @@ class TTSInterface(metaclass=abc.ABCMeta):
         """
         return await asyncio.to_thread(self.generate_audio, text, file_name_no_ext)
 
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        """
+        Asynchronously generate speech audio in memory.
+
+        By default, this runs generate_audio_bytes in a worker thread, so that
+        its file is removed even if the caller is cancelled meanwhile. Engines
+        with their own async_generate_audio have their file generated with it.
+
+        text: str
+            the text to speak
+
+        Returns:
+        SynthesizedAudio | None: the generated audio, or None on failure
+
+        """
+        if type(self).async_generate_audio is TTSInterface.async_generate_audio:
+            return await asyncio.to_thread(self.generate_audio_bytes, text)
+
+        # The engine generates its files asynchronously
+        audio_file_path = await self.async_generate_audio(
+            text, self._temp_file_name_no_ext()
+        )
+        if not audio_file_path:
+            return None
+        try:
+            audio_bytes = await asyncio.to_thread(self._read_file, audio_file_path)
+        finally:
+            self.remove_file(audio_file_path)
+        return SynthesizedAudio(audio_bytes=audio_bytes)
+
+    # Whether async_stream_audio yields audio while a sentence is still being
+    # synthesized. Engines that override it set this to True.
+    supports_streaming: bool = False
+
+    async def async_stream_audio(self, text: str) -> AsyncIterator[SynthesizedAudio]:
+        """
+        Asynchronously generate speech audio in chunks, in order, so playback
+        can start before the whole text is synthesized.
+
+        By default, this yields the result of async_generate_audio_bytes as a
+        single chunk. Unlike the other methods, failures raise instead of
+        returning None, since earlier chunks may already be playing.
+
+        text: str
+            the text to speak
+
+        Yields:
+        SynthesizedAudio: the next chunk of audio
+
+        """
+        audio = await self.async_generate_audio_bytes(text)
+        if audio is None:
+            raise ValueError("TTS engine returned no audio")
+        yield audio
+
+    # Whether synthesizing several sentences in one call is cheaper than one
+    # call each, e.g. because the engine batches them through its model.
+    # Engines that benefit set this to True.
+    supports_batching: bool = False
+
+    async def async_generate_audio_batch(
+        self, texts: list[str]
+    ) -> list[SynthesizedAudio] | None:
+        """
+        Asynchronously generate the speech of several sentences in one call.
+
+        By default, this synthesizes the sentences joined together and cuts
+        the audio at the pauses between them (see split_at_pauses). The
+        caller should synthesize the sentences one by one if this fails.
+
+        texts: list[str]
+            the sentences to speak, in order
+
+        Returns:
+        list[SynthesizedAudio] | None: the audio of each sentence, or None if
+        the synthesis failed or the audio could not be split
+
+        """
+        # Only WAV can be cut, don't synthesize the sentences twice for nothing
+        file_extension = getattr(self, "file_extension", "wav")
+        if file_extension != "wav":
+            logger.warning(f"Cannot split batched {file_extension} audio")
+            return None
+
+        audio = await self.async_generate_audio_bytes(" ".join(texts))
+        if audio is None:
+            return None
+        try:
+            samples, sample_rate = audio.to_float32()
+        except ValueError as e:
+            logger.warning(f"Cannot split batched audio: {e}")
+            return None  # e.g. MP3
+
+        cuts = split_at_pauses(samples, sample_rate, [len(text) for text in texts])
+        if cuts is None:
+            logger.warning("No pause found between batched sentences")
+            return None
+        bounds = [0, *cuts, len(samples)]
+        return [
+            SynthesizedAudio(samples=samples[start:end], sample_rate=sample_rate)
+            for start, end in zip(bounds, bounds[1:])
+        ]
+
+    async def aclose(self) -> None:
+        """
+        Release what the engine holds open, e.g. the connections or worker
+        processes of a remote or pooled engine. The engine is not used again.
+        """
+
+    def generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        """
+        Generate speech audio in memory.
+
+        By default, this generates a file with generate_audio, reads it and
+        removes it. Engines that have the samples in memory anyway override
+        this to skip the round trip through the cache directory.
+
+        text: str
+            the text to speak
+
+        Returns:
+        SynthesizedAudio | None: the generated audio, or None on failure
+
+        """
+        audio_file_path = self.generate_audio(text, self._temp_file_name_no_ext())
+        if not audio_file_path:
+            return None
+        try:
+            return SynthesizedAudio(audio_bytes=self._read_file(audio_file_path))
+        finally:
+            self.remove_file(audio_file_path)
+
+    @staticmethod
+    def _temp_file_name_no_ext() -> str:
+        return f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
+
+    @staticmethod
+    def _read_file(filepath: str) -> bytes:
+        with open(filepath, "rb") as f:
+            return f.read()
+
     @abc.abstractmethod
     def generate_audio(self, text: str, file_name_no_ext=None) -> str:
         """
@@ -0,0 +1,204 @@
+import time
+import heapq
+import asyncio
+import itertools
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Hashable
+
+from loguru import logger
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    order: int
+    session: Hashable = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued_at: float = field(compare=False)
+
+
+class TTSScheduler:
+    """
+    Limits how many sentences are synthesized at once by a TTS engine.
+
+    A long reply queues a TTS job per sentence. Without a limit they all
+    start together, and the first sentence, which the user is waiting for,
+    competes with the last one for the engine (a thread pool, a GPU or a
+    local TTS server). Jobs wait for a slot instead: at most
+    `max_concurrency` run at once in total, and at most
+    `max_concurrency_per_session` for a single conversation. Free slots go to
+    the waiting job with the lowest priority value, i.e. the earliest
+    sentence of its reply, so sentence N+1 is synthesized before N+5.
+
+    Jobs cancelled while waiting (e.g. the user interrupted the reply) never
+    reach the engine. The synthesis time this saves is estimated from the
+    mean run time of completed jobs.
+    """
+
+    def __init__(self, max_concurrency: int = 4, max_concurrency_per_session: int = 2):
+        if max_concurrency < 1 or max_concurrency_per_session < 1:
+            raise ValueError("TTS concurrency limits must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.max_concurrency_per_session = max_concurrency_per_session
+
+        self._waiters: list[_Waiter] = []  # heap
+        self._order = itertools.count()
+        self._active = 0
+        self._active_by_session: dict[Hashable, int] = {}
+
+        # Metrics
+        self.jobs = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.max_queue_depth = 0
+        self.completed_jobs = 0
+        self.total_run_time = 0.0
+        self.cancelled_before_start = 0
+        self.cancelled_while_running = 0
+        self.time_saved_by_cancellation = 0.0
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of jobs waiting for a slot."""
+        return len(self._waiters)
+
+    @property
+    def active(self) -> int:
+        """Number of jobs running."""
+        return self._active
+
+    @property
+    def mean_run_time(self) -> float:
+        """Mean time a completed job held its slot, in seconds."""
+        if not self.completed_jobs:
+            return 0.0
+        return self.total_run_time / self.completed_jobs
+
+    def stats(self) -> dict:
+        return {
+            "active": self._active,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "jobs": self.jobs,
+            "mean_wait_seconds": self.total_wait / self.jobs if self.jobs else 0.0,
+            "max_wait_seconds": self.max_wait,
+            "mean_run_seconds": self.mean_run_time,
+            "cancelled_before_start": self.cancelled_before_start,
+            "cancelled_while_running": self.cancelled_while_running,
+            "time_saved_by_cancellation_seconds": self.time_saved_by_cancellation,
+        }
+
+    def log_stats(self, reason: str) -> None:
+        """Log the queue depth, wait times and cancellations of the jobs so far."""
+        stats = self.stats()
+        logger.info(
+            f"TTS scheduler ({reason}): {stats['jobs']} jobs, "
+            f"{stats['active']} running, {stats['queue_depth']} queued "
+            f"(max {stats['max_queue_depth']}), waited "
+            f"{stats['mean_wait_seconds'] * 1000:.0f} ms on average "
+            f"(max {stats['max_wait_seconds'] * 1000:.0f} ms), synthesized in "
+            f"{stats['mean_run_seconds'] * 1000:.0f} ms on average; "
+            f"{stats['cancelled_before_start']} cancelled before starting, "
+            f"{stats['cancelled_while_running']} while running, saving "
+            f"{stats['time_saved_by_cancellation_seconds']:.1f}s of synthesis"
+        )
+
+    @asynccontextmanager
+    async def slot(self, session: Hashable, priority: int) -> AsyncIterator[None]:
+        """
+        Wait for a slot to synthesize, and hold it in the `async with` block.
+
+        Args:
+            session: Identifies the conversation the job belongs to, for the
+                per-session limit.
+            priority: Lower runs first, e.g. the sentence's sequence number.
+        """
+        await self._acquire(session, priority)
+        started = time.perf_counter()
+        try:
+            yield
+        except asyncio.CancelledError:
+            # Engines running in a worker thread cannot be stopped and finish
+            # in the background, so no time saved is counted for these
+            self.cancelled_while_running += 1
+            raise
+        else:
+            self.completed_jobs += 1
+            self.total_run_time += time.perf_counter() - started
+        finally:
+            self._release(session)
+
+    def _can_run(self, session: Hashable) -> bool:
+        return (
+            self._active < self.max_concurrency
+            and self._active_by_session.get(session, 0)
+            < self.max_concurrency_per_session
+        )
+
+    def _start(self, session: Hashable, wait: float) -> None:
+        self._active += 1
+        self._active_by_session[session] = self._active_by_session.get(session, 0) + 1
+        self.jobs += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    async def _acquire(self, session: Hashable, priority: int) -> None:
+        # Waiting jobs are only ever blocked by their own session's limit when
+        # a slot is free, so a new job that can run does not jump the queue.
+        if self._can_run(session):
+            self._start(session, 0.0)
+            return
+
+        waiter = _Waiter(
+            priority=priority,
+            order=next(self._order),
+            session=session,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=time.perf_counter(),
+        )
+        heapq.heappush(self._waiters, waiter)
+        self.max_queue_depth = max(self.max_queue_depth, len(self._waiters))
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # The slot was granted just before the cancellation
+                self._release(session)
+            else:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    heapq.heapify(self._waiters)
+                self.cancelled_before_start += 1
+                self.time_saved_by_cancellation += self.mean_run_time
+            raise
+
+        wait = time.perf_counter() - waiter.enqueued_at
+        logger.debug(
+            f"TTS job (priority {priority}) waited {wait * 1000:.0f} ms, "
+            f"{self.queue_depth} still queued"
+        )
+
+    def _release(self, session: Hashable) -> None:
+        self._active -= 1
+        remaining = self._active_by_session.get(session, 1) - 1
+        if remaining:
+            self._active_by_session[session] = remaining
+        else:
+            self._active_by_session.pop(session, None)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the waiting jobs, highest priority first."""
+        blocked = []
+        while self._waiters and self._active < self.max_concurrency:
+            waiter = heapq.heappop(self._waiters)
+            if waiter.future.done():
+                continue  # cancelled, its task has not run its handler yet
+            if not self._can_run(waiter.session):
+                blocked.append(waiter)
+                continue
+            self._start(waiter.session, time.perf_counter() - waiter.enqueued_at)
+            waiter.future.set_result(None)
+        for waiter in blocked:
+            heapq.heappush(self._waiters, waiter)
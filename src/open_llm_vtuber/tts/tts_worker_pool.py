@@ -0,0 +1,269 @@
+import asyncio
+import threading
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future
+from multiprocessing.connection import Connection
+
+import numpy as np
+from loguru import logger
+
+from .tts_interface import TTSInterface, SynthesizedAudio
+from ..utils.wav_parser import is_wav
+
+
+def _worker_main(conn: Connection, engine_type: str, engine_config: dict) -> None:
+    """
+    Entry point of a worker process: load the engine once, then synthesize
+    the texts received on `conn` one at a time.
+
+    Each reply is a header `(error, format)`, followed by the audio as raw
+    bytes when there is audio: the PCM samples, or the encoded file.
+    """
+    from .tts_factory import TTSFactory
+
+    try:
+        engine = TTSFactory.get_tts_engine(engine_type, **engine_config)
+    except Exception as e:
+        conn.send(f"{type(e).__name__}: {e}")
+        return
+    conn.send(None)  # ready
+
+    while True:
+        try:
+            text = conn.recv()
+        except (EOFError, OSError):
+            break
+        if text is None:
+            break
+
+        try:
+            audio = engine.generate_audio_bytes(text)
+        except Exception as e:
+            conn.send((f"{type(e).__name__}: {e}", None))
+            continue
+
+        if audio is None:
+            conn.send((None, None))
+        elif audio.samples is not None:
+            samples = np.ascontiguousarray(audio.samples)
+            audio_format = (
+                "samples",
+                samples.dtype.str,
+                samples.shape,
+                audio.sample_rate,
+            )
+            conn.send((None, audio_format))
+            conn.send_bytes(samples)
+        else:
+            conn.send((None, ("file",)))
+            conn.send_bytes(audio.audio_bytes)
+
+
+class _Worker:
+    """A worker process, the requests queued for it and the one it runs."""
+
+    def __init__(self, index: int, process, conn: Connection):
+        self.index = index
+        self.process = process
+        self.conn = conn
+        self.queue: deque[tuple[Future, str]] = deque()
+        self.in_flight: Future | None = None
+        self.alive = True
+
+    @property
+    def load(self) -> int:
+        return len(self.queue) + (self.in_flight is not None)
+
+
+class TTSWorkerPool(TTSInterface):
+    """
+    Runs a TTS engine in worker processes.
+
+    Local engines (sherpa-onnx, Piper, Melo, Coqui, Bark...) otherwise run in
+    threads of the server process: they share one model instance, and their
+    Python-side work competes with the server for the GIL. Each worker
+    process loads its own instance of the engine once and synthesizes one
+    sentence at a time. Sentences go to the least loaded worker, and the
+    audio comes back through a pipe as raw PCM (or as the encoded file, for
+    engines that produce files).
+
+    Requests are queued in this process until their worker is free, so
+    cancelling a queued request means it is never synthesized.
+    """
+
+    def __init__(self, engine_type: str, engine_config: dict, num_workers: int):
+        if num_workers < 1:
+            raise ValueError("A TTS worker pool needs at least 1 worker")
+        self.engine_type = engine_type
+        self._lock = threading.Lock()
+
+        # spawn rather than fork: engines must not inherit the server's
+        # threads, event loop or CUDA context
+        context = multiprocessing.get_context("spawn")
+        logger.info(f"Starting {num_workers} TTS worker processes for {engine_type}")
+        self._workers: list[_Worker] = []
+        for index in range(num_workers):
+            conn, child_conn = context.Pipe()
+            process = context.Process(
+                target=_worker_main,
+                args=(child_conn, engine_type, engine_config),
+                name=f"tts-worker-{index}",
+                daemon=True,
+            )
+            process.start()
+            child_conn.close()
+            self._workers.append(_Worker(index, process, conn))
+
+        # The workers load their engines in parallel
+        for worker in self._workers:
+            try:
+                error = worker.conn.recv()
+            except EOFError:
+                error = f"exited with code {worker.process.exitcode}"
+            if error is not None:
+                self.close()
+                raise RuntimeError(
+                    f"TTS worker {worker.index} failed to start: {error}"
+                )
+
+        for worker in self._workers:
+            threading.Thread(
+                target=self._read_results,
+                args=(worker,),
+                name=f"tts-worker-{worker.index}-reader",
+                daemon=True,
+            ).start()
+        logger.info(f"TTS worker processes ready (pid {self.pids})")
+
+    @property
+    def num_workers(self) -> int:
+        return len(self._workers)
+
+    @property
+    def pids(self) -> list[int]:
+        return [worker.process.pid for worker in self._workers]
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.close)
+
+    def submit(self, text: str) -> Future:
+        """Queue a text on the least loaded worker."""
+        future = Future()
+        with self._lock:
+            self._queue(future, text)
+        return future
+
+    async def async_generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        try:
+            return await asyncio.wrap_future(self.submit(text))
+        except RuntimeError as e:
+            logger.critical(f"Error: {self.engine_type} unable to generate audio: {e}")
+            return None
+
+    def generate_audio_bytes(self, text: str) -> SynthesizedAudio | None:
+        try:
+            return self.submit(text).result()
+        except RuntimeError as e:
+            logger.critical(f"Error: {self.engine_type} unable to generate audio: {e}")
+            return None
+
+    def generate_audio(self, text: str, file_name_no_ext=None) -> str | None:
+        audio = self.generate_audio_bytes(text)
+        if audio is None:
+            return None
+        audio_bytes = audio.to_bytes()
+        file_name = self.generate_cache_file_name(
+            file_name_no_ext, "wav" if is_wav(audio_bytes) else "mp3"
+        )
+        with open(file_name, "wb") as f:
+            f.write(audio_bytes)
+        return file_name
+
+    def close(self) -> None:
+        """Stop the worker processes and fail the requests they still had."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            worker.conn.close()
+            self._fail(worker, "TTS worker pool closed")
+
+    def _queue(self, future: Future, text: str) -> None:
+        """Put a request on the least loaded worker. Requires self._lock."""
+        workers = [worker for worker in self._workers if worker.alive]
+        if not workers:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RuntimeError("No TTS worker process is running"))
+            return
+        worker = min(workers, key=lambda worker: worker.load)
+        worker.queue.append((future, text))
+        self._send_next(worker)
+
+    def _send_next(self, worker: _Worker) -> None:
+        """Send the next queued request if the worker is idle. Requires self._lock."""
+        while worker.in_flight is None and worker.queue:
+            future, text = worker.queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue  # cancelled while queued
+            try:
+                worker.conn.send(text)
+            except OSError as e:
+                future.set_exception(RuntimeError(f"TTS worker {worker.index}: {e}"))
+                continue
+            worker.in_flight = future
+
+    def _read_results(self, worker: _Worker) -> None:
+        """Reader thread: complete the requests of a worker as it replies."""
+        while True:
+            try:
+                error, audio_format = worker.conn.recv()
+                data = worker.conn.recv_bytes() if audio_format else None
+            except (EOFError, OSError):
+                break
+
+            with self._lock:
+                future, worker.in_flight = worker.in_flight, None
+                self._send_next(worker)
+            if future is None:
+                continue
+
+            if error is not None:
+                future.set_exception(RuntimeError(error))
+            elif audio_format is None:
+                future.set_result(None)
+            elif audio_format[0] == "samples":
+                _, dtype, shape, sample_rate = audio_format
+                samples = np.frombuffer(data, dtype=dtype).reshape(shape)
+                future.set_result(
+                    SynthesizedAudio(samples=samples, sample_rate=sample_rate)
+                )
+            else:
+                future.set_result(SynthesizedAudio(audio_bytes=data))
+
+        if worker.alive and worker in self._workers:
+            worker.process.join(timeout=1)  # to get its exit code
+            logger.error(
+                f"TTS worker {worker.index} (pid {worker.process.pid}) exited "
+                f"unexpectedly with code {worker.process.exitcode}"
+            )
+        self._fail(worker, f"TTS worker {worker.index} exited")
+
+    def _fail(self, worker: _Worker, reason: str) -> None:
+        """Fail the running request of a dead worker, move its queue to others."""
+        with self._lock:
+            worker.alive = False
+            future, worker.in_flight = worker.in_flight, None
+            queued = list(worker.queue)
+            worker.queue.clear()
+            for queued_future, text in queued:
+                self._queue(queued_future, text)
+        if future is not None and not future.done():
+            future.set_exception(RuntimeError(reason))
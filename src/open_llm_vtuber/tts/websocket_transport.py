@@ -0,0 +1,241 @@
+import asyncio
+import json
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable
+
+import aiohttp
+import numpy as np
+from loguru import logger
+
+from .http_transport import get_http_transport
+from .tts_interface import SynthesizedAudio
+
+
+class TTSWebSocketError(Exception):
+    """A streaming TTS API reported an error, or its connection was lost."""
+
+
+@dataclass
+class StreamEvent:
+    """A message of a streaming TTS API, as parsed by the engine."""
+
+    context_id: str | None
+    audio: bytes | None = None
+    done: bool = False
+    error: str | None = None
+
+
+class _Connection:
+    """An open WebSocket and the contexts (sentences) streaming on it."""
+
+    def __init__(
+        self,
+        ws: aiohttp.ClientWebSocketResponse,
+        parse_message: Callable[[dict], StreamEvent],
+    ):
+        self.ws = ws
+        self.contexts: dict[str, asyncio.Queue[StreamEvent]] = {}
+        self._parse_message = parse_message
+        self._reader = asyncio.create_task(self._read())
+
+    @property
+    def closed(self) -> bool:
+        return self.ws.closed or self._reader.done()
+
+    async def _read(self) -> None:
+        """Route the messages to the queue of their context."""
+        reason = "connection closed"
+        try:
+            async for message in self.ws:
+                if message.type == aiohttp.WSMsgType.ERROR:
+                    reason = f"connection error: {self.ws.exception()}"
+                    break
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    continue
+                try:
+                    event = self._parse_message(json.loads(message.data))
+                except (ValueError, KeyError, TypeError) as e:
+                    logger.warning(f"Ignoring unexpected TTS WebSocket message: {e}")
+                    continue
+                if event.context_id in self.contexts:
+                    self.contexts[event.context_id].put_nowait(event)
+                elif event.context_id is None and event.error:
+                    # Not about a sentence in particular, e.g. authentication
+                    for context_id, queue in self.contexts.items():
+                        queue.put_nowait(StreamEvent(context_id, error=event.error))
+        except aiohttp.ClientError as e:
+            reason = f"connection error: {e}"
+        finally:
+            if not self.ws.closed:
+                await self.ws.close()
+            for context_id, queue in self.contexts.items():
+                queue.put_nowait(StreamEvent(context_id, error=reason))
+
+    async def close(self) -> None:
+        await self.ws.close()
+        await self._reader
+
+
+class TTSWebSocketPool:
+    """
+    Persistent WebSocket connections to a streaming TTS API.
+
+    Opening a connection per sentence costs a TCP and TLS handshake and the
+    upgrade before the first byte of audio. Both Cartesia and ElevenLabs
+    multiplex independent contexts over one connection instead. Each
+    sentence streams in its own context, and the audio coming back is routed
+    by context id, so the sentences of a reply can be synthesized
+    concurrently and still be sent in order by the TTS task manager.
+
+    Connections are opened when needed, up to `max_connections`, each with
+    at most `max_contexts_per_connection` sentences in flight. A connection
+    that drops fails the sentences streaming on it, and the next sentence
+    opens a new one.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        headers: dict,
+        parse_message: Callable[[dict], StreamEvent],
+        max_connections: int = 2,
+        max_contexts_per_connection: int = 4,
+    ):
+        self.url = url
+        self.headers = headers
+        self.parse_message = parse_message
+        self.max_connections = max_connections
+        self.max_contexts_per_connection = max_contexts_per_connection
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._connections: list[_Connection] = []
+        self._background: set[asyncio.Task] = set()
+
+    async def stream(
+        self,
+        context_id: str,
+        messages: list[dict],
+        cancel_message: dict | None = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Send the messages of a context and yield its audio until it is done.
+
+        Args:
+            context_id: Identifies the context in the messages received.
+            messages: The messages that synthesize the sentence.
+            cancel_message: Sent if the caller stops before the context is
+                done, so the API stops synthesizing it.
+
+        Raises:
+            TTSWebSocketError: If the API reports an error, the connection is
+                lost or no message arrives within the transport's timeout.
+        """
+        self._check_loop()
+        timeout = get_http_transport().timeout
+        async with self._slots:
+            queue: asyncio.Queue[StreamEvent] = asyncio.Queue()
+            connection = await self._connection_for(context_id, queue)
+            done = False
+            try:
+                for message in messages:
+                    await connection.ws.send_json(message)
+                while not done:
+                    try:
+                        event = await asyncio.wait_for(queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        raise TTSWebSocketError(f"No audio for {timeout}s")
+                    if event.error:
+                        done = True  # nothing to cancel
+                        raise TTSWebSocketError(event.error)
+                    done = event.done
+                    if event.audio:
+                        yield event.audio
+            except (aiohttp.ClientError, ConnectionError) as e:
+                raise TTSWebSocketError(f"{type(e).__name__}: {e}")
+            finally:
+                connection.contexts.pop(context_id, None)
+                if not done and cancel_message and not connection.closed:
+                    self._send_in_background(connection, cancel_message)
+
+    async def close(self) -> None:
+        """Close the connections of the running event loop."""
+        if self._loop is asyncio.get_running_loop():
+            connections, self._connections = self._connections, []
+            await asyncio.gather(*(c.close() for c in connections))
+
+    def _check_loop(self) -> None:
+        # Connections and their locks belong to the event loop they were
+        # created in, start afresh in a new one (e.g. another asyncio.run)
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._connections = []
+            self._connect_lock = asyncio.Lock()
+            self._slots = asyncio.Semaphore(
+                self.max_connections * self.max_contexts_per_connection
+            )
+
+    async def _connection_for(
+        self, context_id: str, queue: asyncio.Queue[StreamEvent]
+    ) -> _Connection:
+        """Register a context on the least busy connection, opening one if needed."""
+        async with self._connect_lock:
+            self._connections = [c for c in self._connections if not c.closed]
+            available = [
+                c
+                for c in self._connections
+                if len(c.contexts) < self.max_contexts_per_connection
+            ]
+            if available:
+                connection = min(available, key=lambda c: len(c.contexts))
+            else:
+                # The semaphore leaves room for a new connection
+                connection = await self._connect()
+                self._connections.append(connection)
+            connection.contexts[context_id] = queue
+            return connection
+
+    async def _connect(self) -> _Connection:
+        try:
+            ws = (
+                await get_http_transport()
+                .session()
+                .ws_connect(self.url, headers=self.headers, heartbeat=30)
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            raise TTSWebSocketError(f"Failed to connect: {type(e).__name__}: {e}")
+        logger.info(
+            f"Opened TTS WebSocket connection {len(self._connections) + 1} "
+            f"to {self.url.split('?')[0]}"
+        )
+        return _Connection(ws, self.parse_message)
+
+    def _send_in_background(self, connection: _Connection, message: dict) -> None:
+        async def send() -> None:
+            try:
+                await connection.ws.send_json(message)
+            except (aiohttp.ClientError, ConnectionError):
+                pass
+
+        task = asyncio.create_task(send())
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+
+async def pcm_chunks(
+    data_chunks: AsyncIterator[bytes], dtype: str, sample_rate: int
+) -> AsyncIterator[SynthesizedAudio]:
+    """
+    Turn a stream of raw PCM bytes into audio chunks, carrying over the
+    bytes of a sample split across two messages.
+    """
+    sample_width = np.dtype(dtype).itemsize
+    remainder = b""
+    async for data in data_chunks:
+        data = remainder + data
+        usable = len(data) - len(data) % sample_width
+        remainder = data[usable:]
+        if usable:
+            yield SynthesizedAudio(
+                samples=np.frombuffer(data[:usable], dtype=dtype),
+                sample_rate=sample_rate,
+            )
@@ -0,0 +1,104 @@
+import numpy as np
+from loguru import logger
+
+# 16 kHz mono float32, matching ASRInterface.SAMPLE_RATE
+DEFAULT_SAMPLE_RATE = 16000
+# Longest utterance we keep for a single ASR call (2 minutes)
+DEFAULT_MAX_SECONDS = 120
+# One second of audio to start with. The buffer doubles when it runs out.
+DEFAULT_INITIAL_CAPACITY = DEFAULT_SAMPLE_RATE
+
+
+class AudioBuffer:
+    """
+    Accumulates the audio a client sends for one utterance.
+
+    Appends are amortized O(1): samples are written into a preallocated
+    float32 array whose capacity doubles when it runs out, instead of
+    re-allocating the whole buffer on every chunk like `np.append`.
+    Samples beyond `max_samples` are dropped.
+    """
+
+    def __init__(
+        self,
+        max_samples: int = DEFAULT_MAX_SECONDS * DEFAULT_SAMPLE_RATE,
+        initial_capacity: int = DEFAULT_INITIAL_CAPACITY,
+    ):
+        self.max_samples = max_samples
+        self.initial_capacity = min(initial_capacity, max_samples)
+        self._buffer: np.ndarray | None = None
+        self._size = 0
+        self._overflow_logged = False
+        # Largest amount of memory this buffer has held at once, in bytes
+        self.high_water_mark = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        return 0 if self._buffer is None else len(self._buffer)
+
+    def append(self, samples: np.ndarray) -> None:
+        """
+        Append samples to the buffer.
+
+        Args:
+            samples: Mono audio samples. Converted to float32 if needed.
+        """
+        samples = np.asarray(samples, dtype=np.float32).reshape(-1)
+        free = self.max_samples - self._size
+        if len(samples) > free:
+            if not self._overflow_logged:
+                logger.warning(
+                    f"Utterance exceeds {self.max_samples} samples, dropping extra audio"
+                )
+                self._overflow_logged = True
+            samples = samples[:free]
+        if not len(samples):
+            return
+
+        required = self._size + len(samples)
+        if required > self.capacity:
+            self._grow(required)
+
+        self._buffer[self._size : required] = samples
+        self._size = required
+
+    def view(self) -> np.ndarray:
+        """Return the buffered samples as a contiguous view (no copy)."""
+        if self._buffer is None:
+            return np.empty(0, dtype=np.float32)
+        return self._buffer[: self._size]
+
+    def take(self) -> np.ndarray:
+        """
+        Return the buffered samples and reset the buffer.
+
+        The returned array is a view on the old storage, which is handed
+        over to the caller. The next append allocates fresh storage, so the
+        returned samples are never overwritten while ASR is still reading them.
+        """
+        samples = self.view()
+        self._buffer = None
+        self._size = 0
+        self._overflow_logged = False
+        return samples
+
+    def clear(self) -> None:
+        """Drop the buffered samples, keeping the allocated storage."""
+        self._size = 0
+        self._overflow_logged = False
+
+    def _grow(self, required: int) -> None:
+        """Grow the storage to hold at least `required` samples."""
+        new_capacity = max(self.capacity, self.initial_capacity, 1)
+        while new_capacity < required:
+            new_capacity *= 2
+        new_capacity = min(new_capacity, self.max_samples)
+
+        new_buffer = np.empty(new_capacity, dtype=np.float32)
+        if self._size:
+            new_buffer[: self._size] = self._buffer[: self._size]
+        self._buffer = new_buffer
+        self.high_water_mark = max(self.high_water_mark, new_buffer.nbytes)
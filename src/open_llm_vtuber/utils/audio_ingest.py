@@ -0,0 +1,87 @@
+from typing import BinaryIO
+
+import numpy as np
+from loguru import logger
+
+from .resample import StreamingResampler
+from .wav_parser import iter_wav_blocks
+
+# 16 kHz mono float32, matching ASRInterface.SAMPLE_RATE
+DEFAULT_SAMPLE_RATE = 16000
+
+
+class AudioIngest:
+    """
+    Brings the audio a client streams to the sample rate of VAD and ASR.
+
+    Browsers capture at 44.1 or 48 kHz. Instead of every client
+    downsampling in JavaScript, they can send audio at its native rate
+    (declared in the `sample_rate` of the message or binary frame) and it
+    is converted here, before it reaches the VAD stream or the utterance
+    buffer. Each stream of a client (`mic-audio-data`, `raw-audio-data`)
+    keeps its own resampler, so the filter state carries over from one
+    chunk to the next.
+    """
+
+    def __init__(self, target_sr: int = DEFAULT_SAMPLE_RATE):
+        self.target_sr = target_sr
+        self._resamplers: dict[str, StreamingResampler] = {}
+
+    def process(
+        self, stream: str, audio: list[float] | np.ndarray, sample_rate: int
+    ) -> np.ndarray:
+        """
+        Convert the next chunk of a stream to `target_sr`.
+
+        Args:
+            stream: Name of the stream the chunk belongs to.
+            audio: Mono float samples.
+            sample_rate: Sample rate of `audio`.
+
+        Returns:
+            np.ndarray: float32 samples at `target_sr`.
+        """
+        if sample_rate == self.target_sr:
+            return np.asarray(audio, dtype=np.float32)
+
+        resampler = self._resamplers.get(stream)
+        if resampler is None or resampler.orig_sr != sample_rate:
+            logger.debug(
+                f"Resampling {stream} from {sample_rate} Hz to {self.target_sr} Hz"
+            )
+            resampler = StreamingResampler(sample_rate, self.target_sr)
+            self._resamplers[stream] = resampler
+        return resampler.process(audio)
+
+    def flush(self, stream: str) -> np.ndarray:
+        """End a stream, returning the samples its resampler held back."""
+        resampler = self._resamplers.get(stream)
+        if resampler is None:
+            return np.empty(0, dtype=np.float32)
+        return resampler.flush()
+
+    def reset(self, stream: str) -> None:
+        """Start a new stream, e.g. at the end of an utterance."""
+        resampler = self._resamplers.get(stream)
+        if resampler:
+            resampler.reset()
+
+
+def ingest_wav_file(f: BinaryIO, target_sr: int = DEFAULT_SAMPLE_RATE) -> np.ndarray:
+    """
+    Read a WAV file of any length, sample format, channel count and sample
+    rate as mono float32 at `target_sr`. The file is converted block by
+    block, so only the converted audio is held in memory.
+
+    Raises:
+        ValueError: If the file is not a WAV file wav_parser supports.
+    """
+    ingest = AudioIngest(target_sr)
+    blocks = []
+    for block in iter_wav_blocks(f):
+        mono = block.to_float32().mean(axis=1, dtype=np.float32)
+        blocks.append(ingest.process("file", mono, block.sample_rate))
+    if not blocks:
+        return np.empty(0, dtype=np.float32)
+    blocks.append(ingest.flush("file"))
+    return np.concatenate(blocks)
@@ -0,0 +1,160 @@
+"""
+Binary audio frames for the `/client-ws` WebSocket.
+
+Clients that open `/client-ws` with the `BINARY_AUDIO_SUBPROTOCOL` WebSocket
+sub-protocol may send microphone audio as binary frames instead of JSON float
+lists. Each binary frame is a fixed-size little-endian header followed by the
+raw PCM samples (mono):
+
+    offset  size  field
+    0       1     message type   (1 = mic-audio-data, 2 = raw-audio-data)
+    1       1     sample format  (1 = int16, 2 = float32)
+    2       2     reserved, must be 0
+    4       4     sample rate in Hz
+    8       4     sequence number
+
+The header is 12 bytes long so that float32 payloads stay 4-byte aligned and
+can be viewed with `np.frombuffer` without copying. JSON messages keep working
+on the same connection, so older frontends are unaffected.
+
+Clients that offer `BINARY_AUDIO_SUBPROTOCOL_V2` also receive the audio of
+`audio` and `audio-chunk` messages in binary frames. The JSON message is sent
+first with `audio` set to null and `audio_frame` set to the sequence number
+of the binary frame that carries its audio, which uses the same header:
+
+    offset  size  field
+    0       1     message type   (3 = audio, 4 = audio-chunk)
+    1       1     audio format   (3 = WAV file)
+    2       2     reserved, 0
+    4       4     sample rate in Hz (0 if unknown)
+    8       4     sequence number (counts the binary frames of the connection)
+
+followed by the WAV file. Other messages may be sent between the JSON message
+and its binary frame, so clients match them by sequence number.
+"""
+
+import struct
+from dataclasses import dataclass
+
+import numpy as np
+
+BINARY_AUDIO_SUBPROTOCOL = "olv-pcm.v1"
+# v1, plus outbound audio in binary frames
+BINARY_AUDIO_SUBPROTOCOL_V2 = "olv-pcm.v2"
+
+_HEADER = struct.Struct("<BBHII")
+HEADER_SIZE = _HEADER.size
+
+FRAME_MESSAGE_TYPES = {
+    1: "mic-audio-data",
+    2: "raw-audio-data",
+}
+
+SAMPLE_FORMATS = {
+    1: np.dtype("<i2"),
+    2: np.dtype("<f4"),
+}
+
+OUTBOUND_MESSAGE_TYPES = {
+    "audio": 3,
+    "audio-chunk": 4,
+}
+
+WAV_FORMAT = 3
+
+
+class InvalidAudioFrameError(ValueError):
+    """A binary frame received from a client is not a valid audio frame."""
+
+
+@dataclass
+class AudioFrame:
+    """A decoded inbound binary audio frame"""
+
+    type: str
+    sample_rate: int
+    sequence: int
+    audio: np.ndarray  # float32 samples in [-1, 1]
+
+    def to_message(self) -> dict:
+        """Convert the frame to the dict shape used by JSON audio messages"""
+        return {
+            "type": self.type,
+            "audio": self.audio,
+            "sample_rate": self.sample_rate,
+            "sequence": self.sequence,
+        }
+
+
+def decode_audio_frame(data: bytes) -> AudioFrame:
+    """
+    Decode a binary audio frame received from a client.
+
+    float32 payloads are returned as a read-only view on `data` (no copy).
+    int16 payloads are scaled to float32 in [-1, 1] so both formats look the
+    same as the JSON `audio` lists to the rest of the pipeline.
+
+    Args:
+        data: The raw bytes of the WebSocket binary frame.
+
+    Returns:
+        AudioFrame: The decoded frame.
+
+    Raises:
+        InvalidAudioFrameError: If the frame is malformed.
+    """
+    if len(data) < HEADER_SIZE:
+        raise InvalidAudioFrameError(
+            f"Invalid audio frame: expected at least {HEADER_SIZE} bytes, got {len(data)}"
+        )
+
+    msg_code, format_code, _reserved, sample_rate, sequence = _HEADER.unpack_from(data)
+
+    msg_type = FRAME_MESSAGE_TYPES.get(msg_code)
+    if msg_type is None:
+        raise InvalidAudioFrameError(
+            f"Invalid audio frame: unknown message type {msg_code}"
+        )
+
+    dtype = SAMPLE_FORMATS.get(format_code)
+    if dtype is None:
+        raise InvalidAudioFrameError(
+            f"Invalid audio frame: unknown sample format {format_code}"
+        )
+
+    if (len(data) - HEADER_SIZE) % dtype.itemsize != 0:
+        raise InvalidAudioFrameError(
+            "Invalid audio frame: payload size is not a multiple of the sample size"
+        )
+
+    samples = np.frombuffer(data, dtype=dtype, offset=HEADER_SIZE)
+    if dtype.kind == "i":
+        samples = np.multiply(samples, 1.0 / 32768.0, dtype=np.float32)
+
+    return AudioFrame(
+        type=msg_type,
+        sample_rate=sample_rate,
+        sequence=sequence,
+        audio=samples,
+    )
+
+
+def encode_audio_frame(
+    msg_type: str, wav_bytes: bytes, sample_rate: int, sequence: int
+) -> bytes:
+    """
+    Encode the audio of an outbound message as a binary frame.
+
+    Args:
+        msg_type: The type of the JSON message the audio belongs to.
+        wav_bytes: The WAV file.
+        sample_rate: The sample rate of the WAV file, or 0 if unknown.
+        sequence: The sequence number of the frame, given in the JSON message.
+
+    Returns:
+        bytes: The frame to send.
+    """
+    header = _HEADER.pack(
+        OUTBOUND_MESSAGE_TYPES[msg_type], WAV_FORMAT, 0, sample_rate, sequence
+    )
+    return header + wav_bytes
@@ -0,0 +1,148 @@
+import numpy as np
+
+FRAME_MS = 10
+
+
+def split_at_pauses(
+    samples: np.ndarray,
+    sample_rate: int,
+    weights: list[float],
+    min_pause_ms: int = 50,
+    max_pause_level: float = 0.1,
+    length_bonus: float = 0.5,
+) -> list[int] | None:
+    """
+    Find where to cut speech synthesized from several sentences joined
+    together, so that each sentence gets its own audio.
+
+    The cut after each sentence is expected where its share of the text
+    (`weights`, e.g. character counts) ends. Among the pauses in the speech,
+    one per boundary is chosen, in order, minimizing the distance to the
+    expected positions (in sentence durations) and preferring long pauses
+    over the short ones at commas. The cut goes in the middle of the pause.
+
+    Args:
+        samples: The audio as float samples, shape (frames,) or
+            (frames, channels).
+        sample_rate: The sample rate of the audio.
+        weights: The relative length of each sentence, in order.
+        min_pause_ms: The shortest silence that counts as a pause.
+        max_pause_level: The loudest a pause may be, relative to the
+            speech (its 75th percentile frame energy).
+        length_bonus: How much the longest pause is favoured, in squared
+            sentence durations.
+
+    Returns:
+        list[int] | None: The sample index where each sentence starts after
+        the first (len(weights) - 1 cuts), or None if there are fewer pauses
+        than boundaries.
+    """
+    num_cuts = len(weights) - 1
+    if num_cuts < 1:
+        return []
+    mono = samples.reshape(len(samples), -1).astype(np.float64).mean(axis=1)
+    frame = max(int(sample_rate * FRAME_MS / 1000), 1)
+    num_frames = len(mono) // frame
+    if num_frames < 2 * len(weights):
+        return None
+
+    energy = np.sqrt(
+        np.mean(np.square(mono[: num_frames * frame].reshape(num_frames, frame)), 1)
+    )
+    # Over 50 ms, so short gaps inside words are not taken for pauses
+    energy = np.convolve(energy, np.ones(5) / 5, mode="same")
+    quiet = energy <= max_pause_level * np.percentile(energy, 75)
+
+    # Runs of quiet frames, except the silence before and after the speech
+    edges = np.diff(np.concatenate(([0], quiet.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    keep = (ends - starts >= min_pause_ms / FRAME_MS) & (starts > 0)
+    keep &= ends < num_frames
+    starts, ends = starts[keep], ends[keep]
+    if len(starts) < num_cuts:
+        return None
+    centers = (starts + ends) // 2
+    lengths = ends - starts
+
+    durations = np.asarray(weights, dtype=np.float64)
+    durations = durations / durations.sum() * num_frames
+    expected = np.cumsum(durations)[:-1]
+
+    # cost[i, j]: pause j as the boundary after sentence i
+    cost = np.square((centers[None, :] - expected[:, None]) / durations.mean())
+    cost -= length_bonus * lengths[None, :] / lengths.max()
+
+    # Choose increasing pauses for the boundaries, with the lowest total cost
+    total = cost[0].copy()
+    choices = []
+    for i in range(1, num_cuts):
+        # Best total for boundaries before i, ending on a pause before j
+        previous = np.concatenate(([np.inf], np.minimum.accumulate(total)[:-1]))
+        best = np.concatenate(([0], _argmin_accumulate(total)[:-1]))
+        total = cost[i] + previous
+        choices.append(best)
+
+    j = int(np.argmin(total))
+    if not np.isfinite(total[j]):
+        return None
+    chosen = [j]
+    for best in reversed(choices):
+        j = int(best[j])
+        chosen.append(j)
+    return [int(centers[j]) * frame for j in reversed(chosen)]
+
+
+def _argmin_accumulate(values: np.ndarray) -> np.ndarray:
+    """Index of the minimum of values[: i + 1], for each i."""
+    indices = np.zeros(len(values), dtype=np.int64)
+    for i in range(1, len(values)):
+        previous = indices[i - 1]
+        indices[i] = i if values[i] < values[previous] else previous
+    return indices
+
+
+def split_long_audio(
+    samples: np.ndarray, sample_rate: int, max_seconds: float = 30.0
+) -> list[np.ndarray]:
+    """
+    Cut a long recording into windows of at most `max_seconds`, each cut at
+    the quietest point of the second half of its window, so that it rarely
+    falls in the middle of a word.
+
+    Args:
+        samples: Mono float samples.
+        sample_rate: The sample rate of the audio.
+        max_seconds: The longest window.
+
+    Returns:
+        list[np.ndarray]: The windows, in order. Audio no longer than
+        `max_seconds` is returned whole.
+    """
+    max_length = int(max_seconds * sample_rate)
+    if len(samples) <= max_length:
+        return [samples]
+    frame = max(int(sample_rate * FRAME_MS / 1000), 1)
+    num_frames = len(samples) // frame
+    energy = np.sqrt(
+        np.mean(
+            np.square(samples[: num_frames * frame].reshape(num_frames, frame)),
+            axis=1,
+            dtype=np.float64,
+        )
+    )
+    # Over 50 ms, so short gaps inside words are not taken for pauses
+    energy = np.convolve(energy, np.ones(5) / 5, mode="same")
+
+    windows = []
+    start = 0
+    while len(samples) - start > max_length:
+        first = (start + max_length // 2) // frame
+        last = (start + max_length) // frame
+        # The latest of equally quiet frames, e.g. in digital silence
+        quietest = last - 1 - int(np.argmin(energy[first:last][::-1]))
+        cut = quietest * frame
+        windows.append(samples[start:cut])
+        start = cut
+    windows.append(samples[start:])
+    return windows
@@ -0,0 +1,88 @@
+"""
+Sending payloads to the clients of `/client-ws`.
+
+Audio payloads (`prepare_audio_payload`, `prepare_audio_chunk_payload`) keep
+their audio as an `EncodedAudio` until they are sent. Most clients get it
+base64-encoded in the JSON message. Clients that negotiated the
+`BINARY_AUDIO_SUBPROTOCOL_V2` sub-protocol get a small JSON message and the
+WAV file in a binary frame (see `utils.binary_audio`), which spares a third
+of the bytes and the base64 encoding and decoding.
+"""
+
+import json
+from typing import Awaitable, Callable
+
+from fastapi import WebSocket
+
+from .binary_audio import encode_audio_frame
+from .stream_audio import EncodedAudio
+from .wav_parser import parse_wav
+
+
+def dump_payload(payload: dict) -> str:
+    """Serialize a payload as JSON, with its audio in base64."""
+    audio = payload.get("audio")
+    if isinstance(audio, EncodedAudio):
+        payload = {**payload, "audio": audio.audio_base64}
+    return json.dumps(payload)
+
+
+class ClientSender:
+    """
+    Sends messages to one client. Called with a string, it sends a text
+    frame like `WebSocket.send_text`, so it can be used wherever a
+    `WebSocketSend` is expected.
+    """
+
+    def __init__(self, websocket: WebSocket, binary_audio: bool = False):
+        self.websocket = websocket
+        self.binary_audio = binary_audio
+        self._audio_frames = 0
+
+    @classmethod
+    def for_websocket(cls, websocket: WebSocket) -> "ClientSender":
+        """
+        The sender of a connection, created on first use with the audio
+        format negotiated when the connection was accepted.
+        """
+        sender = getattr(websocket.state, "client_sender", None)
+        if sender is None:
+            sender = cls(websocket, getattr(websocket.state, "binary_audio", False))
+            websocket.state.client_sender = sender
+        return sender
+
+    async def __call__(self, text: str) -> None:
+        await self.websocket.send_text(text)
+
+    async def send_payload(self, payload: dict) -> None:
+        """Send a payload, its audio in a binary frame if the client supports it."""
+        audio = payload.get("audio")
+        if not (self.binary_audio and isinstance(audio, EncodedAudio)):
+            await self.websocket.send_text(dump_payload(payload))
+            return
+
+        sequence = self._audio_frames
+        self._audio_frames = (self._audio_frames + 1) & 0xFFFFFFFF
+        try:
+            sample_rate = parse_wav(audio.wav_bytes).sample_rate
+        except ValueError:
+            sample_rate = 0
+        await self.websocket.send_text(
+            json.dumps({**payload, "audio": None, "audio_frame": sequence})
+        )
+        await self.websocket.send_bytes(
+            encode_audio_frame(payload["type"], audio.wav_bytes, sample_rate, sequence)
+        )
+
+
+async def send_payload(
+    websocket_send: Callable[[str], Awaitable[None]], payload: dict
+) -> None:
+    """
+    Send a payload with `websocket_send`: through its `ClientSender` if it is
+    one, or as JSON text otherwise.
+    """
+    if isinstance(websocket_send, ClientSender):
+        await websocket_send.send_payload(payload)
+    else:
+        await websocket_send(dump_payload(payload))
@@ -0,0 +1,132 @@
+from math import gcd
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Zero crossings of the sinc on each side of the filter center, at the lower
+# of the two rates. More means a sharper cut-off and more work per sample.
+DEFAULT_NUM_ZEROS = 16
+# Kaiser window shape, about 80 dB of stopband attenuation
+DEFAULT_KAISER_BETA = 8.6
+
+
+class StreamingResampler:
+    """
+    Polyphase resampler for audio that arrives in chunks.
+
+    Converts from `orig_sr` to `target_sr` by the rational factor L/M
+    (upsample by L, low-pass, downsample by M) without ever materializing
+    the upsampled signal: each output sample is the dot product of one
+    phase of a windowed-sinc filter bank with the input samples around it.
+    The end of each chunk and the position of the next output sample are
+    kept between calls, so feeding a stream chunk by chunk gives the same
+    output as resampling it in one go, whatever the chunk sizes.
+
+    The output lags the input by half the filter length (under 1 ms for
+    the default filter).
+    """
+
+    def __init__(
+        self,
+        orig_sr: int,
+        target_sr: int,
+        num_zeros: int = DEFAULT_NUM_ZEROS,
+        kaiser_beta: float = DEFAULT_KAISER_BETA,
+    ):
+        if orig_sr <= 0 or target_sr <= 0:
+            raise ValueError(
+                f"Sample rates must be positive, got {orig_sr} -> {target_sr}"
+            )
+        self.orig_sr = orig_sr
+        self.target_sr = target_sr
+        divisor = gcd(orig_sr, target_sr)
+        self.up = target_sr // divisor  # L
+        self.down = orig_sr // divisor  # M
+
+        # bank[phase] holds the taps applied to the last `taps_per_phase`
+        # input samples, oldest first
+        self._bank = self._design_filter_bank(num_zeros, kaiser_beta)
+        self.taps_per_phase = self._bank.shape[1]
+        self.reset()
+
+    @property
+    def passthrough(self) -> bool:
+        return self.up == self.down
+
+    def reset(self) -> None:
+        """Forget the stream, e.g. when the client starts a new one."""
+        self._history = np.zeros(self.taps_per_phase - 1, dtype=np.float32)
+        # Position of the next output sample, in upsampled samples from the
+        # start of the next chunk
+        self._position = 0
+
+    def process(self, audio: np.ndarray) -> np.ndarray:
+        """
+        Resample the next chunk of the stream.
+
+        Args:
+            audio: Mono float samples at `orig_sr`.
+
+        Returns:
+            np.ndarray: float32 samples at `target_sr`. Their number varies
+            from chunk to chunk, following the stream position.
+        """
+        audio = np.asarray(audio, dtype=np.float32).reshape(-1)
+        if self.passthrough or not len(audio):
+            return audio
+
+        num_out = -(-(len(audio) * self.up - self._position) // self.down)
+        buffer = np.concatenate((self._history, audio))
+        if num_out <= 0:
+            self._position -= len(audio) * self.up
+            self._history = buffer[len(buffer) - len(self._history) :]
+            return np.empty(0, dtype=np.float32)
+
+        positions = self._position + self.down * np.arange(num_out)
+        # index in `audio` of the newest input sample each output depends on
+        newest = positions // self.up
+        phases = positions % self.up
+
+        # windows[i] = buffer[newest[i] : newest[i] + taps_per_phase]
+        windows = sliding_window_view(buffer, self.taps_per_phase)[newest]
+        out = np.einsum("ij,ij->i", windows, self._bank[phases])
+
+        self._position += num_out * self.down - len(audio) * self.up
+        self._history = buffer[len(buffer) - len(self._history) :]
+        return out
+
+    def flush(self) -> np.ndarray:
+        """
+        End the stream: resample the samples the filter still holds back
+        (its lag), and forget the stream.
+
+        Returns:
+            np.ndarray: The last float32 samples at `target_sr`.
+        """
+        if self.passthrough:
+            return np.empty(0, dtype=np.float32)
+        tail = self.process(np.zeros(self.taps_per_phase // 2, dtype=np.float32))
+        self.reset()
+        return tail
+
+    def _design_filter_bank(self, num_zeros: int, kaiser_beta: float) -> np.ndarray:
+        """Kaiser-windowed sinc low-pass split into `up` phases."""
+        # Cut-off at the Nyquist frequency of the lower rate, in cycles per
+        # upsampled sample
+        cutoff = 0.5 / max(self.up, self.down)
+        half_length = num_zeros * max(self.up, self.down)
+        taps = np.arange(-half_length, half_length + 1)
+        prototype = (
+            2 * cutoff * np.sinc(2 * cutoff * taps) * np.kaiser(len(taps), kaiser_beta)
+        )
+        # Zero-stuffing divides the signal by `up`, so each phase sums to ~1
+        prototype *= self.up / prototype.sum()
+
+        taps_per_phase = -(-len(prototype) // self.up)
+        padded = np.zeros(taps_per_phase * self.up)
+        padded[: len(prototype)] = prototype
+        # Output at upsampled position p uses input n with weight
+        # h[p - n * up]; for the newest input that is h[phase], then
+        # h[phase + up], ... going back in time. Reverse to oldest first.
+        bank = padded.reshape(taps_per_phase, self.up).T[:, ::-1]
+        return np.ascontiguousarray(bank, dtype=np.float32)
@@ -1,27 +1,140 @@
+import io
 import base64
+from dataclasses import dataclass
+import numpy as np
 from pydub import AudioSegment
 from pydub.utils import make_chunks
 from ..agent.output_types import Actions
 from ..agent.output_types import DisplayText
+from .wav_parser import WavAudio, is_wav, parse_wav, encode_wav
 
 
-def _get_volume_by_chunks(audio: AudioSegment, chunk_length_ms: int) -> list:
+@dataclass
+class EncodedAudio:
+    """Audio as the client receives it: a WAV file and its volume envelope."""
+
+    wav_bytes: bytes
+    volumes: list
+
+    @property
+    def audio_base64(self) -> str:
+        """The WAV file as sent in JSON payloads."""
+        return base64.b64encode(self.wav_bytes).decode("utf-8")
+
+
+def _get_wav_rms_by_chunks(wav: WavAudio, chunk_length_ms: int) -> np.ndarray:
+    """
+    The volume (RMS) of each chunk of a WAV file, not normalized, computed
+    with NumPy: one RMS over the chunks reshaped into rows.
+    """
+    samples = wav.samples()
+    if wav.sample_width == 1:
+        samples = samples.astype(np.int16) - 128  # 8-bit WAV is unsigned
+    samples = samples.astype(np.float64).reshape(-1)
+
+    chunk_size = max(int(wav.sample_rate * chunk_length_ms / 1000), 1) * wav.channels
+    num_full = len(samples) // chunk_size
+    volumes = np.sqrt(
+        np.mean(
+            np.square(samples[: num_full * chunk_size].reshape(num_full, chunk_size)),
+            axis=1,
+        )
+    )
+    if len(samples) > num_full * chunk_size:
+        tail = samples[num_full * chunk_size :]
+        volumes = np.append(volumes, np.sqrt(np.mean(np.square(tail))))
+    return volumes
+
+
+def _load_audio(
+    audio_path: str | None, audio_bytes: bytes | None, chunk_length_ms: int
+) -> tuple[bytes, np.ndarray]:
+    """
+    Load an audio file, from disk or from memory, as WAV bytes and compute
+    the volume (RMS, not normalized) of each chunk.
+
+    PCM/float WAV files, which most TTS engines produce, are parsed directly
+    and sent as they are (or re-encoded to 16-bit PCM with NumPy if their
+    header needs fixing). pydub and ffmpeg are only used for other formats
+    such as MP3.
+    """
+    if audio_bytes is not None:
+        data = audio_bytes
+    else:
+        try:
+            with open(audio_path, "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise ValueError(f"Error reading generated audio file '{audio_path}': {e}")
+
+    if is_wav(data):
+        try:
+            wav = parse_wav(data)
+        except ValueError:
+            wav = None  # e.g. compressed WAV, let pydub handle it
+        if wav is not None:
+            if not wav.canonical:
+                data = encode_wav(wav.to_float32(), wav.sample_rate)
+            return data, _get_wav_rms_by_chunks(wav, chunk_length_ms)
+
+    try:
+        audio = AudioSegment.from_file(
+            audio_path if audio_bytes is None else io.BytesIO(audio_bytes)
+        )
+        wav_bytes = audio.export(format="wav").read()
+    except Exception as e:
+        raise ValueError(
+            f"Error loading or converting generated audio file to wav file '{audio_path or 'in memory'}': {e}"
+        )
+    volumes = [chunk.rms for chunk in make_chunks(audio, chunk_length_ms)]
+    return wav_bytes, np.asarray(volumes, dtype=np.float64)
+
+
+def encode_audio(
+    audio_path: str | None = None,
+    audio_bytes: bytes | None = None,
+    chunk_length_ms: int = 20,
+) -> EncodedAudio:
     """
-    Calculate the normalized volume (RMS) for each chunk of the audio.
+    Encode an audio file, given by path or as bytes, for the audio payload.
 
     Parameters:
-        audio (AudioSegment): The audio segment to process.
-        chunk_length_ms (int): The length of each audio chunk in milliseconds.
+        audio_path (str | None): The path to the audio file
+        audio_bytes (bytes, optional): The audio file itself, used instead of audio_path
+        chunk_length_ms (int): The length of each audio chunk in milliseconds
 
     Returns:
-        list: Normalized volumes for each chunk.
+        EncodedAudio: The WAV audio and its volume envelope
     """
-    chunks = make_chunks(audio, chunk_length_ms)
-    volumes = [chunk.rms for chunk in chunks]
-    max_volume = max(volumes)
+    wav_bytes, volumes = _load_audio(audio_path, audio_bytes, chunk_length_ms)
+    max_volume = volumes.max() if len(volumes) else 0
     if max_volume == 0:
         raise ValueError("Audio is empty or all zero.")
-    return [volume / max_volume for volume in volumes]
+    return EncodedAudio(wav_bytes, (volumes / max_volume).tolist())
+
+
+class AudioChunkEncoder:
+    """
+    Encodes the chunks of a sentence that is streamed to the client.
+
+    Volumes of a whole sentence are normalized by its loudest 20 ms slice,
+    which is not known until the sentence ends. Chunks are normalized by the
+    loudest slice seen so far instead, so the mouth does not open wide on
+    every quiet chunk.
+    """
+
+    def __init__(self, chunk_length_ms: int = 20):
+        self.chunk_length_ms = chunk_length_ms
+        self._max_volume = 0.0
+
+    def encode(self, audio_bytes: bytes) -> EncodedAudio:
+        """Encode the next chunk, an audio file (usually WAV) in memory."""
+        wav_bytes, volumes = _load_audio(None, audio_bytes, self.chunk_length_ms)
+        if len(volumes):
+            self._max_volume = max(self._max_volume, float(volumes.max()))
+        if self._max_volume > 0:
+            volumes = volumes / self._max_volume
+        return EncodedAudio(wav_bytes, volumes.tolist())
 
 
 def prepare_audio_payload(
@@ -30,13 +143,22 @@ def prepare_audio_payload(
     display_text: DisplayText = None,
     actions: Actions = None,
     forwarded: bool = False,
+    audio_bytes: bytes | None = None,
+    encoded_audio: EncodedAudio | None = None,
 ) -> dict[str, any]:
     """
     Prepares the audio payload for sending to a broadcast endpoint.
-    If audio_path is None, returns a payload with audio=None for silent display.
+    If no audio is given (audio_path, audio_bytes or encoded_audio), returns
+    a payload with audio=None for silent display.
+
+    The audio stays an EncodedAudio in the payload until it is sent: as
+    base64 in the JSON, or in a binary frame to clients that support it
+    (see `utils.payload_sender`).
 
     Parameters:
         audio_path (str | None): The path to the audio file to be processed, or None for silent display
+        audio_bytes (bytes, optional): The audio file itself, used instead of audio_path
+        encoded_audio (EncodedAudio, optional): Audio already encoded with `encode_audio`
         chunk_length_ms (int): The length of each audio chunk in milliseconds
         display_text (DisplayText, optional): Text to be displayed with the audio
         actions (Actions, optional): Actions associated with the audio
@@ -47,7 +169,7 @@ def prepare_audio_payload(
     if isinstance(display_text, DisplayText):
         display_text = display_text.to_dict()
 
-    if not audio_path:
+    if not audio_path and audio_bytes is None and encoded_audio is None:
         # Return payload for silent display
         return {
             "type": "audio",
@@ -59,20 +181,13 @@ def prepare_audio_payload(
             "forwarded": forwarded,
         }
 
-    try:
-        audio = AudioSegment.from_file(audio_path)
-        audio_bytes = audio.export(format="wav").read()
-    except Exception as e:
-        raise ValueError(
-            f"Error loading or converting generated audio file to wav file '{audio_path}': {e}"
-        )
-    audio_base64 = base64.b64encode(audio_bytes).decode("utf-8")
-    volumes = _get_volume_by_chunks(audio, chunk_length_ms)
+    if encoded_audio is None:
+        encoded_audio = encode_audio(audio_path, audio_bytes, chunk_length_ms)
 
     payload = {
         "type": "audio",
-        "audio": audio_base64,
-        "volumes": volumes,
+        "audio": encoded_audio,
+        "volumes": encoded_audio.volumes,
         "slice_length": chunk_length_ms,
         "display_text": display_text,
         "actions": actions.to_dict() if actions else None,
@@ -82,5 +197,52 @@ def prepare_audio_payload(
     return payload
 
 
+def prepare_audio_chunk_payload(
+    encoded_audio: EncodedAudio | None,
+    sequence: int,
+    chunk_index: int,
+    final: bool = False,
+    chunk_length_ms: int = 20,
+    display_text: DisplayText = None,
+    actions: Actions = None,
+    forwarded: bool = False,
+) -> dict[str, any]:
+    """
+    Prepares one chunk of a sentence whose audio is streamed to the client.
+
+    The chunks of a sentence share its `sequence` number and are sent in
+    order of `chunk_index`. The display text and actions come with the first
+    chunk. The last message of a sentence has `final` set, and may carry no
+    audio when the engine only learns that it is done after its last chunk.
+
+    Parameters:
+        encoded_audio (EncodedAudio | None): The audio of this chunk, or None
+        sequence (int): The position of the sentence in the response
+        chunk_index (int): The position of the chunk in the sentence
+        final (bool): Whether this is the last message of the sentence
+        chunk_length_ms (int): The length of each volume slice in milliseconds
+        display_text (DisplayText, optional): Text to be displayed with the audio
+        actions (Actions, optional): Actions associated with the audio
+
+    Returns:
+        dict: The audio chunk payload to be sent
+    """
+    if isinstance(display_text, DisplayText):
+        display_text = display_text.to_dict()
+
+    return {
+        "type": "audio-chunk",
+        "sequence": sequence,
+        "chunk_index": chunk_index,
+        "final": final,
+        "audio": encoded_audio,
+        "volumes": encoded_audio.volumes if encoded_audio else [],
+        "slice_length": chunk_length_ms,
+        "display_text": display_text,
+        "actions": actions.to_dict() if actions else None,
+        "forwarded": forwarded,
+    }
+
+
 # Example usage:
 # payload, duration = prepare_audio_payload("path/to/audio.mp3", display_text="Hello", expression_list=[0,1,2])
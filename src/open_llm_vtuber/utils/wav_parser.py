@@ -0,0 +1,251 @@
+"""
+Minimal RIFF/WAVE parsing with NumPy.
+
+Most TTS engines and clients produce plain PCM WAV, which can be read and
+written directly instead of going through pydub and an ffmpeg subprocess.
+Supported: PCM 8/16/24/32-bit and IEEE float 32/64-bit, including the
+WAVE_FORMAT_EXTENSIBLE variants. Anything else (compressed WAV, RF64)
+raises ValueError so callers can fall back to pydub.
+"""
+
+import os
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator
+
+import numpy as np
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+_RIFF_HEADER = struct.Struct("<4sI4s")
+_CHUNK_HEADER = struct.Struct("<4sI")
+_FMT = struct.Struct("<HHIIHH")
+
+
+@dataclass
+class WavAudio:
+    """A parsed WAV file. `data` is the raw content of its data chunk."""
+
+    sample_rate: int
+    channels: int
+    sample_width: int  # bytes per sample
+    format_tag: int  # WAVE_FORMAT_PCM or WAVE_FORMAT_IEEE_FLOAT
+    data: memoryview
+    # True if the file is PCM 16-bit with a header that matches its data,
+    # i.e. it can be passed on as is
+    canonical: bool
+
+    @property
+    def num_frames(self) -> int:
+        return len(self.data) // (self.sample_width * self.channels)
+
+    @property
+    def duration(self) -> float:
+        return self.num_frames / self.sample_rate
+
+    def samples(self) -> np.ndarray:
+        """
+        The samples in their stored type (uint8, int16, int32, float32 or
+        float64; 24-bit PCM is widened to int32), shape (frames, channels).
+        """
+        size = self.num_frames * self.channels * self.sample_width
+        data = self.data[:size]
+        if self.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+            samples = np.frombuffer(data, dtype=f"<f{self.sample_width}")
+        elif self.sample_width == 1:
+            samples = np.frombuffer(data, dtype=np.uint8)
+        elif self.sample_width == 3:
+            # Place the 3 bytes in the top of an int32 and shift back down
+            # to sign-extend them
+            packed = np.zeros((self.num_frames * self.channels, 4), dtype=np.uint8)
+            packed[:, 1:] = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3)
+            samples = packed.view("<i4").reshape(-1) >> 8
+        else:
+            samples = np.frombuffer(data, dtype=f"<i{self.sample_width}")
+        return samples.reshape(-1, self.channels)
+
+    def to_float32(self) -> np.ndarray:
+        """The samples scaled to [-1, 1] as float32, shape (frames, channels)."""
+        samples = self.samples()
+        if self.format_tag == WAVE_FORMAT_IEEE_FLOAT:
+            return samples.astype(np.float32, copy=False)
+        if self.sample_width == 1:
+            # 8-bit WAV is unsigned
+            return (samples.astype(np.float32) - 128) / 128
+        bits = 24 if self.sample_width == 3 else 8 * self.sample_width
+        return samples.astype(np.float32) / float(1 << (bits - 1))
+
+
+def is_wav(data: bytes) -> bool:
+    """Whether `data` starts like a RIFF/WAVE file."""
+    return len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WAVE"
+
+
+def parse_wav(data: bytes | bytearray | memoryview) -> WavAudio:
+    """
+    Parse a WAV file held in memory. The samples are not copied.
+
+    Headers written by streaming encoders, with a data chunk size of 0 or
+    larger than the file, are accepted: the data then runs to the end.
+
+    Raises:
+        ValueError: If the data is not a WAV file this parser supports.
+    """
+    data = memoryview(data).cast("B")
+    if len(data) < _RIFF_HEADER.size:
+        raise ValueError("Invalid WAV file: too short")
+    riff, _riff_size, wave = _RIFF_HEADER.unpack_from(data)
+    if riff != b"RIFF" or wave != b"WAVE":
+        raise ValueError("Invalid WAV file: missing RIFF/WAVE header")
+
+    fmt = None
+    offset = _RIFF_HEADER.size
+    while offset + _CHUNK_HEADER.size <= len(data):
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack_from(data, offset)
+        offset += _CHUNK_HEADER.size
+
+        if chunk_id == b"fmt ":
+            fmt = _parse_fmt(data[offset : offset + chunk_size])
+        elif chunk_id == b"data":
+            if fmt is None:
+                raise ValueError("Invalid WAV file: data chunk before fmt chunk")
+            available = len(data) - offset
+            size_matches = 0 < chunk_size <= available
+            format_tag, channels, sample_rate, sample_width = fmt
+            return WavAudio(
+                sample_rate=sample_rate,
+                channels=channels,
+                sample_width=sample_width,
+                format_tag=format_tag,
+                data=data[
+                    offset : offset + (chunk_size if size_matches else available)
+                ],
+                canonical=(
+                    size_matches and format_tag == WAVE_FORMAT_PCM and sample_width == 2
+                ),
+            )
+
+        # Chunks are padded to an even size
+        offset += chunk_size + (chunk_size & 1)
+
+    raise ValueError("Invalid WAV file: no data chunk")
+
+
+def iter_wav_blocks(f: BinaryIO, block_frames: int = 1 << 16) -> Iterator[WavAudio]:
+    """
+    Read a WAV file from a file object block by block, without loading it
+    whole. Chunks before the data chunk are skipped (f must be seekable).
+
+    As with parse_wav, a data chunk size of 0 or larger than the file means
+    the data runs to the end.
+
+    Yields:
+        WavAudio: Up to `block_frames` frames each, in the format of the file.
+
+    Raises:
+        ValueError: If the file is not a WAV file this parser supports.
+    """
+    header = f.read(_RIFF_HEADER.size)
+    if len(header) < _RIFF_HEADER.size:
+        raise ValueError("Invalid WAV file: too short")
+    riff, _riff_size, wave = _RIFF_HEADER.unpack(header)
+    if riff != b"RIFF" or wave != b"WAVE":
+        raise ValueError("Invalid WAV file: missing RIFF/WAVE header")
+
+    fmt = None
+    while True:
+        header = f.read(_CHUNK_HEADER.size)
+        if len(header) < _CHUNK_HEADER.size:
+            raise ValueError("Invalid WAV file: no data chunk")
+        chunk_id, chunk_size = _CHUNK_HEADER.unpack(header)
+        if chunk_id == b"data":
+            break
+        if chunk_id == b"fmt ":
+            fmt = _parse_fmt(memoryview(f.read(chunk_size)))
+            f.seek(chunk_size & 1, os.SEEK_CUR)
+        else:
+            # Chunks are padded to an even size
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+    if fmt is None:
+        raise ValueError("Invalid WAV file: data chunk before fmt chunk")
+
+    format_tag, channels, sample_rate, sample_width = fmt
+    frame_size = channels * sample_width
+    remaining = chunk_size if chunk_size else None
+    while remaining is None or remaining >= frame_size:
+        size = block_frames * frame_size
+        if remaining is not None:
+            size = min(size, remaining - remaining % frame_size)
+        data = f.read(size)
+        # The last frame may be cut off
+        data = data[: len(data) - len(data) % frame_size]
+        if not data:
+            return
+        if remaining is not None:
+            remaining -= len(data)
+        yield WavAudio(
+            sample_rate=sample_rate,
+            channels=channels,
+            sample_width=sample_width,
+            format_tag=format_tag,
+            data=memoryview(data),
+            canonical=False,
+        )
+
+
+def _parse_fmt(chunk: memoryview) -> tuple[int, int, int, int]:
+    """Return (format_tag, channels, sample_rate, sample_width) of a fmt chunk."""
+    if len(chunk) < _FMT.size:
+        raise ValueError("Invalid WAV file: fmt chunk too short")
+    format_tag, channels, sample_rate, _byte_rate, _block_align, bits = (
+        _FMT.unpack_from(chunk)
+    )
+    if format_tag == WAVE_FORMAT_EXTENSIBLE:
+        if len(chunk) < 26:
+            raise ValueError("Invalid WAV file: extensible fmt chunk too short")
+        # The first two bytes of the sub-format GUID are the actual format
+        (format_tag,) = struct.unpack_from("<H", chunk, 24)
+
+    sample_width = (bits + 7) // 8
+    if format_tag == WAVE_FORMAT_PCM and sample_width in (1, 2, 3, 4):
+        pass
+    elif format_tag == WAVE_FORMAT_IEEE_FLOAT and sample_width in (4, 8):
+        pass
+    else:
+        raise ValueError(
+            f"Unsupported WAV format: format tag {format_tag:#06x}, {bits} bits"
+        )
+    if channels < 1 or sample_rate < 1:
+        raise ValueError(f"Invalid WAV file: {channels} channels at {sample_rate} Hz")
+    return format_tag, channels, sample_rate, sample_width
+
+
+def encode_wav(samples: np.ndarray, sample_rate: int) -> bytes:
+    """
+    Encode audio as a 16-bit PCM WAV file.
+
+    Args:
+        samples: int16 samples, or float samples in [-1, 1] (clipped), with
+            shape (frames,) or (frames, channels).
+        sample_rate: Sample rate in Hz.
+    """
+    if samples.dtype != np.int16:
+        samples = (np.clip(samples, -1, 1) * 32767).astype(np.int16)
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    pcm = samples.astype("<i2", copy=False).tobytes()
+    header = (
+        _RIFF_HEADER.pack(b"RIFF", 36 + len(pcm), b"WAVE")
+        + _CHUNK_HEADER.pack(b"fmt ", _FMT.size)
+        + _FMT.pack(
+            WAVE_FORMAT_PCM,
+            channels,
+            sample_rate,
+            sample_rate * channels * 2,
+            channels * 2,
+            16,
+        )
+        + _CHUNK_HEADER.pack(b"data", len(pcm))
+    )
+    return header + pcm
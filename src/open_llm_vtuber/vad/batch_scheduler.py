@@ -0,0 +1,157 @@
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+from loguru import logger
+
+if TYPE_CHECKING:
+    from .silero import VADEngine, VADSession
+
+
+@dataclass
+class _Request:
+    session: "VADSession"
+    windows: np.ndarray  # (n, window_size_samples)
+    future: asyncio.Future
+
+
+class VADBatchScheduler:
+    """
+    Batches Silero VAD inference across sessions.
+
+    Sessions submit the windows of an audio chunk with `infer()`. The
+    scheduler waits `batch_window_ms` to collect the windows of every other
+    session that has audio pending, then runs them through the model
+    together: the i-th window of every pending request goes into the i-th
+    forward pass, each with the recurrent state of its own session. The
+    speech probabilities are handed back to each session, which feeds them
+    to its state machine.
+    """
+
+    def __init__(
+        self,
+        engine: "VADEngine",
+        batch_window_ms: float = 5.0,
+        max_batch_size: int = 64,
+    ):
+        self.engine = engine
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+
+        self._pending: list[_Request] = []
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+        # Statistics
+        self.forward_passes = 0
+        self.windows_processed = 0
+
+    @property
+    def average_batch_size(self) -> float:
+        if not self.forward_passes:
+            return 0.0
+        return self.windows_processed / self.forward_passes
+
+    async def infer(self, session: "VADSession", windows: np.ndarray) -> np.ndarray:
+        """
+        Compute the speech probability of each window of a session.
+
+        A session must not call this again before the previous call returned,
+        since each call continues from the recurrent state the last one left.
+
+        Args:
+            session: The session the windows belong to.
+            windows: Array of shape (n, window_size_samples).
+
+        Returns:
+            np.ndarray: The speech probability of each window, shape (n,).
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # The engine was used on another loop before, e.g. warmed up
+            # before the server started
+            self._loop = loop
+            self._pending = []
+            self._wakeup = asyncio.Event()
+            self._task = None
+
+        future = loop.create_future()
+        self._pending.append(_Request(session, windows, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        self._wakeup.set()
+        return await future
+
+    async def _run(self) -> None:
+        """Collect pending requests for one time slot and run them as a batch."""
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            # Give the other sessions a moment to submit their windows
+            await asyncio.sleep(self.batch_window_ms / 1000)
+
+            requests = self._take_batch()
+            if not requests:
+                continue
+            try:
+                # Inference runs on the VAD thread so it doesn't block the event loop
+                results = await asyncio.get_running_loop().run_in_executor(
+                    self.engine.executor, self._infer_batch, requests
+                )
+            except Exception as e:
+                logger.error(f"Error in batched VAD inference: {e}")
+                for request in requests:
+                    if not request.future.done():
+                        request.future.set_exception(e)
+                continue
+
+            for request, probs in zip(requests, results):
+                if not request.future.done():
+                    request.future.set_result(probs)
+
+    def _take_batch(self) -> list[_Request]:
+        """Take up to max_batch_size pending requests, at most one per session."""
+        batch: list[_Request] = []
+        deferred: list[_Request] = []
+        sessions = set()
+        for request in self._pending:
+            if request.future.done():
+                continue  # the caller was cancelled
+            if len(batch) >= self.max_batch_size or id(request.session) in sessions:
+                deferred.append(request)
+            else:
+                sessions.add(id(request.session))
+                batch.append(request)
+
+        self._pending = deferred
+        if deferred:
+            self._wakeup.set()
+        return batch
+
+    def _infer_batch(self, requests: list[_Request]) -> list[np.ndarray]:
+        """
+        Run the windows of all requests through the model, one time step per
+        forward pass, and update the recurrent state of each session.
+        """
+        results = [
+            np.empty(len(request.windows), dtype=np.float32) for request in requests
+        ]
+        num_steps = max(len(request.windows) for request in requests)
+        for step in range(num_steps):
+            active = [
+                i for i, request in enumerate(requests) if step < len(request.windows)
+            ]
+            windows = np.stack([requests[i].windows[step] for i in active])
+            model_states = [requests[i].session.model_state for i in active]
+
+            probs, model_states = self.engine.speech_probs(windows, model_states)
+
+            for i, prob, model_state in zip(active, probs, model_states):
+                results[i][step] = prob
+                requests[i].session.model_state = model_state
+
+            self.forward_passes += 1
+            self.windows_processed += len(active)
+        return results
@@ -1,14 +1,15 @@
 import asyncio
+import threading
 from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 import numpy as np
-import torch
 from loguru import logger
 from pydantic import BaseModel
-from silero_vad import load_silero_vad
 
-from .vad_interface import VADInterface
+from .vad_interface import VADInterface, VADSessionInterface
+from .batch_scheduler import VADBatchScheduler
 
 
 class SileroVADConfig(BaseModel):
@@ -22,6 +23,18 @@ class SileroVADConfig(BaseModel):
 
 
 class VADEngine(VADInterface):
+    """
+    Silero VAD engine.
+
+    The model is loaded once and shared by all clients. Everything that
+    changes while audio is processed (the state machine, its smoothing
+    windows and the recurrent state of the model) lives in a `VADSession`
+    created per client with `create_session()`.
+    """
+
+    # Size of the recurrent state of the silero model for one stream
+    MODEL_STATE_SHAPE = (2, 1, 128)
+
     def __init__(
         self,
         orig_sr: int = 16000,
@@ -42,37 +55,204 @@ class VADEngine(VADInterface):
             smoothing_window=smoothing_window,
         )
         self.model = self.load_vad_model()
-        self.state = StateMachine(self.config)
         self.window_size_samples = 512 if self.config.target_sr == 16000 else 256
         # 512 / 16000 = 0.032s
+        # audio from the previous window the model prepends to each window
+        self.context_size_samples = 64 if self.config.target_sr == 16000 else 32
+
+        # The model is shared, so the recurrent state of the sessions is
+        # loaded into it before each forward pass, under this lock.
+        self._model_lock = threading.Lock()
+        self.supports_batching = self.check_batching_support()
+        if not self.supports_batching:
+            logger.warning(
+                "Silero-VAD model does not expose its recurrent state. "
+                "Concurrent sessions will share it and batching is disabled."
+            )
+        # Thread running the model for the async path, off the event loop
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
+        # Batches windows of all sessions, created on first async use
+        self.scheduler: VADBatchScheduler | None = None
+        # Session used by detect_speech() for single-client callers
+        self._default_session: VADSession | None = None
 
     def load_vad_model(self):
+        # Imported here so that the ONNX backend (silero_onnx.py) never loads torch
+        from silero_vad import load_silero_vad
+
         logger.info("Loading Silero-VAD model...")
         return load_silero_vad()
 
-    def detect_speech(self, audio_data: list[float]):
-        audio_np = np.array(audio_data, dtype=np.float32)
-        for i in range(0, len(audio_np), self.window_size_samples):
-            chunk_np = audio_np[i : i + self.window_size_samples]
-            if len(chunk_np) < self.window_size_samples:
-                break
-            chunk = torch.Tensor(chunk_np)
-
-            with torch.no_grad():
-                speech_prob = self.model(chunk, self.config.target_sr).item()
-
-            if speech_prob:
-                # print(speech_prob)
-                iter = self.state.get_result(speech_prob, chunk_np)
-
-                for probs, dbs, chunk in iter:  # detected a sequence of voice bytes
-                    # rounded_probs = [round(x, 2) for x in probs]
-                    # rounded_dbs = [round(y, 2) for y in dbs]
-
-                    audio_chunk = bytes(chunk)
-                    yield audio_chunk
+    def check_batching_support(self) -> bool:
+        """Whether the recurrent state of the model can be set per stream."""
+        return all(
+            hasattr(self.model, attr)
+            for attr in ("_state", "_context", "_last_sr", "_last_batch_size")
+        )
 
-        del audio_np
+    def create_session(self) -> "VADSession":
+        return VADSession(self)
+
+    def detect_speech(self, audio_data: list[float] | np.ndarray):
+        if self._default_session is None:
+            self._default_session = self.create_session()
+        yield from self._default_session.detect_speech(audio_data)
+
+    def get_scheduler(self) -> "VADBatchScheduler":
+        """Return the scheduler batching the windows of all sessions."""
+        if self.scheduler is None:
+            self.scheduler = VADBatchScheduler(self)
+        return self.scheduler
+
+    def speech_probs(
+        self, windows: np.ndarray, model_states: list[dict | None]
+    ) -> tuple[np.ndarray, list[dict | None]]:
+        """
+        Run one forward pass over one window from each of several streams.
+
+        Args:
+            windows: Array of shape (batch, window_size_samples), one row per stream.
+            model_states: The recurrent state of each stream, as returned by
+                the previous call for that stream, or None for a fresh state.
+
+        Returns:
+            tuple[np.ndarray, list[dict | None]]: The speech probability of
+            each window and the new recurrent state of each stream.
+        """
+        with self._model_lock:
+            return self.run_model(windows, model_states)
+
+    def speech_prob(
+        self, chunk_np: np.ndarray, model_state: dict | None
+    ) -> tuple[float, dict | None]:
+        """Run the model on a single window of one stream. See `speech_probs`."""
+        probs, model_states = self.speech_probs(chunk_np[np.newaxis], [model_state])
+        return float(probs[0]), model_states[0]
+
+    def run_model(
+        self, windows: np.ndarray, model_states: list[dict | None]
+    ) -> tuple[np.ndarray, list[dict | None]]:
+        """Backend-specific forward pass of `speech_probs`, called under the model lock."""
+        import torch
+
+        batch_size = len(windows)
+        if self.supports_batching:
+            self._load_model_states(model_states)
+
+        with torch.no_grad():
+            out = self.model(torch.Tensor(windows), self.config.target_sr)
+        probs = out.numpy().reshape(batch_size)
+
+        if self.supports_batching:
+            model_states = self._split_model_states(batch_size)
+        return probs, model_states
+
+    def _load_model_states(self, model_states: list[dict | None]) -> None:
+        """Stack the recurrent states of the streams into the model."""
+        import torch
+
+        states = []
+        contexts = []
+        for model_state in model_states:
+            if model_state is None:
+                states.append(torch.zeros(self.MODEL_STATE_SHAPE))
+                contexts.append(torch.zeros(1, self.context_size_samples))
+            else:
+                states.append(model_state["state"])
+                contexts.append(model_state["context"])
+        self.model._state = torch.cat(states, dim=1)
+        self.model._context = torch.cat(contexts, dim=0)
+        # matching sr and batch size keep the model from resetting the state
+        self.model._last_sr = self.config.target_sr
+        self.model._last_batch_size = len(model_states)
+
+    def _split_model_states(self, batch_size: int) -> list[dict]:
+        """Split the recurrent state of the model back into one per stream."""
+        state = self.model._state
+        context = self.model._context
+        return [
+            {
+                "state": state[:, i : i + 1].clone(),
+                "context": context[i : i + 1].clone(),
+            }
+            for i in range(batch_size)
+        ]
+
+
+class VADSession(VADSessionInterface):
+    """Voice activity detection state of one client."""
+
+    def __init__(self, engine: VADEngine):
+        self.engine = engine
+        self.state = StateMachine(engine.config)
+        self.model_state: dict | None = None
+        # Samples after the last whole window of the previous chunk. Resampled
+        # chunks are rarely a multiple of the window size.
+        self._leftover = np.empty(0, dtype=np.float32)
+
+    def detect_speech(self, audio_data: list[float] | np.ndarray):
+        windows = self._split_windows(audio_data)
+        yield from self._process_probs(windows, self._speech_probs(windows))
+
+    async def async_detect_speech(self, audio_data: list[float] | np.ndarray):
+        """
+        Detect speech with the windows batched together with other sessions.
+
+        Returns:
+            list[bytes]: The control markers and voice segments detected.
+        """
+        windows = self._split_windows(audio_data)
+        if not len(windows):
+            return []
+        if self.engine.supports_batching:
+            probs = await self.engine.get_scheduler().infer(self, windows)
+        else:
+            probs = await asyncio.get_running_loop().run_in_executor(
+                self.engine.executor, self._speech_probs, windows
+            )
+        return list(self._process_probs(windows, probs))
+
+    def _speech_probs(self, windows: np.ndarray) -> np.ndarray:
+        """Run the windows through the model one at a time."""
+        probs = np.empty(len(windows), dtype=np.float32)
+        for i, chunk_np in enumerate(windows):
+            probs[i], self.model_state = self.engine.speech_prob(
+                chunk_np, self.model_state
+            )
+        return probs
+
+    def _split_windows(self, audio_data: list[float] | np.ndarray) -> np.ndarray:
+        """
+        View the audio as (n, window_size_samples), after the samples left
+        over from the previous chunk. A trailing partial window is kept for
+        the next chunk.
+        """
+        window_size_samples = self.engine.window_size_samples
+        audio_np = np.asarray(audio_data, dtype=np.float32)
+        if len(self._leftover):
+            audio_np = np.concatenate((self._leftover, audio_np))
+        num_windows = len(audio_np) // window_size_samples
+        end = num_windows * window_size_samples
+        self._leftover = audio_np[end:].copy()
+        return audio_np[:end].reshape(num_windows, window_size_samples)
+
+    def _process_probs(self, windows: np.ndarray, speech_probs: np.ndarray):
+        """Feed the speech probability of each window to the state machine."""
+        speech_probs = np.asarray(speech_probs, dtype=np.float64)
+        # Windows the model gives a probability of exactly 0 are skipped
+        voiced = speech_probs != 0
+        if not voiced.all():
+            windows = windows[voiced]
+            speech_probs = speech_probs[voiced]
+
+        for probs, dbs, chunk in self.state.process_batch(speech_probs, windows):
+            # detected a sequence of voice bytes
+            yield bytes(chunk)
+
+    def close(self) -> None:
+        self.model_state = None
+        self.state = StateMachine(self.engine.config)
+        self._leftover = np.empty(0, dtype=np.float32)
 
 
 # Define state enumeration
@@ -82,6 +262,11 @@ class State(Enum):
     INACTIVE = 3  # Speech end state (silence state)
 
 
+# Type numpy gives `np.float32 scalar + float`, and so the type calculate_db
+# computes the level of a float32 window in: float64 on NumPy 1.x, float32 on 2.x
+_DB_DTYPE = (np.float32(1) + 1e-7).dtype
+
+
 class StateMachine:
     def __init__(self, config: SileroVADConfig):
         self.state = State.IDLE
@@ -102,6 +287,11 @@ class StateMachine:
 
         self.pre_buffer = deque(maxlen=20)
 
+        # Scratch buffers of process_batch, grown to the largest batch seen
+        self._scaled = np.empty((0, 0), dtype=np.float32)
+        self._squared = np.empty((0, 0), dtype=np.float32)
+        self._pcm = np.empty((0, 0), dtype=np.int16)
+
     @classmethod
     def calculate_db(cls, audio_data: np.ndarray) -> float:
         rms = np.sqrt(np.mean(np.square(audio_data)))
@@ -131,9 +321,95 @@ class StateMachine:
 
         # Obtain the smoothed prob and db
         smoothed_prob, smoothed_db = self.get_smoothed_values(prob, db)
-
+        yield from self._step(chunk_bytes, smoothed_prob, smoothed_db)
+
+    def process_batch(self, probs: np.ndarray, float_chunks: np.ndarray):
+        """
+        Process consecutive windows at once.
+
+        Gives exactly the same results as calling `process` on each window in
+        turn, but the int16 conversion, the level in dB and the smoothed
+        values of all windows are computed with a few vectorized operations
+        in reused buffers instead of several temporary arrays per window.
+
+        Args:
+            probs: Speech probability of each window, shape (n,).
+            float_chunks: float32 audio of each window, shape (n, window_size).
+        """
+        num_windows = len(float_chunks)
+        if not num_windows:
+            return
+        self._reserve(float_chunks.shape)
+
+        scaled = np.multiply(float_chunks, 32767, out=self._scaled[:num_windows])
+        pcm = self._pcm[:num_windows]
+        np.copyto(pcm, scaled, casting="unsafe")  # same as astype(np.int16)
+
+        # calculate_db for every window
+        squared = np.square(scaled, out=self._squared[:num_windows])
+        rms = np.sqrt(np.mean(squared, axis=1))
+        dbs = 20 * np.log10(rms.astype(_DB_DTYPE) + 1e-7)
+        dbs[~(rms > 0)] = -np.inf
+
+        smoothed_probs = self._smooth(
+            self.prob_window, np.asarray(probs, dtype=np.float64)
+        )
+        smoothed_dbs = self._smooth(self.db_window, dbs)
+
+        # Bytes of each window, without copying them out of the buffer
+        pcm_bytes = memoryview(pcm.reshape(-1).view(np.uint8))
+        chunk_size = pcm.shape[1] * pcm.itemsize
+        for i in range(num_windows):
+            yield from self._step(
+                pcm_bytes[i * chunk_size : (i + 1) * chunk_size],
+                smoothed_probs[i],
+                smoothed_dbs[i],
+            )
+
+    def _reserve(self, shape: tuple[int, int]) -> None:
+        """Make the scratch buffers hold at least `shape` windows."""
+        num_windows, window_size = shape
+        if (
+            self._scaled.shape[0] >= num_windows
+            and self._scaled.shape[1] == window_size
+        ):
+            return
+        self._scaled = np.empty(shape, dtype=np.float32)
+        self._squared = np.empty(shape, dtype=np.float32)
+        self._pcm = np.empty(shape, dtype=np.int16)
+
+    @staticmethod
+    def _smooth(window: deque, values: np.ndarray) -> np.ndarray:
+        """
+        Push `values` through a smoothing window and return the mean after
+        each push, like `get_smoothed_values` does one value at a time.
+
+        The means are taken over the same elements in the same order as
+        np.mean over the deque, rather than kept as running sums, so they
+        are bit-identical and the state machine takes the same transitions.
+        """
+        size = window.maxlen
+        history = list(window)[len(window) - size + 1 :] if size > 1 else []
+        series = np.concatenate((np.asarray(history, dtype=values.dtype), values))
+
+        # Means over fewer values while the window is filling up
+        num_partial = min(size - 1 - len(history), len(values))
+        smoothed = np.empty(len(values), dtype=values.dtype)
+        for i in range(num_partial):
+            smoothed[i] = np.mean(series[: len(history) + i + 1])
+        if num_partial < len(values):
+            full_windows = np.lib.stride_tricks.sliding_window_view(series, size)
+            smoothed[num_partial:] = np.mean(
+                full_windows[len(history) + num_partial - size + 1 :], axis=1
+            )
+
+        window.extend(values)
+        return smoothed
+
+    def _step(self, chunk_bytes, smoothed_prob, smoothed_db):
+        """Advance the state machine by one window."""
         if self.state == State.IDLE:
-            self.pre_buffer.append(chunk_bytes)
+            self.pre_buffer.append(bytes(chunk_bytes))
             if (
                 smoothed_prob >= self.prob_threshold
                 and smoothed_db >= self.db_threshold
@@ -19,3 +19,7 @@ class VADFactory:
                 kwargs.get("required_misses"),
                 kwargs.get("smoothing_window"),
             )
+        elif engine_type == "silero_vad_onnx":
+            from .silero_onnx import VADEngine as SileroOnnxVADEngine
+
+            return SileroOnnxVADEngine(**kwargs)
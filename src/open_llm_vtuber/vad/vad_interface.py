@@ -1,6 +1,46 @@
+import asyncio
 from abc import ABC, abstractmethod
 
 
+class VADSessionInterface(ABC):
+    """Per-client voice activity detection state."""
+
+    @abstractmethod
+    def detect_speech(self, audio_data: bytes):
+        """
+        Detect if there is voice activity in the audio data of this client.
+        :param audio_data: Input audio data
+        :return: Returns a sequence of audio bytes containing human voice if voice activity is detected
+        """
+        pass
+
+    async def async_detect_speech(self, audio_data: bytes) -> list[bytes]:
+        """
+        Asynchronously detect voice activity in the audio data of this client.
+
+        By default, this runs detect_speech in a worker thread. Sessions can
+        override this to batch the model inference with other sessions.
+
+        :param audio_data: Input audio data
+        :return: The list of audio bytes (and control markers) detect_speech would yield
+        """
+        return await asyncio.to_thread(lambda: list(self.detect_speech(audio_data)))
+
+    def close(self) -> None:
+        """Release the resources held by this session."""
+        pass
+
+
+class _SharedVADSession(VADSessionInterface):
+    """Session for engines without per-client state. Delegates to the engine."""
+
+    def __init__(self, engine: "VADInterface"):
+        self.engine = engine
+
+    def detect_speech(self, audio_data: bytes):
+        return self.engine.detect_speech(audio_data)
+
+
 class VADInterface(ABC):
     @abstractmethod
     def detect_speech(self, audio_data: bytes):
@@ -10,3 +50,14 @@ class VADInterface(ABC):
         :return: Returns a sequence of audio bytes containing human voice if voice activity is detected
         """
         pass
+
+    def create_session(self) -> VADSessionInterface:
+        """
+        Create the detection state for one client.
+
+        The engine (and its model) is shared by every client, so engines that
+        keep state between calls should override this and return a session
+        holding that state. Otherwise the audio of concurrent clients would
+        be mixed together. The default session just calls `detect_speech`.
+        """
+        return _SharedVADSession(self)
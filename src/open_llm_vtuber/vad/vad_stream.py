@@ -0,0 +1,133 @@
+import asyncio
+import time
+from collections import deque
+from typing import Callable
+
+import numpy as np
+from loguru import logger
+
+from .vad_interface import VADSessionInterface
+
+
+class VADStream:
+    """
+    Asynchronous VAD front-end for one client.
+
+    The WebSocket handler hands audio chunks to `feed()`, which never blocks.
+    A background task runs the chunks through the client's VAD session in
+    the order they arrived (the model itself runs on the VAD thread, not on
+    the event loop) and puts everything the session detects - the
+    `<|PAUSE|>` / `<|RESUME|>` markers and the speech segments - on the
+    `events` queue.
+
+    If the client sends audio faster than VAD can keep up, at most
+    `max_pending_chunks` chunks wait in line. Further chunks are dropped and
+    counted in `dropped_chunks`.
+
+    `on_speech_audio`, if given, is called with each chunk while the session
+    detects speech (between `<|PAUSE|>` and `<|RESUME|>`), so the speech can
+    be recognized before the whole segment is detected. It is called with
+    `started=True` on the first chunk of each segment, which is preceded by
+    the last `pre_roll_chunks` chunks: speech is only detected after its
+    first few windows.
+    """
+
+    def __init__(
+        self,
+        session: VADSessionInterface,
+        max_pending_chunks: int = 32,
+        on_speech_audio: Callable[[np.ndarray, bool], None] | None = None,
+        pre_roll_chunks: int = 2,
+    ):
+        self.session = session
+        self.on_speech_audio = on_speech_audio
+        self.events: asyncio.Queue[bytes] = asyncio.Queue()
+        self._pre_roll: deque[np.ndarray] = deque(maxlen=pre_roll_chunks)
+        self._in_speech = False
+        self._chunks: asyncio.Queue[np.ndarray] = asyncio.Queue(
+            maxsize=max_pending_chunks
+        )
+        self._task: asyncio.Task | None = None
+
+        # Metrics
+        self.processed_chunks = 0
+        self.dropped_chunks = 0
+        self.max_queue_depth = 0
+        self.processing_time = 0.0
+
+    def feed(self, audio_data: list[float] | np.ndarray) -> bool:
+        """
+        Queue a chunk of audio for voice activity detection.
+
+        Returns:
+            bool: False if the chunk was dropped because the queue is full.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            self._chunks.put_nowait(audio_data)
+        except asyncio.QueueFull:
+            self.dropped_chunks += 1
+            # Log the first drop and then every 50th to avoid flooding the log
+            if self.dropped_chunks % 50 == 1:
+                logger.warning(
+                    f"VAD cannot keep up with the client, dropped {self.dropped_chunks} audio chunks so far"
+                )
+            return False
+
+        self.max_queue_depth = max(self.max_queue_depth, self._chunks.qsize())
+        return True
+
+    async def _run(self) -> None:
+        """Process queued chunks in order and publish the detection results."""
+        while True:
+            chunk = await self._chunks.get()
+            start = time.perf_counter()
+            try:
+                results = await self.session.async_detect_speech(chunk)
+            except Exception as e:
+                logger.error(f"Error in voice activity detection: {e}")
+                continue
+            finally:
+                self.processing_time += time.perf_counter() - start
+                self.processed_chunks += 1
+
+            if self.on_speech_audio is not None:
+                self._forward_speech(chunk, results)
+
+            for audio_bytes in results:
+                await self.events.put(audio_bytes)
+
+    def _forward_speech(self, chunk: np.ndarray, results: list[bytes]) -> None:
+        """Pass the chunk to on_speech_audio if it is part of a speech segment."""
+        chunk = np.asarray(chunk, dtype=np.float32)
+        try:
+            if b"<|PAUSE|>" in results:
+                self.on_speech_audio(np.concatenate([*self._pre_roll, chunk]), True)
+                self._in_speech = True
+            elif self._in_speech:
+                self.on_speech_audio(chunk, False)
+        except Exception as e:
+            logger.error(f"Error forwarding speech audio: {e}")
+        if b"<|RESUME|>" in results:
+            self._in_speech = False
+            self._pre_roll.clear()
+        self._pre_roll.append(chunk)
+
+    async def close(self) -> None:
+        """Stop processing. Queued chunks are discarded."""
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+        if self.processed_chunks or self.dropped_chunks:
+            logger.debug(
+                f"VAD stream closed: {self.processed_chunks} chunks processed "
+                f"({self.processing_time / max(self.processed_chunks, 1) * 1000:.1f} ms avg), "
+                f"{self.dropped_chunks} dropped, max queue depth {self.max_queue_depth}"
+            )
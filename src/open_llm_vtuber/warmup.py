@@ -0,0 +1,155 @@
+import time
+import asyncio
+import weakref
+
+import numpy as np
+from loguru import logger
+
+from .asr.asr_interface import ASRInterface
+from .asr.asr_replica_pool import ASRReplicaPool
+from .vad.vad_interface import VADInterface
+from .tts.tts_interface import TTSInterface
+from .tts.tts_cache import TTSCache
+from .tts.tts_worker_pool import TTSWorkerPool
+from .utils.stream_audio import encode_audio
+from .config_manager import WarmupConfig
+
+# Engines already warmed up. They are shared by the service contexts of all
+# clients, and only new ones (e.g. after a config switch) need warming up.
+_warmed_up: weakref.WeakSet = weakref.WeakSet()
+
+# Half a second of silence at 16 kHz, as clients send it
+_SILENCE = np.zeros(8000, dtype=np.float32)
+
+# Engines that call a remote API: warming them up sends a request, which most
+# providers bill, so they are only warmed up with `remote_engines`
+REMOTE_ASR_MODELS = {"azure_asr", "groq_whisper_asr"}
+REMOTE_TTS_MODELS = {
+    "azure_tts",
+    "edge_tts",
+    "fish_api_tts",
+    "siliconflow_tts",
+    "openai_tts",
+    "minimax_tts",
+    "elevenlabs_tts",
+    "cartesia_tts",
+}
+
+
+async def warm_up(
+    config: WarmupConfig,
+    asr_engine: ASRInterface | None,
+    vad_engine: VADInterface | None,
+    tts_engine: TTSInterface | None,
+    tts_cache: TTSCache | None,
+    asr_model: str | None = None,
+    tts_model: str | None = None,
+) -> dict[str, float]:
+    """
+    Run one dummy inference through each engine that was not warmed up yet,
+    and synthesize the configured phrases into the TTS cache.
+
+    The first inference of most engines is much slower than the next ones
+    (ONNX session initialization, lazily loaded weights, JIT compilation,
+    connection setup), so without this the first visitor pays for it.
+    Engines that call a remote API (see `asr_model` and `tts_model`) are
+    skipped unless `config.remote_engines` is set, and so is the TTS engine
+    when `config.tts_text` is empty. The TTS worker pool only runs local
+    engines. Failures are logged and do not stop the server from starting.
+
+    Returns:
+        dict[str, float]: Seconds each step took, by name.
+    """
+    timings: dict[str, float] = {}
+    if not config.enabled:
+        return timings
+
+    if not config.remote_engines:
+        if asr_model in REMOTE_ASR_MODELS:
+            asr_engine = None
+        if tts_model in REMOTE_TTS_MODELS and not isinstance(tts_engine, TTSWorkerPool):
+            tts_engine = None
+
+    if asr_engine is not None and asr_engine not in _warmed_up:
+        await _timed("asr", timings, _warm_up_asr(asr_engine))
+        _warmed_up.add(asr_engine)
+
+    if vad_engine is not None and vad_engine not in _warmed_up:
+        await _timed("vad", timings, _warm_up_vad(vad_engine))
+        _warmed_up.add(vad_engine)
+
+    if tts_engine is not None and config.tts_text and tts_engine not in _warmed_up:
+        await _timed("tts", timings, _warm_up_tts(tts_engine, config.tts_text))
+        _warmed_up.add(tts_engine)
+
+    if tts_engine is not None and tts_cache is not None and config.phrases:
+        await _timed(
+            "tts_phrases",
+            timings,
+            _precompute_phrases(tts_engine, tts_cache, config.phrases),
+        )
+
+    if timings:
+        logger.info(
+            "Warm-up done: "
+            + ", ".join(f"{name} {seconds:.2f}s" for name, seconds in timings.items())
+        )
+    return timings
+
+
+async def _timed(name: str, timings: dict[str, float], coroutine) -> None:
+    start = time.perf_counter()
+    try:
+        await coroutine
+    except Exception as e:
+        logger.warning(f"Warm-up of {name} failed: {e}")
+    timings[name] = time.perf_counter() - start
+
+
+async def _warm_up_asr(asr_engine: ASRInterface) -> None:
+    # Each replica leased at once is a different one, with its own session
+    count = asr_engine.num_replicas if isinstance(asr_engine, ASRReplicaPool) else 1
+    await asyncio.gather(
+        *(asr_engine.async_transcribe_np(_SILENCE) for _ in range(count))
+    )
+
+
+async def _warm_up_vad(vad_engine: VADInterface) -> None:
+    # A session of its own, so no client's detection state is touched
+    session = vad_engine.create_session()
+    try:
+        await session.async_detect_speech(_SILENCE)
+    finally:
+        session.close()
+
+
+async def _warm_up_tts(tts_engine: TTSInterface, text: str) -> None:
+    # Every worker process loads its own copy of the model
+    count = tts_engine.num_workers if isinstance(tts_engine, TTSWorkerPool) else 1
+    results = await asyncio.gather(
+        *(tts_engine.async_generate_audio_bytes(text) for _ in range(count))
+    )
+    if any(audio is None for audio in results):
+        raise ValueError("TTS engine returned no audio")
+
+
+async def _precompute_phrases(
+    tts_engine: TTSInterface, tts_cache: TTSCache, phrases: list[str]
+) -> None:
+    """Synthesize the phrases that are not cached yet into the TTS cache."""
+    missing = [phrase for phrase in phrases if not tts_cache.contains(phrase)]
+    synthesized = 0
+    for phrase in missing:
+        start = time.perf_counter()
+        audio = await tts_engine.async_generate_audio_bytes(phrase)
+        if audio is None:
+            logger.warning(f"Failed to synthesize warm-up phrase '{phrase}'")
+            continue
+        encoded_audio = encode_audio(audio_bytes=audio.to_bytes())
+        await tts_cache.put(phrase, encoded_audio, time.perf_counter() - start)
+        synthesized += 1
+    logger.info(
+        f"Warm-up phrases: {synthesized} synthesized, "
+        f"{len(missing) - synthesized} failed, "
+        f"{len(phrases) - len(missing)} already cached"
+    )
@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Callable, TypedDict
+from typing import Dict, List, Optional, Callable, TypedDict, Union
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
 import json
@@ -15,6 +15,13 @@ from .chat_group import (
 )
 from .message_handler import message_handler
 from .utils.stream_audio import prepare_audio_payload
+from .utils.binary_audio import InvalidAudioFrameError, decode_audio_frame
+from .utils.audio_buffer import AudioBuffer
+from .utils.audio_ingest import AudioIngest
+from .asr.asr_interface import ASRInterface
+from .asr.streaming_transcription import StreamingTranscription
+from .conversations.speculation import LLMSpeculation, SpeculationStats
+from .vad.vad_stream import VADStream
 from .chat_history_manager import (
     create_new_history,
     get_history,
@@ -51,7 +58,9 @@ class WSMessage(TypedDict, total=False):
     type: str
     action: Optional[str]
     text: Optional[str]
-    audio: Optional[List[float]]
+    audio: Optional[Union[List[float], np.ndarray]]
+    sample_rate: Optional[int]
+    sequence: Optional[int]
     images: Optional[List[str]]
     history_uid: Optional[str]
     file: Optional[str]
@@ -68,7 +77,13 @@ class WebSocketHandler:
         self.chat_group_manager = ChatGroupManager()
         self.current_conversation_tasks: Dict[str, Optional[asyncio.Task]] = {}
         self.default_context_cache = default_context_cache
-        self.received_data_buffers: Dict[str, np.ndarray] = {}
+        self.received_data_buffers: Dict[str, AudioBuffer] = {}
+        self.audio_ingests: Dict[str, AudioIngest] = {}
+        self.vad_streams: Dict[str, VADStream] = {}
+        self.vad_event_tasks: Dict[str, asyncio.Task] = {}
+        self.transcriptions: Dict[str, StreamingTranscription] = {}
+        self.speculations: Dict[str, LLMSpeculation] = {}
+        self.speculation_stats = SpeculationStats()
 
         # Message handlers mapping
         self._message_handlers = self._init_message_handlers()
@@ -141,7 +156,8 @@ class WebSocketHandler:
         """Store client data and initialize group status"""
         self.client_connections[client_uid] = websocket
         self.client_contexts[client_uid] = session_service_context
-        self.received_data_buffers[client_uid] = np.array([])
+        self.received_data_buffers[client_uid] = AudioBuffer()
+        self.audio_ingests[client_uid] = AudioIngest(ASRInterface.SAMPLE_RATE)
 
         self.chat_group_manager.client_group_map[client_uid] = ""
         await self.send_group_update(websocket, client_uid)
@@ -191,6 +207,8 @@ class WebSocketHandler:
             live2d_model=self.default_context_cache.live2d_model,
             asr_engine=self.default_context_cache.asr_engine,
             tts_engine=self.default_context_cache.tts_engine,
+            tts_cache=self.default_context_cache.tts_cache,
+            tts_scheduler=self.default_context_cache.tts_scheduler,
             vad_engine=self.default_context_cache.vad_engine,
             agent_engine=self.default_context_cache.agent_engine,
             translate_engine=self.default_context_cache.translate_engine,
@@ -214,7 +232,7 @@ class WebSocketHandler:
         try:
             while True:
                 try:
-                    data = await websocket.receive_json()
+                    data = await self._receive_message(websocket)
                     message_handler.handle_message(client_uid, data)
                     await self._route_message(websocket, client_uid, data)
                 except WebSocketDisconnect:
@@ -222,6 +240,9 @@ class WebSocketHandler:
                 except json.JSONDecodeError:
                     logger.error("Invalid JSON received")
                     continue
+                except InvalidAudioFrameError as e:
+                    logger.error(f"Invalid binary frame received: {e}")
+                    continue
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
                     await websocket.send_text(
@@ -236,6 +257,27 @@ class WebSocketHandler:
             logger.error(f"Fatal error in WebSocket communication: {e}")
             raise
 
+    async def _receive_message(self, websocket: WebSocket) -> WSMessage:
+        """
+        Receive the next message from the client.
+
+        Text frames are parsed as JSON. Binary frames are decoded as audio
+        frames (see `utils.binary_audio`) and returned in the same shape as the
+        JSON audio messages, with `audio` as a float32 numpy array.
+
+        Raises:
+            WebSocketDisconnect: If the client disconnected
+            json.JSONDecodeError: If a text frame is not valid JSON
+            InvalidAudioFrameError: If a binary frame is malformed
+        """
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+
+        if message.get("bytes") is not None:
+            return decode_audio_frame(message["bytes"]).to_message()
+        return json.loads(message["text"])
+
     async def _route_message(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
@@ -298,17 +340,24 @@ class WebSocketHandler:
         )
 
         # Clean up other client data
+        await self._close_vad_stream(client_uid)
+        self._cancel_transcription(client_uid)
         self.client_connections.pop(client_uid, None)
-        self.client_contexts.pop(client_uid, None)
-        self.received_data_buffers.pop(client_uid, None)
+        context = self.client_contexts.pop(client_uid, None)
+        self.audio_ingests.pop(client_uid, None)
+        audio_buffer = self.received_data_buffers.pop(client_uid, None)
+        if audio_buffer is not None:
+            logger.debug(
+                f"Audio buffer high-water mark for {client_uid}: "
+                f"{audio_buffer.high_water_mark / 1024:.1f} KiB"
+            )
         if client_uid in self.current_conversation_tasks:
             task = self.current_conversation_tasks[client_uid]
             if task and not task.done():
                 task.cancel()
             self.current_conversation_tasks.pop(client_uid, None)
 
-        # Call context close to clean up resources (e.g., MCPClient)
-        context = self.client_contexts.get(client_uid)
+        # Call context close to clean up resources (e.g., MCPClient, VAD session)
         if context:
             await context.close()
 
@@ -317,9 +366,12 @@ class WebSocketHandler:
 
     async def _cleanup_failed_connection(self, client_uid: str) -> None:
         """Clean up failed connection data"""
+        await self._close_vad_stream(client_uid)
+        self._cancel_transcription(client_uid)
         self.client_connections.pop(client_uid, None)
         self.client_contexts.pop(client_uid, None)
         self.received_data_buffers.pop(client_uid, None)
+        self.audio_ingests.pop(client_uid, None)
         self.chat_group_manager.client_group_map.pop(client_uid, None)
 
         if client_uid in self.current_conversation_tasks:
@@ -479,21 +531,143 @@ class WebSocketHandler:
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
         """Handle incoming audio data"""
-        audio_data = data.get("audio", [])
-        if audio_data:
-            self.received_data_buffers[client_uid] = np.append(
-                self.received_data_buffers[client_uid],
-                np.array(audio_data, dtype=np.float32),
+        audio_data = data.get("audio")
+        if audio_data is not None and len(audio_data):
+            audio_data = self.audio_ingests[client_uid].process(
+                "mic-audio-data",
+                audio_data,
+                data.get("sample_rate") or ASRInterface.SAMPLE_RATE,
             )
+            self.received_data_buffers[client_uid].append(audio_data)
+            transcription = self.transcriptions.get(client_uid)
+            if transcription is None:
+                transcription = self._start_transcription(websocket, client_uid)
+            if transcription is not None:
+                transcription.feed(audio_data)
+
+    def _start_transcription(
+        self, websocket: WebSocket, client_uid: str
+    ) -> Optional[StreamingTranscription]:
+        """
+        Start recognizing a new utterance of a client while it is spoken,
+        if its ASR engine supports streaming. Replaces an unfinished one.
+        """
+        self._cancel_transcription(client_uid)
+        context = self.client_contexts[client_uid]
+        asr_engine = context.asr_engine
+        if not getattr(asr_engine, "supports_streaming", False):
+            return None
+        speculation = self._start_speculation(client_uid, context)
+
+        async def send_partial(text: str) -> None:
+            await websocket.send_text(
+                json.dumps({"type": "user-input-partial-transcription", "text": text})
+            )
+            if speculation:
+                await speculation.update(text)
+
+        transcription = StreamingTranscription(
+            asr_engine.create_stream(), on_partial=send_partial
+        )
+        self.transcriptions[client_uid] = transcription
+        return transcription
+
+    def _start_speculation(
+        self, client_uid: str, context: ServiceContext
+    ) -> Optional[LLMSpeculation]:
+        """
+        Prepare to start the reply to a new utterance on its partial
+        transcription, if enabled for the character and its agent allows it.
+        Not used in group conversations.
+        """
+        config = context.character_config.speculation
+        agent_engine = context.agent_engine
+        if not config.enabled or not getattr(
+            agent_engine, "supports_speculation", False
+        ):
+            return None
+        group = self.chat_group_manager.get_client_group(client_uid)
+        if group and len(group.members) > 1:
+            return None
+
+        def can_start() -> bool:
+            # Not while the previous reply is generated or played
+            task = self.current_conversation_tasks.get(client_uid)
+            return task is None or task.done()
+
+        speculation = LLMSpeculation(
+            agent_engine,
+            from_name=context.character_config.human_name,
+            stable_ms=config.stable_ms,
+            stats=self.speculation_stats,
+            can_start=can_start,
+        )
+        self.speculations[client_uid] = speculation
+        return speculation
+
+    def _cancel_transcription(self, client_uid: str) -> None:
+        """Drop the transcription in progress of a client, if any"""
+        transcription = self.transcriptions.pop(client_uid, None)
+        if transcription:
+            transcription.cancel()
+        speculation = self.speculations.pop(client_uid, None)
+        if speculation:
+            speculation.cancel()
 
     async def _handle_raw_audio_data(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
         """Handle incoming raw audio data for VAD processing"""
         context = self.client_contexts[client_uid]
-        chunk = data.get("audio", [])
-        if chunk:
-            for audio_bytes in context.vad_engine.detect_speech(chunk):
+        if not context.vad_session:
+            logger.warning("Received raw audio data but VAD is disabled")
+            return
+        chunk = data.get("audio")
+        if chunk is not None and len(chunk):
+            # Clients that don't declare a rate stream at the VAD's orig_sr
+            vad_config = getattr(context.vad_engine, "config", None)
+            sample_rate = data.get("sample_rate") or getattr(
+                vad_config, "orig_sr", ASRInterface.SAMPLE_RATE
+            )
+            chunk = self.audio_ingests[client_uid].process(
+                "raw-audio-data", chunk, sample_rate
+            )
+            if len(chunk):
+                vad_stream = await self._get_vad_stream(websocket, client_uid, context)
+                vad_stream.feed(chunk)
+
+    async def _get_vad_stream(
+        self, websocket: WebSocket, client_uid: str, context: ServiceContext
+    ) -> VADStream:
+        """Get the VAD stream of a client, (re)creating it for the current VAD session"""
+        vad_stream = self.vad_streams.get(client_uid)
+        if vad_stream and vad_stream.session is context.vad_session:
+            return vad_stream
+
+        # First audio of this client, or the VAD session changed with the config
+        await self._close_vad_stream(client_uid)
+
+        def on_speech_audio(chunk: np.ndarray, started: bool) -> None:
+            if started:
+                self._start_transcription(websocket, client_uid)
+            transcription = self.transcriptions.get(client_uid)
+            if transcription is not None:
+                transcription.feed(chunk)
+
+        vad_stream = VADStream(context.vad_session, on_speech_audio=on_speech_audio)
+        self.vad_streams[client_uid] = vad_stream
+        self.vad_event_tasks[client_uid] = asyncio.create_task(
+            self._forward_vad_events(websocket, client_uid, vad_stream)
+        )
+        return vad_stream
+
+    async def _forward_vad_events(
+        self, websocket: WebSocket, client_uid: str, vad_stream: VADStream
+    ) -> None:
+        """Act on the speech events detected by the VAD stream of a client"""
+        while True:
+            audio_bytes = await vad_stream.events.get()
+            try:
                 if audio_bytes == b"<|PAUSE|>":
                     await websocket.send_text(
                         json.dumps({"type": "control", "text": "interrupt"})
@@ -502,18 +676,35 @@ class WebSocketHandler:
                     pass
                 elif len(audio_bytes) > 1024:
                     # Detected audio activity (voice)
-                    self.received_data_buffers[client_uid] = np.append(
-                        self.received_data_buffers[client_uid],
-                        np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32),
+                    self.received_data_buffers[client_uid].append(
+                        np.frombuffer(audio_bytes, dtype=np.int16)
                     )
+                    transcription = self.transcriptions.get(client_uid)
+                    if transcription is not None:
+                        # Decode the rest while the client answers mic-audio-end
+                        transcription.finish()
                     await websocket.send_text(
                         json.dumps({"type": "control", "text": "mic-audio-end"})
                     )
+            except Exception as e:
+                logger.error(f"Error forwarding VAD event to {client_uid}: {e}")
+
+    async def _close_vad_stream(self, client_uid: str) -> None:
+        """Stop the VAD stream of a client and the task forwarding its events"""
+        task = self.vad_event_tasks.pop(client_uid, None)
+        if task and not task.done():
+            task.cancel()
+        vad_stream = self.vad_streams.pop(client_uid, None)
+        if vad_stream:
+            await vad_stream.close()
 
     async def _handle_conversation_trigger(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
         """Handle triggers that start a conversation"""
+        if data.get("type") == "mic-audio-end":
+            # The next audio belongs to a new utterance
+            self.audio_ingests[client_uid].reset("mic-audio-data")
         await handle_conversation_trigger(
             msg_type=data.get("type", ""),
             data=data,
@@ -526,6 +717,8 @@ class WebSocketHandler:
             received_data_buffers=self.received_data_buffers,
             current_conversation_tasks=self.current_conversation_tasks,
             broadcast_to_group=self.broadcast_to_group,
+            transcriptions=self.transcriptions,
+            speculations=self.speculations,
         )
 
     async def _handle_fetch_configs(